@@ -2,11 +2,17 @@
 import pytest
 
 pytest_plugins = [
+    # Profiler, first to measure the import of the plugins below
+    'pytest_plugins.hook_profile',
     # Plugins
     'pytest_plugins.auto_vault',
+    'pytest_plugins.background_checkin',
+    'pytest_plugins.collection_pipeline',
+    'pytest_plugins.content_host_pool',
     'pytest_plugins.disable_rp_params',
     'pytest_plugins.external_logging',
     'pytest_plugins.fixture_markers',
+    'pytest_plugins.hammer_timing',
     'pytest_plugins.infra_dependent_markers',
     'pytest_plugins.issue_handlers',
     'pytest_plugins.logging_hooks',
@@ -20,6 +26,7 @@ pytest_plugins = [
     'pytest_plugins.factory_collection',
     'pytest_plugins.requirements.update_requirements',
     'pytest_plugins.sanity_plugin',
+    'pytest_plugins.satellite_versions',
     'pytest_plugins.video_cleanup',
     # Fixtures
     'pytest_fixtures.core.broker',
@@ -225,6 +225,29 @@ def module_repos_collection_with_setup(request, module_target_sat, module_org, m
     return _repos_collection
 
 
+@pytest.fixture(scope='module')
+def module_shared_repos_collection_with_setup(request, module_target_sat):
+    """Like module_repos_collection_with_setup, but the content is set up in an organization
+    and lifecycle environment shared with the other modules and workers using the same
+    repositories, when ``shared_function.content_cache`` is enabled.
+
+    Only for tests not modifying the content entities, use ``repos_collection.organization``
+    and ``repos_collection.setup_content_data`` instead of module_org and module_lce.
+    """
+    repos = getattr(request, 'param', [])
+    repo_distro, repos = _simplify_repos(request, repos)
+    _repos_collection = module_target_sat.cli_factory.RepositoryCollection(
+        distro=repo_distro,
+        repositories=[
+            getattr(module_target_sat.cli_factory, repo_name)(**repo_params)
+            for repo in repos
+            for repo_name, repo_params in repo.items()
+        ],
+    )
+    _repos_collection.setup_shared_content()
+    return _repos_collection
+
+
 @pytest.fixture(scope='module')
 def module_repos_collection_with_manifest(
     request, module_target_sat, module_entitlement_manifest_org, module_lce
@@ -1,10 +1,10 @@
 from contextlib import contextmanager
 
 from box import Box
-from broker import Broker
 import pytest
 
 from robottelo.config import settings
+from robottelo.host_helpers import checkin_queue
 from robottelo.hosts import ContentHostError, Satellite, lru_sat_ready_rhel
 
 
@@ -24,8 +24,7 @@ def _target_sat_imp(request, _default_sat, satellite_factory):
     if request.node.get_closest_marker(name='destructive'):
         new_sat = satellite_factory()
         yield new_sat
-        new_sat.teardown()
-        Broker(hosts=[new_sat]).checkin()
+        checkin_queue.checkin(new_sat)
     elif 'sanity' in request.config.option.markexpr:
         installer_sat = lru_sat_ready_rhel(settings.server.version.rhel_version)
         settings.set('server.hostname', installer_sat.hostname)
@@ -4,28 +4,36 @@ This module is to define pytest functions for content hosts
 The functions in this module are read in the pytest_plugins/fixture_markers.py module
 All functions in this module will be treated as fixtures that apply the contenthost mark
 """
+from contextlib import contextmanager
+
 from broker import Broker
 import pytest
 
+from pytest_plugins import content_host_pool
 from robottelo import constants
 from robottelo.config import settings
+from robottelo.host_helpers import checkin_queue, host_pool
+from robottelo.host_helpers.fan_out import fan_out
 from robottelo.hosts import ContentHost, Satellite
 
 
-def host_conf(request):
-    """A function that returns arguments for Broker host deployment"""
-    conf = params = {}
-    if hasattr(request, 'param'):
-        params = request.param
+def deploy_conf(params, config, node):
+    """Return the arguments for Broker host deployment of content host ``params``
+
+    :param dict params: the content host fixture params, e.g. its ``rhel_version``
+    :param config: the pytest config
+    :param node: the pytest node using the content host
+    """
+    conf = {}
     distro = params.get('distro', 'rhel')
     _rhelver = f"{distro}{params.get('rhel_version', settings.content_host.default_rhel_version)}"
     # check to see if no-containers is passed as an argument to pytest
     deploy_kwargs = {}
     if not any(
         [
-            request.config.getoption('no_containers'),
+            config.getoption('no_containers'),
             params.get('no_containers'),
-            request.node.get_closest_marker('no_containers'),
+            node.get_closest_marker('no_containers'),
         ]
     ):
         deploy_kwargs = settings.content_host.get(_rhelver).to_dict().get('container', {})
@@ -36,19 +44,42 @@ def host_conf(request):
     return conf
 
 
+def host_conf(request):
+    """A function that returns arguments for Broker host deployment"""
+    return deploy_conf(getattr(request, 'param', {}), request.config, request.node)
+
+
+@contextmanager
+def pooled_contenthost(request):
+    """Provide a content host, taken from the warm content host pool when it is enabled
+
+    The host is torn down and checked in by the background check-in queue.
+    """
+    conf = host_conf(request)
+    pool = request.config.stash.get(content_host_pool.pool_key, None)
+    if pool is None:
+        host = host_pool.provision(conf, ContentHost)
+    else:
+        host = pool.checkout(conf)
+    try:
+        yield host
+    finally:
+        checkin_queue.checkin(host)
+
+
 @pytest.fixture
 def rhel_contenthost(request):
     """A function-level fixture that provides a content host object parametrized"""
     # Request should be parametrized through pytest_fixtures.fixture_markers
     # unpack params dict
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with pooled_contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': '7'}])
 def rhel7_contenthost(request):
     """A function-level fixture that provides a rhel7 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with pooled_contenthost(request) as host:
         yield host
 
 
@@ -69,7 +100,7 @@ def rhel7_contenthost_module(request):
 @pytest.fixture(params=[{'rhel_version': '8'}])
 def rhel8_contenthost(request):
     """A fixture that provides a rhel8 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with pooled_contenthost(request) as host:
         yield host
 
 
@@ -83,21 +114,23 @@ def rhel8_contenthost_module(request):
 @pytest.fixture(params=[{'rhel_version': 6}])
 def rhel6_contenthost(request):
     """A function-level fixture that provides a rhel6 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with pooled_contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': '9'}])
 def rhel9_contenthost(request):
     """A fixture that provides a rhel9 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with pooled_contenthost(request) as host:
         yield host
 
 
 @pytest.fixture
 def content_hosts(request):
     """A function-level fixture that provides two rhel content hosts object"""
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with checkin_queue.checked_out(
+        Broker(**host_conf(request), host_class=ContentHost, _count=2)
+    ) as hosts:
         hosts[0].set_infrastructure_type('physical')
         yield hosts
 
@@ -114,9 +147,16 @@ def mod_content_hosts(request):
 def registered_hosts(request, target_sat, module_org, module_ak_with_cv):
     """Fixture that registers content hosts to Satellite, based on rh_cloud setup"""
     with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
-        for vm in hosts:
-            repo = settings.repos['SATCLIENT_REPO'][f'RHEL{vm.os_version.major}']
-            vm.register(module_org, None, module_ak_with_cv.name, target_sat, repo=repo)
+        fan_out(
+            hosts,
+            lambda vm: vm.register(
+                module_org,
+                None,
+                module_ak_with_cv.name,
+                target_sat,
+                repo=settings.repos['SATCLIENT_REPO'][f'RHEL{vm.os_version.major}'],
+            ),
+        ).raise_for_errors()
         yield hosts
 
 
@@ -6,6 +6,7 @@ import pytest
 from wait_for import wait_for
 
 from robottelo.config import configure_airgun, configure_nailgun, settings
+from robottelo.host_helpers import checkin_queue
 from robottelo.hosts import (
     Capsule,
     IPAHost,
@@ -31,8 +32,7 @@ def _target_satellite_host(request, satellite_factory):
     if 'sanity' not in request.config.option.markexpr:
         new_sat = satellite_factory()
         yield new_sat
-        new_sat.teardown()
-        Broker(hosts=[new_sat]).checkin()
+        checkin_queue.checkin(new_sat)
     else:
         yield
 
@@ -42,8 +42,7 @@ def _target_capsule_host(request, capsule_factory):
     if 'sanity' not in request.config.option.markexpr:
         new_cap = capsule_factory()
         yield new_cap
-        new_cap.teardown()
-        Broker(hosts=[new_cap]).checkin()
+        checkin_queue.checkin(new_cap)
     else:
         yield
 
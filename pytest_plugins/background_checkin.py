@@ -0,0 +1,37 @@
+"""Drain the background check-in queue and report the failed check-ins
+
+The content host and Satellite fixtures queue the teardown and check in of their hosts,
+see :mod:`robottelo.host_helpers.checkin_queue`. Every pytest-xdist worker waits for its
+queue at the end of the session, the failures of all workers are listed in the terminal.
+"""
+import pytest
+
+from robottelo.host_helpers import checkin_queue
+from robottelo.logging import logger
+
+failures = []
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the failed check-ins of a pytest-xdist worker"""
+    failures.extend(getattr(node, 'workeroutput', {}).get('checkin_failures', []))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    worker_failures = checkin_queue.drain()
+    for hostname, step, error in worker_failures:
+        logger.error(f'Background {step} of {hostname} failed: {error}')
+    if hasattr(config, 'workeroutput'):
+        config.workeroutput['checkin_failures'] = worker_failures
+    else:
+        failures.extend(worker_failures)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, 'workeroutput') or not failures:
+        return
+    terminalreporter.section('failed host check-ins')
+    for hostname, step, error in failures:
+        terminalreporter.line(f'{hostname} {step}: {error}')
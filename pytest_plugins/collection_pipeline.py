@@ -0,0 +1,65 @@
+"""Modify the collected tests with the robottelo collection stages in a single walk
+
+The stages run in the order of :data:`STAGES`, see
+:class:`robottelo.utils.collection_pipeline.CollectionPipeline`. The walk runs before the
+other ``pytest_collection_modifyitems`` implementations, so the testimony markers can be
+used by the ``-m`` filter, and the stages finish after them, so the issues are only looked
+up for the tests left.
+
+The stage classes are looked up in the registered plugins when the tests are collected,
+importing the plugin modules here would prevent pytest from rewriting their asserts. The
+stages of a plugin disabled with ``-p no:<plugin>`` are skipped.
+"""
+import pytest
+
+from robottelo.logging import collection_logger as logger
+from robottelo.utils.collection_pipeline import CollectionPipeline
+
+# (plugin, stage class name)
+STAGES = [
+    ('pytest_plugins.metadata_markers', 'MetadataMarkersStage'),
+    ('pytest_plugins.marker_deselection', 'InfraMarkersStage'),
+    ('pytest_plugins.marker_deselection', 'DeselectMarkerStage'),
+    ('pytest_plugins.issue_handlers', 'IssueHandlersStage'),
+    ('pytest_plugins.fixture_markers', 'ContentHostMarkerStage'),
+    ('pytest_plugins.factory_collection', 'FactoryInstanceStage'),
+]
+
+pipeline_key = pytest.StashKey[CollectionPipeline]()
+
+
+def get_stages(pluginmanager):
+    """Return an instance of every stage of :data:`STAGES` whose plugin is registered"""
+    stages = []
+    for plugin_name, stage_name in STAGES:
+        plugin = pluginmanager.get_plugin(plugin_name)
+        if plugin is None:
+            logger.debug(f'Collection stage {stage_name} skipped, {plugin_name} not registered')
+            continue
+        stages.append(getattr(plugin, stage_name)())
+    return stages
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_collection_modifyitems(session, config, items):
+    logger.debug(f'Collected {len(items)} test cases')
+    pipeline = CollectionPipeline(get_stages(config.pluginmanager))
+    config.stash[pipeline_key] = pipeline
+    if deselected := pipeline.run(session, config, items):
+        config.hook.pytest_deselected(items=deselected)
+    outcome = yield
+    if outcome.excinfo is not None:
+        return
+    if deselected := pipeline.finish(items):
+        config.hook.pytest_deselected(items=deselected)
+    for line in pipeline.summary():
+        logger.info(f'Collection stage {line}')
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    pipeline = config.stash.get(pipeline_key, None)
+    if pipeline is None or config.option.verbose < 1:
+        return
+    terminalreporter.section('collection stages')
+    for line in pipeline.summary():
+        terminalreporter.line(line)
@@ -0,0 +1,84 @@
+"""Provision the content hosts of the collected tests ahead of time
+
+With ``content_host.warm_pool_size`` set, the content hosts used by the function-level
+content host fixtures are counted per deploy configuration once the tests are collected,
+and :class:`robottelo.host_helpers.host_pool.HostPool` starts checking them out. The
+provisioning time saved by every pytest-xdist worker is summarized in the terminal.
+"""
+import math
+import os
+
+import pytest
+
+from robottelo.config import settings
+from robottelo.host_helpers.host_pool import HostPool, PoolStats, conf_key
+from robottelo.logging import logger
+
+POOLED_FIXTURES = [
+    'rhel_contenthost',
+    'rhel6_contenthost',
+    'rhel7_contenthost',
+    'rhel8_contenthost',
+    'rhel9_contenthost',
+]
+
+pool_key = pytest.StashKey[HostPool]()
+stats = PoolStats()
+
+
+def collect_demand(items, config):
+    """Count the content hosts used by ``items`` per deploy configuration"""
+    from pytest_fixtures.core.contenthosts import deploy_conf
+
+    demand = {}
+    for item in items:
+        for name in POOLED_FIXTURES:
+            if name not in item.fixturenames:
+                continue
+            params = item.callspec.params.get(name, {}) if hasattr(item, 'callspec') else {}
+            conf = deploy_conf(params, config, item)
+            key = conf_key(conf)
+            demand[key] = (conf, demand.get(key, (conf, 0))[1] + 1)
+    # pytest-xdist workers collect every test and run their share of them
+    workers = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+    return {key: (conf, math.ceil(count / workers)) for key, (conf, count) in demand.items()}
+
+
+def pytest_collection_finish(session):
+    config = session.config
+    size = settings.content_host.warm_pool_size
+    if not size or config.option.collectonly or not session.items:
+        return
+    from robottelo.hosts import ContentHost
+
+    demand = collect_demand(session.items, config)
+    if demand:
+        pool = HostPool(size, ContentHost)
+        config.stash[pool_key] = pool
+        pool.plan(demand)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the counters of a pytest-xdist worker"""
+    stats.merge(getattr(node, 'workeroutput', {}).get('content_host_pool', {}))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    pool = config.stash.get(pool_key, None)
+    if pool is None:
+        return
+    pool.close()
+    logger.info(f'Content host pool: {pool.stats.summary()}')
+    if hasattr(config, 'workeroutput'):
+        config.workeroutput['content_host_pool'] = pool.stats.as_dict()
+    else:
+        stats.merge(pool.stats.as_dict())
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, 'workeroutput') or not (stats.hits or stats.misses):
+        return
+    terminalreporter.section('content host pool')
+    terminalreporter.line(stats.summary())
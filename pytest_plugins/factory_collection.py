@@ -1,5 +1,7 @@
 from inspect import getmembers, isfunction
 
+from robottelo.utils.collection_pipeline import CollectionStage
+
 
 def pytest_configure(config):
     """Register markers related to testimony tokens"""
@@ -7,14 +9,19 @@ def pytest_configure(config):
     config.addinivalue_line("markers", marker)
 
 
-def pytest_collection_modifyitems(session, items, config):
-    from pytest_fixtures.core import sat_cap_factory
+class FactoryInstanceStage(CollectionStage):
+    """Mark the tests using a fresh Satellite or Capsule instance"""
+
+    name = 'factory_collection'
+
+    def start(self, session, config, items):
+        from pytest_fixtures.core import sat_cap_factory
+
+        self.factory_fixture_names = frozenset(
+            m[0] for m in getmembers(sat_cap_factory, isfunction)
+        ) - {'satellite_factory', 'capsule_factory'}
 
-    factory_fixture_names = [m[0] for m in getmembers(sat_cap_factory, isfunction)]
-    for item in items:
-        itemfixtures = [
-            itm for itm in item.fixturenames if itm not in ('satellite_factory', 'capsule_factory')
-        ]
-        has_factoryfixture = set(itemfixtures).intersection(set(factory_fixture_names))
-        if has_factoryfixture:
+    def process(self, item):
+        if not self.factory_fixture_names.isdisjoint(item.fixturenames):
             item.add_marker('factory_instance')
+        return True
@@ -2,6 +2,7 @@ from inspect import getmembers, isfunction
 import re
 
 from robottelo.config import settings
+from robottelo.utils.collection_pipeline import CollectionStage
 
 TARGET_FIXTURES = [
     'rhel_contenthost',
@@ -79,25 +80,36 @@ def pytest_configure(config):
         config.addinivalue_line("markers", marker)
 
 
-def pytest_collection_modifyitems(session, items, config):
-    from pytest_fixtures.core import contenthosts
+def chost_rhelver(params):
+    """Helper to retrive the rhel_version of a client from test params"""
+    for param in params:
+        if 'contenthost' in param:
+            return params[param].get('rhel_version')
 
-    def chost_rhelver(params):
-        """Helper to retrive the rhel_version of a client from test params"""
-        for param in params:
-            if 'contenthost' in param:
-                return params[param].get('rhel_version')
 
-    content_host_fixture_names = [m[0] for m in getmembers(contenthosts, isfunction)]
-    for item in items:
-        if set(item.fixturenames).intersection(set(content_host_fixture_names)):
+class ContentHostMarkerStage(CollectionStage):
+    """Mark the tests using a content host fixture and record the RHEL version of the host"""
+
+    name = 'fixture_markers'
+
+    def start(self, session, config, items):
+        from pytest_fixtures.core import contenthosts
+
+        self.content_host_fixture_names = frozenset(
+            m[0] for m in getmembers(contenthosts, isfunction)
+        )
+        self.default_rhel_version = str(settings.content_host.default_rhel_version)
+
+    def process(self, item):
+        if not self.content_host_fixture_names.isdisjoint(item.fixturenames):
             # TODO check param for indirect version parametrization
             if hasattr(item, 'callspec'):
                 client_property = ('ClientOS', str(chost_rhelver(item.callspec.params)))
             else:
-                client_property = ('ClientOS', str(settings.content_host.default_rhel_version))
+                client_property = ('ClientOS', self.default_rhel_version)
             item.user_properties.append(client_property)
             item.add_marker('content_host')
+        return True
 
 
 def pytest_addoption(parser):
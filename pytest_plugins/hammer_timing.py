@@ -0,0 +1,55 @@
+"""Report the duration of hammer commands timed with ``settings.performance.time_hammer``
+
+The timings collected by every pytest-xdist worker are merged on the controller, written
+as JSON to ``--hammer-timing-report`` and summarized in the terminal.
+"""
+import pytest
+
+from robottelo.cli.hammer_timing import collector
+from robottelo.logging import robottelo_log_dir
+
+SUMMARY_LINES = 20
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--hammer-timing-report',
+        default=str(robottelo_log_dir / 'hammer_timings.json'),
+        help='Where to write the hammer command latency report when '
+        'settings.performance.time_hammer is set',
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the timings collected by a pytest-xdist worker"""
+    collector.merge(getattr(node, 'workeroutput', {}).get('hammer_timings', {}))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, 'workeroutput'):
+        # pytest-xdist worker, the controller writes the report
+        config.workeroutput['hammer_timings'] = collector.samples
+    elif collector.samples:
+        collector.write_report(config.getoption('hammer_timing_report'))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, 'workeroutput'):
+        return
+    summary = collector.summary()
+    if not summary:
+        return
+    terminalreporter.section('hammer command latency (seconds)')
+    terminalreporter.line(
+        f'{"command":<50} {"count":>6} {"total":>9} {"p50":>7} {"p95":>7} {"max":>7}'
+    )
+    for command, stats in list(summary.items())[:SUMMARY_LINES]:
+        terminalreporter.line(
+            f'{command[:50]:<50} {stats["count"]:>6} {stats["total"]:>9.2f} '
+            f'{stats["p50"]:>7.2f} {stats["p95"]:>7.2f} {stats["max"]:>7.2f}'
+        )
+    if len(summary) > SUMMARY_LINES:
+        terminalreporter.line(f'... {len(summary) - SUMMARY_LINES} more commands')
+    terminalreporter.line(f'Full report: {config.getoption("hammer_timing_report")}')
@@ -0,0 +1,97 @@
+"""Profile the robottelo plugin imports and hook implementations
+
+The import of every module listed in ``conftest.pytest_plugins`` after this plugin and every
+call of the hook implementations of the robottelo plugins and conftest files are measured
+with :data:`robottelo.utils.hook_profile.profiler`. The profiles of every pytest-xdist worker
+are merged on the controller and written, ranked by self time, to ``--hook-profile-report``
+``.json`` and ``.txt``. The slowest entries are shown in the terminal with ``-v``.
+
+The measurement costs a couple of microseconds per hook call, use
+``-p no:pytest_plugins.hook_profile`` to disable it.
+"""
+from pathlib import Path
+
+import pytest
+
+from robottelo.logging import robottelo_log_dir, robottelo_root_dir
+from robottelo.utils.hook_profile import profiler
+
+SUMMARY_LINES = 15
+root_dir = robottelo_root_dir.resolve()
+
+_wrapped = set()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--hook-profile-report',
+        default=str(robottelo_log_dir / 'hook_profile'),
+        help='Where to write the profile of the robottelo plugin imports and hook calls, '
+        'as <path>.json and <path>.txt, an empty value skips the report',
+    )
+
+
+def pytest_addhooks(pluginmanager):
+    """Time the imports of the plugins registered after this one"""
+    import_plugin = pluginmanager.import_plugin
+
+    def timed_import_plugin(modname, *args, **kwargs):
+        if pluginmanager.is_blocked(modname) or pluginmanager.get_plugin(modname) is not None:
+            return import_plugin(modname, *args, **kwargs)
+        return profiler.measure_import(modname, import_plugin, modname, *args, **kwargs)
+
+    pluginmanager.import_plugin = timed_import_plugin
+
+
+def _plugin_name(plugin):
+    """Return the name of a robottelo plugin or conftest module, None for other plugins"""
+    plugin_file = getattr(plugin, '__file__', None)
+    if plugin_file is None:
+        return None
+    path = Path(plugin_file).resolve()
+    if not path.is_relative_to(root_dir) or 'site-packages' in path.parts:
+        return None
+    if path.name == 'conftest.py':
+        return str(path.relative_to(root_dir))
+    return plugin.__name__
+
+
+def pytest_plugin_registered(plugin, manager):
+    """Wrap the hook implementations of the robottelo plugins"""
+    name = _plugin_name(plugin)
+    if name is None or plugin.__name__ == __name__ or id(plugin) in _wrapped:
+        return
+    _wrapped.add(id(plugin))
+    for hook_caller in manager.get_hookcallers(plugin) or []:
+        for hook_impl in hook_caller.get_hookimpls():
+            if hook_impl.plugin is plugin:
+                hook_impl.function = profiler.wrap_hook(
+                    f'{name}::{hook_caller.name}',
+                    hook_impl.function,
+                    generator=hook_impl.hookwrapper or hook_impl.wrapper,
+                )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the profile of a pytest-xdist worker"""
+    profiler.merge(getattr(node, 'workeroutput', {}).get('hook_profile', []))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, 'workeroutput'):
+        # pytest-xdist worker, the controller writes the report
+        config.workeroutput['hook_profile'] = profiler.as_list()
+    elif report := config.getoption('hook_profile_report'):
+        profiler.write_report(report)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, 'workeroutput') or config.option.verbose < 1 or not profiler.entries:
+        return
+    terminalreporter.section('robottelo plugin imports and hooks (self time)')
+    for line in profiler.report_lines(limit=SUMMARY_LINES):
+        terminalreporter.line(line)
+    if report := config.getoption('hook_profile_report'):
+        terminalreporter.line(f'Full report: {report}.txt')
@@ -1,14 +1,13 @@
 from collections import defaultdict
 from datetime import datetime
-import inspect
 import json
-import re
 
 import pytest
 
 from robottelo.config import settings
 from robottelo.logging import collection_logger as logger
-from robottelo.utils import slugify_component
+from robottelo.utils import collection_metadata, slugify_component
+from robottelo.utils.collection_pipeline import CollectionStage
 from robottelo.utils.issue_handlers import (
     add_workaround,
     bugzilla,
@@ -55,87 +54,145 @@ def pytest_configure(config):
         config.addinivalue_line("markers", marker)
 
 
-@pytest.hookimpl(trylast=True)
-def pytest_collection_modifyitems(session, items, config):
+class IssueHandlersStage(CollectionStage):
     """Generate the issue collection (using bz cache via bugzilla issue handler util)
     This collection includes pre-processed `is_open` status for each issue
 
+    The issue usages are collected while walking the items, the collection is generated
+    for the tests left once every collection plugin ran, e.g. after the ``-k`` filter.
     """
 
-    # generate_issue_collection will save a file, set by --bz-cache value
-    pytest.issue_data = generate_issue_collection(items, config)
+    name = 'issue_handlers'
 
-    # Add skipif markers, and modify collection based on --bz option
-    bz_filters = config.getoption('BZ', None)
-    if bz_filters:
-        bz_filters = bz_filters.split(',')
-    selected = []
-    deselected = []
-    for item in items:
-        # Add a skipif marker for the issues
+    def start(self, session, config, items):
+        self.config = config
+        self.usages = {}
+        self.skip_if_open = {}
+        # modify collection based on --bz option
+        bz_filters = config.getoption('BZ', None)
+        self.bz_filters = set(bz_filters.split(',')) if bz_filters else None
+
+    def process(self, item):
+        # Unit tests get no bz processing
+        if not item.nodeid.startswith('tests/robottelo/'):
+            self.usages[item] = collect_item_usages(item)
         skip_if_open = item.get_closest_marker('skip_if_open')
         if skip_if_open:
             # marker must have `BZ:123456` as argument.
-            issue = skip_if_open.kwargs.get('reason') or skip_if_open.args[0]
-            item.add_marker(pytest.mark.skipif(is_open(issue), reason=issue))
+            self.skip_if_open[item] = skip_if_open.kwargs.get('reason') or skip_if_open.args[0]
 
         # remove items from collection
-        if bz_filters:
+        if self.bz_filters:
             # Only include items which have BZ mark that includes any of the filtered bz numbers
             item_bz_marks = set(getattr(item.get_closest_marker('BZ', None), 'args', []))
-            if bool(set(bz_filters) & item_bz_marks):
-                selected.append(item)
-            else:
+            if not self.bz_filters & item_bz_marks:
                 logger.debug(
-                    f'Deselected test [{item.nodeid}] due to BZ filter {bz_filters} '
+                    f'Deselected test [{item.nodeid}] due to BZ filter {self.bz_filters} '
                     f'and available marks {item_bz_marks}'
                 )
-                deselected.append(item)
-                continue  # move to the next item
-            # append only when there is a BZ in common between the lists
-        else:
-            selected.append(item)
+                return False
+        return True
+
+    def finish(self, items):
+        items_usages = [(item, self.usages[item]) for item in items if item in self.usages]
+        # generate_issue_collection will save a file, set by --bz-cache value
+        pytest.issue_data = generate_issue_collection(items_usages, self.config)
+
+        for item, usages in items_usages:
+            # add deselect markers dynamically, the tests are not deselected by them as the
+            # deselect markers were already processed
+            issue = usages['deselect']
+            if issue and pytest.issue_data[issue]['data'].get('is_deselected'):
+                item.add_marker(pytest.mark.deselect(reason=issue))
+        # Add a skipif marker for the issues
+        for item in items:
+            if item in self.skip_if_open:
+                issue = self.skip_if_open[item]
+                item.add_marker(pytest.mark.skipif(is_open(issue), reason=issue))
+        return ()
 
-    config.hook.pytest_deselected(items=deselected)
-    items[:] = selected
 
+def collect_item_usages(item):
+    """Collect the issue usages of a test item, and add its BZ marker
 
-IS_OPEN = re.compile(
-    # To match `if is_open('BZ:123456'):`
-    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
+    Returns:
+        dict -- the ``module`` of the item with its ``module_usages``, the issue usages of
+        the item in ``used_in`` indexed like the issue collection, and the issue checked by
+        the ``deselect`` process
+    """
+    valid_markers = ["skip_if_open", "skip", "deselect"]
+    used_in = defaultdict(lambda: {"used_in": []})
+    deselect = None
+
+    bz_marks_to_add = []
+    metadata = collection_metadata.item_metadata(item)
+    # Find matches from docstrings top-down from: module, class, function.
+    for scope in (metadata['module'], metadata['class'], metadata['function']):
+        if scope is not None and scope['doc'] is not None:
+            bz_marks_to_add.extend(scope['doc']['bz'])
+
+    filepath, lineno, testcase = item.location
+    # Component and importance marks are determined by testimony tokens
+    # Testimony.yaml as of writing has both as required, so any
+    if components := item.get_closest_marker('component'):
+        component_mark = components.args[0]
+        component_slug = slugify_component(component_mark, False)
+        importance_mark = item.get_closest_marker('importance').args[0]
+        for marker in item.iter_markers():
+            if marker.name in valid_markers:
+                issue = marker.kwargs.get('reason') or marker.args[0]
+                issue_key = issue.strip()
+                used_in[issue_key]['used_in'].append(
+                    {
+                        'filepath': filepath,
+                        'lineno': lineno,
+                        'testcase': testcase,
+                        'component': component_mark,
+                        'importance': importance_mark,
+                        'component_mark': component_slug,
+                        'usage': marker.name,
+                    }
+                )
 
-NOT_IS_OPEN = re.compile(
-    # To match `if not is_open('BZ:123456'):`
-    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
+                # Store issue key to lookup in the deselection process
+                deselect = issue_key
+                # Add issue as a marker to enable filtering e.g: "--BZ 123456"
+                bz_marks_to_add.append(issue_key.split(':')[-1])
 
-COMPONENT = re.compile(
-    # To match :CaseComponent: FooBar
-    r"\s*:CaseComponent:\s*(?P<component>\S*)",
-    re.IGNORECASE,
-)
+        # Then take the workarounds using `is_open` helper.
+        function_usages = metadata['function']
+        if function_usages['is_open'] or function_usages['not_is_open']:
+            kwargs = {
+                'filepath': filepath,
+                'lineno': lineno,
+                'testcase': testcase,
+                'component': component_mark,
+                'importance': importance_mark,
+                'component_mark': component_slug,
+            }
+            add_workaround(used_in, function_usages['is_open'], 'is_open', **kwargs)
+            add_workaround(used_in, function_usages['not_is_open'], 'not is_open', **kwargs)
 
-IMPORTANCE = re.compile(
-    # To match :CaseImportance: Critical
-    r"\s*:CaseImportance:\s*(?P<importance>\S*)",
-    re.IGNORECASE,
-)
+        # Add BZs from tokens as a marker to enable filter e.g: "--BZ 123456"
+        if bz_marks_to_add:
+            item.add_marker(pytest.mark.BZ(*bz_marks_to_add))
 
-BZ = re.compile(
-    # To match :BZ: 123456, 456789
-    r"\s*:BZ:\s*(?P<bz>.*\S*)",
-    re.IGNORECASE,
-)
+    return {
+        'module': item.module,
+        'module_usages': metadata['module'],
+        'used_in': used_in,
+        'deselect': deselect,
+    }
 
 
-def generate_issue_collection(items, config):  # pragma: no cover
+def generate_issue_collection(items_usages, config):  # pragma: no cover
     """Generates a dictionary with the usage of Issue blockers
 
-    For use in pytest_collection_modifyitems hook
+    For use in ``IssueHandlersStage.finish``
 
     Arguments:
-        items {list} - List of pytest test case objects.
+        items_usages {list} - List of pytest test case objects and their usages, as
+            returned by ``collect_item_usages``.
         config {dict} - Pytest config object.
 
     Returns:
@@ -170,7 +227,6 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 ...
             }
     """
-    valid_markers = ["skip_if_open", "skip", "deselect"]
     collected_data = defaultdict(lambda: {"data": {}, "used_in": []})
 
     use_bz_cache = config.getoption('bz_cache', None)  # use existing json cache?
@@ -188,89 +244,27 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 f'--bz-cache option used, cache file [{DEFAULT_BZ_CACHE_FILE}] not found'
             )
 
-    deselect_data = {}  # a local cache for deselected tests
+    deselect_data = set()  # the issues looked up in the deselection process
 
-    test_modules = set()
+    test_modules = {}
 
     # --- Build the issue marked usage collection ---
-    for item in items:
-        if item.nodeid.startswith('tests/robottelo/'):
-            # Unit test, no bz processing
-            # TODO: We very likely don't need to include component and importance in collected_data
-            # Removing these would unravel issue_handlers dependence on testimony
-            # Allowing for issue_handler use in unit tests
-            continue
-
-        bz_marks_to_add = []
+    for _, usages in items_usages:
         # register test module as processed
-        test_modules.add(item.module)
-        # Find matches from docstrings top-down from: module, class, function.
-        mod_cls_fun = (item.module, getattr(item, 'cls', None), item.function)
-        for docstring in [d for d in map(inspect.getdoc, mod_cls_fun) if d is not None]:
-            bz_matches = BZ.findall(docstring)
-            if bz_matches:
-                bz_marks_to_add.extend(b.strip() for b in bz_matches[-1].split(','))
-
-        filepath, lineno, testcase = item.location
-        # Component and importance marks are determined by testimony tokens
-        # Testimony.yaml as of writing has both as required, so any
-        if not (components := item.get_closest_marker('component')):
-            continue
-        component_mark = components.args[0]
-        component_slug = slugify_component(component_mark, False)
-        importance_mark = item.get_closest_marker('importance').args[0]
-        for marker in item.iter_markers():
-            if marker.name in valid_markers:
-                issue = marker.kwargs.get('reason') or marker.args[0]
-                issue_key = issue.strip()
-                collected_data[issue_key]['used_in'].append(
-                    {
-                        'filepath': filepath,
-                        'lineno': lineno,
-                        'testcase': testcase,
-                        'component': component_mark,
-                        'importance': importance_mark,
-                        'component_mark': component_slug,
-                        'usage': marker.name,
-                    }
-                )
-
-                # Store issue key to lookup in the deselection process
-                deselect_data[item.location] = issue_key
-                # Add issue as a marker to enable filtering e.g: "--BZ 123456"
-                bz_marks_to_add.append(issue_key.split(':')[-1])
-
-        # Then take the workarounds using `is_open` helper.
-        source = inspect.getsource(item.function)
-        if 'is_open(' in source:
-            kwargs = {
-                'filepath': filepath,
-                'lineno': lineno,
-                'testcase': testcase,
-                'component': component_mark,
-                'importance': importance_mark,
-                'component_mark': component_slug,
-            }
-            add_workaround(collected_data, IS_OPEN.findall(source), 'is_open', **kwargs)
-            add_workaround(collected_data, NOT_IS_OPEN.findall(source), 'not is_open', **kwargs)
-
-        # Add BZs from tokens as a marker to enable filter e.g: "--BZ 123456"
-        if bz_marks_to_add:
-            item.add_marker(pytest.mark.BZ(*bz_marks_to_add))
+        test_modules[usages['module']] = usages['module_usages']
+        for issue_key, issue_usages in usages['used_in'].items():
+            collected_data[issue_key]['used_in'].extend(issue_usages['used_in'])
+        if usages['deselect']:
+            deselect_data.add(usages['deselect'])
 
     # Take uses of `is_open` from outside of test cases e.g: SetUp methods
-    for test_module in test_modules:
-        module_source = inspect.getsource(test_module)
-        component_matches = COMPONENT.findall(module_source)
-        module_component = None
-        if component_matches:
-            module_component = component_matches[0]
-        if 'is_open(' in module_source:
+    for test_module, module_usages in test_modules.items():
+        if module_usages['is_open'] or module_usages['not_is_open']:
             kwargs = {
                 'filepath': test_module.__file__,
                 'lineno': 1,
                 'testcase': test_module.__name__,
-                'component': module_component,
+                'component': module_usages['component'],
             }
 
             def validation(data, issue, usage, **kwargs):
@@ -278,28 +272,27 @@ def generate_issue_collection(items, config):  # pragma: no cover
 
             add_workaround(
                 collected_data,
-                IS_OPEN.findall(module_source),
+                module_usages['is_open'],
                 'is_open',
                 validation=validation,
                 **kwargs,
             )
             add_workaround(
                 collected_data,
-                NOT_IS_OPEN.findall(module_source),
+                module_usages['not_is_open'],
                 'not is_open',
                 validation=validation,
                 **kwargs,
             )
+    collection_metadata.cache.save()
 
     # --- Collect BUGZILLA data ---
     bugzilla.collect_data_bz(collected_data, cached_data)
 
-    # --- add deselect markers dynamically ---
-    for item in items:
-        issue = deselect_data.get(item.location)
-        if issue and should_deselect(issue, collected_data[issue]['data']):
+    # --- flag the issues deselecting their tests ---
+    for issue in deselect_data:
+        if should_deselect(issue, collected_data[issue]['data']):
             collected_data[issue]['data']['is_deselected'] = True
-            item.add_marker(pytest.mark.deselect(reason=issue))
 
     # --- if no cache file existed write a new cache file ---
     if cached_data is None and use_bz_cache:
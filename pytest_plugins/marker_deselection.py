@@ -1,6 +1,5 @@
-import pytest
-
 from robottelo.logging import collection_logger as logger
+from robottelo.utils.collection_pipeline import CollectionStage
 
 non_satCI_components = ['Virt-whoConfigurePlugin']
 
@@ -28,54 +27,84 @@ def pytest_addoption(parser):
     parser.addoption(option, default='', help=help_text)
 
 
-@pytest.hookimpl(tryfirst=True)
-def pytest_collection_modifyitems(items, config):
+class InfraMarkersStage(CollectionStage):
     """
-    Collects and modifies tests collection based on pytest option to deselect tests for new infra
+    Deselect the tests depending on infra not available to the SatQE CI, unless the pytest
+    option including them was passed
+
+    The tests are picked while walking every collected test, before the ``-k`` and ``-m``
+    filters, and deselected once the filters ran. As before the collection pipeline, none
+    is deselected when every collected test would be.
     """
-    include_onprem_provision = config.getoption('include_onprem_provisioning', False)
-    include_libvirt = config.getoption('include_libvirt', False)
-    include_eauth = config.getoption('include_external_auth', False)
-    include_vlan = config.getoption('include_vlan_networking', False)
-    include_non_satci_tests = config.getvalue('include_non_satci_tests').split(',')
-
-    selected = []
-    deselected = []
-    # Cloud Provisioning Test can be run on new pipeline
-    for item in items:
+
+    name = 'marker_deselection'
+
+    def start(self, session, config, items):
+        # Tests deselected by their markers, mapped to the option including them
+        self.excluded_marks = {
+            mark: config.getoption(option, False)
+            for mark, option in [
+                # Include / Exclude On Premises Provisioning Tests
+                ('on_premises_provisioning', 'include_onprem_provisioning'),
+                # Include / Exclude External Libvirt based Tests
+                ('libvirt_discovery', 'include_libvirt'),
+                # Include / Exclude External Auth based Tests
+                ('external_auth', 'include_external_auth'),
+                # Include / Exclude VLAN networking based based Tests
+                ('vlan_networking', 'include_vlan_networking'),
+            ]
+        }
+        self.include_non_satci_tests = config.getvalue('include_non_satci_tests').split(',')
+        self.deselected = []
+        self.walked = 0
+
+    def process(self, item):
+        self.walked += 1
         # Include/Exclude tests those are not part of SatQE CI
         item_component = item.get_closest_marker('component')
         if item_component and (item_component.args[0] in non_satCI_components):
-            if item_component.args[0] in include_non_satci_tests or item.nodeid.startswith(
-                'tests/upgrades/'
+            if not (
+                item_component.args[0] in self.include_non_satci_tests
+                or item.nodeid.startswith('tests/upgrades/')
             ):
-                selected.append(item)
-            else:
-                deselected.append(item)
-            continue
-
-        item_marks = [m.name for m in item.iter_markers()]
-        # Include / Exclude On Premises Provisioning Tests
-        if 'on_premises_provisioning' in item_marks:
-            selected.append(item) if include_onprem_provision else deselected.append(item)
-            continue
-        # Include / Exclude External Libvirt based Tests
-        if 'libvirt_discovery' in item_marks:
-            selected.append(item) if include_libvirt else deselected.append(item)
-            continue
-        # Include / Exclude External Auth based Tests
-        if 'external_auth' in item_marks:
-            selected.append(item) if include_eauth else deselected.append(item)
-            continue
-        # Include / Exclude VLAN networking based based Tests
-        if 'vlan_networking' in item_marks:
-            selected.append(item) if include_vlan else deselected.append(item)
-            continue
-        # This Plugin does not applies to this test
-        selected.append(item)
-    logger.debug(
-        f'Selected {len(selected)} and deselected {len(deselected)} '
-        'tests based on auto un-collectable markers and pytest options.'
-    )
-    items[:] = selected or items
-    config.hook.pytest_deselected(items=deselected)
+                self.deselected.append(item)
+            return True
+
+        # The first marker found in that order decides
+        for mark in self.excluded_marks:
+            if item.get_closest_marker(mark):
+                if not self.excluded_marks[mark]:
+                    self.deselected.append(item)
+                break
+        return True
+
+    def finish(self, items):
+        # Nothing is deselected when no collected test would be left, whatever the filters
+        if len(self.deselected) < self.walked:
+            picked = set(self.deselected)
+            deselected = [item for item in items if item in picked]
+        else:
+            deselected = []
+        logger.debug(
+            f'Selected {len(items) - len(deselected)} and deselected {len(deselected)} '
+            'tests based on auto un-collectable markers and pytest options.'
+        )
+        return deselected
+
+
+class DeselectMarkerStage(CollectionStage):
+    """Deselect tests marked with @pytest.mark.deselect
+
+    The deselect markers added for WONTFIX BZs by ``IssueHandlersStage.finish`` come after
+    this stage, they do not deselect the tests.
+    """
+
+    name = 'deselect_marker'
+
+    def process(self, item):
+        deselect = item.get_closest_marker('deselect')
+        if deselect:
+            reason = deselect.kwargs.get('reason', deselect.args)
+            logger.debug(f'Deselected test "{item.name}" reason: {reason}')
+            return False
+        return True
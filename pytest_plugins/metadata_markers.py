@@ -1,12 +1,12 @@
 import datetime
-import inspect
-import re
 
 import pytest
 
 from robottelo.config import settings
 from robottelo.hosts import get_sat_rhel_version
 from robottelo.logging import collection_logger as logger
+from robottelo.utils import collection_metadata
+from robottelo.utils.collection_pipeline import CollectionStage
 
 FMT_XUNIT_TIME = '%Y-%m-%dT%H:%M:%S'
 IMPORTANCE_LEVELS = []
@@ -38,27 +38,7 @@ def pytest_configure(config):
         config.addinivalue_line("markers", marker)
 
 
-component_regex = re.compile(
-    # To match :CaseComponent: FooBar
-    r'\s*:CaseComponent:\s*(?P<component>\S*)',
-    re.IGNORECASE,
-)
-
-importance_regex = re.compile(
-    # To match :CaseImportance: Critical
-    r'\s*:CaseImportance:\s*(?P<importance>\S*)',
-    re.IGNORECASE,
-)
-
-team_regex = re.compile(
-    # To match :Team: Rocket
-    r'\s*:Team:\s*(?P<team>\S*)',
-    re.IGNORECASE,
-)
-
-
-@pytest.hookimpl(tryfirst=True)
-def pytest_collection_modifyitems(items, config):
+class MetadataMarkersStage(CollectionStage):
     """Add markers and user_properties for testimony token metadata
 
     user_properties is used by the junit plugin, and thus by many test report systems
@@ -71,48 +51,48 @@ def pytest_collection_modifyitems(items, config):
     Control test collection for custom options related to testimony metadata
 
     """
-    # get RHEL version of the satellite
-    rhel_version = get_sat_rhel_version().base_version
-    sat_version = settings.server.version.get('release')
-    snap_version = settings.server.version.get('snap', '')
-
-    # split the option string and handle no option, single option, multiple
-    # config.getoption(default) doesn't work like you think it does, hence or ''
-    importance = [i for i in (config.getoption('importance') or '').split(',') if i != '']
-    component = [c for c in (config.getoption('component') or '').split(',') if c != '']
-    team = [a.lower() for a in (config.getoption('team') or '').split(',') if a != '']
-
-    selected = []
-    deselected = []
-    logger.info('Processing test items to add testimony token markers')
-    for item in items:
+
+    name = 'metadata_markers'
+
+    def start(self, session, config, items):
+        # get RHEL version of the satellite
+        self.rhel_version = get_sat_rhel_version().base_version
+        self.sat_version = settings.server.version.get('release')
+        self.snap_version = settings.server.version.get('snap', '')
+
+        # split the option string and handle no option, single option, multiple
+        # config.getoption(default) doesn't work like you think it does, hence or ''
+        self.importance = [i for i in (config.getoption('importance') or '').split(',') if i != '']
+        self.component = [c for c in (config.getoption('component') or '').split(',') if c != '']
+        self.team = [a.lower() for a in (config.getoption('team') or '').split(',') if a != '']
+        logger.info('Processing test items to add testimony token markers')
+
+    def process(self, item):
         item.user_properties.append(
             ("start_time", datetime.datetime.utcnow().strftime(FMT_XUNIT_TIME))
         )
         if item.nodeid.startswith('tests/robottelo/') and 'test_junit' not in item.nodeid:
-            # Unit test, no testimony markers
-            continue
+            # Unit test, no testimony markers, not collected when filtering by them
+            return not (self.importance or self.component or self.team)
 
         # apply the marks for importance, component, and team
         # Find matches from docstrings starting at smallest scope
-        item_docstrings = [
-            d
-            for d in map(inspect.getdoc, (item.function, getattr(item, 'cls', None), item.module))
-            if d is not None
+        metadata = collection_metadata.item_metadata(item)
+        item_tokens = [
+            scope['doc']
+            for scope in (metadata['function'], metadata['class'], metadata['module'])
+            if scope is not None and scope['doc'] is not None
         ]
-        for docstring in item_docstrings:
+        for tokens in item_tokens:
             item_mark_names = [m.name for m in item.iter_markers()]
             # Add marker starting at smallest docstring scope
             # only add the mark if it hasn't already been applied at a lower scope
-            doc_component = component_regex.findall(docstring)
-            if doc_component and 'component' not in item_mark_names:
-                item.add_marker(pytest.mark.component(doc_component[0]))
-            doc_importance = importance_regex.findall(docstring)
-            if doc_importance and 'importance' not in item_mark_names:
-                item.add_marker(pytest.mark.importance(doc_importance[0]))
-            doc_team = team_regex.findall(docstring)
-            if doc_team and 'team' not in item_mark_names:
-                item.add_marker(pytest.mark.team(doc_team[0].lower()))
+            if tokens['component'] is not None and 'component' not in item_mark_names:
+                item.add_marker(pytest.mark.component(tokens['component']))
+            if tokens['importance'] is not None and 'importance' not in item_mark_names:
+                item.add_marker(pytest.mark.importance(tokens['importance']))
+            if tokens['team'] is not None and 'team' not in item_mark_names:
+                item.add_marker(pytest.mark.team(tokens['team'].lower()))
 
         # add markers as user_properties so they are recorded in XML properties of the report
         # pytest-ibutsu will include user_properties dict in testresult metadata
@@ -131,46 +111,43 @@ def pytest_collection_modifyitems(items, config):
         item.user_properties.append(("markers", ", ".join(markers_prop_data)))
 
         # Version specific user properties
-        item.user_properties.append(("BaseOS", rhel_version))
-        item.user_properties.append(("SatelliteVersion", sat_version))
-        item.user_properties.append(("SnapVersion", snap_version))
-
-        # exit early if no filters were passed
-        if importance or component or team:
-            # Filter test collection based on CLI options for filtering
-            # filters should be applied together
-            # such that --component Repository --importance Critical --team rocket
-            # only collects tests which have all three of these marks
-
-            # https://github.com/pytest-dev/pytest/issues/1373  Will make this way easier
-            # testimony requires both importance and component, this will blow up if its forgotten
+        item.user_properties.append(("BaseOS", self.rhel_version))
+        item.user_properties.append(("SatelliteVersion", self.sat_version))
+        item.user_properties.append(("SnapVersion", self.snap_version))
+
+        # Filter test collection based on CLI options for filtering
+        # filters should be applied together
+        # such that --component Repository --importance Critical --team rocket
+        # only collects tests which have all three of these marks
+
+        # https://github.com/pytest-dev/pytest/issues/1373  Will make this way easier
+        # testimony requires both importance and component, this will blow up if its forgotten
+        if self.importance:
             importance_marker = item.get_closest_marker('importance').args[0]
-            if importance and importance_marker not in importance:
+            if importance_marker not in self.importance:
                 logger.debug(
-                    f'Deselected test {item.nodeid} due to "--importance {importance}",'
+                    f'Deselected test {item.nodeid} due to "--importance {self.importance}",'
                     f'test has importance mark: {importance_marker}'
                 )
-                deselected.append(item)
-                continue
+                return False
+        if self.component:
             component_marker = item.get_closest_marker('component').args[0]
-            if component and component_marker not in component:
+            if component_marker not in self.component:
                 logger.debug(
-                    f'Deselected test {item.nodeid} due to "--component {component}",'
+                    f'Deselected test {item.nodeid} due to "--component {self.component}",'
                     f'test has component mark: {component_marker}'
                 )
-                deselected.append(item)
-                continue
+                return False
+        if self.team:
             team_marker = item.get_closest_marker('team').args[0]
-            if team and team_marker not in team:
+            if team_marker not in self.team:
                 logger.debug(
-                    f'Deselected test {item.nodeid} due to "--team {team}",'
+                    f'Deselected test {item.nodeid} due to "--team {self.team}",'
                     f'test has team mark: {team_marker}'
                 )
-                deselected.append(item)
-                continue
-
-            selected.append(item)
+                return False
+        return True
 
-    # selected will be empty if no filter option was passed, defaulting to full items list
-    items[:] = selected if deselected else items
-    config.hook.pytest_deselected(items=deselected)
+    def finish(self, items):
+        collection_metadata.cache.save()
+        return ()
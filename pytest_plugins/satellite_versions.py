@@ -0,0 +1,23 @@
+"""Probe the Satellite versions once in the pytest-xdist controller
+
+The controller probes the versions of ``server.hostname`` before starting the workers and
+passes them in the worker input, so no worker opens an ssh connection to the Satellite
+while collecting the tests, see :mod:`robottelo.utils.satellite_versions`.
+"""
+import pytest
+
+from robottelo.hosts import get_sat_rhel_version
+from robottelo.utils import satellite_versions
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Pass the versions probed by the controller to a pytest-xdist worker"""
+    # probes the Satellite on the first call, returns the probed versions afterwards
+    get_sat_rhel_version()
+    node.workerinput['satellite_versions'] = satellite_versions.cache.snapshot()
+
+
+def pytest_configure(config):
+    if hasattr(config, 'workerinput'):
+        satellite_versions.cache.update(config.workerinput.get('satellite_versions', {}))
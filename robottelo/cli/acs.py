@@ -34,5 +34,4 @@ class ACS(Base):
     @classmethod
     def refresh(cls, options=None):
         """Refresh the ACS"""
-        cls.command_sub = 'refresh'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='refresh'))
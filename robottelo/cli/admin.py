@@ -23,5 +23,6 @@ class Admin(Base):
     @classmethod
     def logging(cls, options=None):
         """Logging verbosity level setup"""
-        cls.command_sub = 'logging'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='logging'), output_format='csv'
+        )
@@ -19,41 +19,46 @@ class Ansible(Base):
     @classmethod
     def roles_import(cls, options=None):
         """DEPRECATED - Import ansible roles"""
-        cls.command_sub = 'roles import'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='roles import'), output_format='csv'
+        )
 
     @classmethod
     def roles_sync(cls, options=None):
         """Sync Ansible roles"""
-        cls.command_sub = 'roles sync'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='roles sync'))
 
     @classmethod
     def roles_delete(cls, options=None):
         """Delete Ansible roles"""
-        cls.command_sub = 'roles delete'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='roles delete'), output_format='csv'
+        )
 
     @classmethod
     def roles_list(cls, options=None):
         """List ansible roles"""
-        cls.command_sub = 'roles list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='roles list'), output_format='csv'
+        )
 
     @classmethod
     def variables_import(cls, options=None):
         """Import ansible variables"""
-        cls.command_sub = 'variables import'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='variables import'), output_format='csv'
+        )
 
     @classmethod
     def variables_create(cls, options=None):
         """Create ansible variables"""
-        cls.command_sub = 'variables create'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='variables create'), output_format='csv'
+        )
 
     @classmethod
     def variables_info(cls, options=None):
         """Information about ansible variables"""
-        cls.command_sub = 'variables info'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='variables info'), output_format='csv'
+        )
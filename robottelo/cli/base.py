@@ -1,10 +1,13 @@
 """Generic base class for cli hammer commands."""
+from concurrent.futures import ThreadPoolExecutor
 import re
+import uuid
 
+from broker.helpers import Result
 from wait_for import wait_for
 
 from robottelo import ssh
-from robottelo.cli import hammer
+from robottelo.cli import hammer, hammer_schema, hammer_shell, hammer_timing
 from robottelo.config import settings
 from robottelo.exceptions import CLIDataBaseError, CLIError, CLIReturnCodeError
 from robottelo.logging import logger
@@ -19,15 +22,35 @@ class Base:
 
     omitting_credentials = False
     command_base = None  # each inherited instance should define this
-    command_sub = None  # specific to instance, like: create, update, etc.
-    command_end = None  # extending commands like for directory to pass
+    command_sub = None  # default subcommand, methods pass their own to _construct_command
+    command_end = None  # default trailing arguments, e.g. a directory to pass
     command_requires_org = False  # True when command requires organization-id
     hostname = None  # Now used for Satellite class hammer execution
     logger = logger
     _db_error_regex = re.compile(r'.*INSERT INTO|.*SELECT .*FROM|.*violates foreign key')
 
     @classmethod
-    def _handle_response(cls, response, ignore_stderr=None):
+    def _command_label(cls, command=None):
+        """Return the hammer subcommand of ``command``, e.g. ``repository synchronize``"""
+        if command:
+            # drop the options, they may contain credentials or huge values
+            return command.split(' --', 1)[0].strip()
+        return f'{cls.command_base} {cls.command_sub}'
+
+    @classmethod
+    def _record_timing(cls, command, response):
+        """Strip the ``time -p`` trailer from the ``response`` stderr and record it
+
+        See :mod:`robottelo.cli.hammer_timing`.
+        """
+        if not isinstance(response.stderr, str):
+            return
+        response.stderr, timing = hammer.parse_time_p(response.stderr)
+        if timing:
+            hammer_timing.collector.record(cls._command_label(command), **timing)
+
+    @classmethod
+    def _handle_response(cls, response, ignore_stderr=None, command=None):
         """Verify ``status`` of the CLI command.
 
         Check for a non-zero return code or any stderr contents.
@@ -35,6 +58,8 @@ class Base:
         :param response: a result object, returned by :mod:`robottelo.utils.ssh.command`.
         :param ignore_stderr: indicates whether to throw a warning in logs if
             ``stderr`` is not empty.
+        :param command: the hammer command which produced ``response``, used in the error
+            message.
         :returns: contents of ``stdout``.
         :raises robottelo.exceptions.CLIReturnCodeError: If return code is
             different from zero.
@@ -49,7 +74,7 @@ class Base:
             response.stderr = response.stderr.decode()
         if response.status != 0:
             full_msg = (
-                f'Command "{cls.command_base} {cls.command_sub}" '
+                f'Command "{cls._command_label(command)}" '
                 f'finished with status {response.status}\n'
                 f'stderr contains:\n{response.stderr}'
             )
@@ -67,9 +92,7 @@ class Base:
         Adds OS to record.
         """
 
-        cls.command_sub = 'add-operatingsystem'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='add-operatingsystem'))
 
     @classmethod
     def ping(cls, options=None):
@@ -77,27 +100,39 @@ class Base:
         Display status of Satellite.
         """
 
-        cls.command_sub = 'ping'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='ping'))
 
     @classmethod
     def create(cls, options=None, timeout=None):
         """
         Creates a new record using the arguments passed via dictionary.
-        """
 
-        cls.command_sub = 'create'
+        The new record is then fetched with ``info``, unless
+        ``settings.performance.hammer_json_output`` is set and the create output
+        already holds the whole record.
+        """
 
         if options is None:
             options = {}
 
-        result = cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
+        json_output = settings.performance.hammer_json_output
+        result = cls.execute(
+            cls._construct_command(options, command_sub='create'),
+            output_format='json' if json_output else 'csv',
+            timeout=timeout,
+        )
+        if json_output:
+            result = [result] if isinstance(result, dict) else result or []
 
         # Extract new object ID if it was successfully created
         if len(result) > 0 and 'id' in result[0]:
             obj_id = result[0]['id']
 
+            # hammer usually prints only the message, id and name of the new object,
+            # anything more is the whole object and there is no need to fetch it
+            if json_output and set(result[0]) - {'message', 'id', 'name'}:
+                return result[0]
+
             # Fetch new object
             # Some Katello obj require the organization-id for subcommands
             info_options = {'id': obj_id}
@@ -128,8 +163,11 @@ class Base:
     @classmethod
     def delete(cls, options=None, timeout=None):
         """Deletes existing record."""
-        cls.command_sub = 'delete'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='delete'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
 
     @classmethod
     def delete_parameter(cls, options=None, timeout=None):
@@ -137,9 +175,11 @@ class Base:
         Deletes parameter from record.
         """
 
-        cls.command_sub = 'delete-parameter'
-
-        result = cls.execute(cls._construct_command(options), ignore_stderr=False, timeout=timeout)
+        result = cls.execute(
+            cls._construct_command(options, command_sub='delete-parameter'),
+            ignore_stderr=False,
+            timeout=timeout,
+        )
 
         return result
 
@@ -149,9 +189,11 @@ class Base:
         Displays the content for existing partition table.
         """
 
-        cls.command_sub = 'dump'
-
-        result = cls.execute(cls._construct_command(options), ignore_stderr=False, timeout=timeout)
+        result = cls.execute(
+            cls._construct_command(options, command_sub='dump'),
+            ignore_stderr=False,
+            timeout=timeout,
+        )
 
         return result
 
@@ -175,6 +217,19 @@ class Base:
 
         return (username, password)
 
+    @classmethod
+    def _hammer_command(cls, command, user=None, password=None, output_format=None):
+        """Build the full hammer invocation of a cli ``command``"""
+        # add time to measure hammer performance
+        return 'LANG={} {} hammer -v {} {} {} {}'.format(
+            settings.robottelo.locale,
+            'time -p' if settings.performance.time_hammer else '',
+            f'-u {user}' if user else "--interactive no",
+            f'-p {password}' if password else "",
+            f'--output={output_format}' if output_format else "",
+            command,
+        )
+
     @classmethod
     def execute(
         cls,
@@ -192,27 +247,85 @@ class Base:
             user, password = None, None
         else:
             user, password = cls._get_username_password(user, password)
-        time_hammer = settings.performance.time_hammer
-
-        # add time to measure hammer performance
-        cmd = 'LANG={} {} hammer -v {} {} {} {}'.format(
-            settings.robottelo.locale,
-            'time -p' if time_hammer else '',
-            f'-u {user}' if user else "--interactive no",
-            f'-p {password}' if password else "",
-            f'--output={output_format}' if output_format else "",
-            command,
-        )
-        response = ssh.command(
-            cmd.encode('utf-8'),
-            hostname=hostname or cls.hostname or settings.server.hostname,
-            output_format=output_format,
-            timeout=timeout,
-        )
+        hostname = hostname or cls.hostname or settings.server.hostname
+
+        # hammer shell reads one command per line and can't time a single command
+        if (
+            settings.performance.hammer_transport == 'shell'
+            and not settings.performance.time_hammer
+            and '\n' not in command
+        ):
+            response = hammer_shell.get_shell(
+                hostname, user=user, password=password, locale=settings.robottelo.locale
+            ).execute(
+                f'--output={output_format} {command}' if output_format else command,
+                timeout=timeout,
+                output_format=output_format,
+            )
+        else:
+            cmd = cls._hammer_command(command, user, password, output_format)
+            response = ssh.command(
+                cmd.encode('utf-8'),
+                hostname=hostname,
+                output_format=output_format,
+                timeout=timeout,
+            )
+            if settings.performance.time_hammer:
+                cls._record_timing(command, response)
         if return_raw_response:
             return response
         else:
-            return cls._handle_response(response, ignore_stderr=ignore_stderr)
+            return cls._handle_response(response, ignore_stderr=ignore_stderr, command=command)
+
+    @classmethod
+    def execute_many(
+        cls,
+        commands,
+        hostname=None,
+        user=None,
+        password=None,
+        output_format=None,
+        timeout=None,
+        ignore_stderr=None,
+        return_raw_response=None,
+        stop_on_failure=True,
+    ):
+        """Executes several cli ``commands`` on the server in a single ssh invocation
+
+        :param commands: a list of commands built by ``_construct_command``
+        :param stop_on_failure: do not run the commands following a failed one
+        :return: a list with the result of each command which was run, in order.
+            See :class:`HammerBatch` for the other parameters.
+        """
+        with cls.batch(
+            hostname=hostname,
+            user=user,
+            password=password,
+            timeout=timeout,
+            return_raw_response=return_raw_response,
+            stop_on_failure=stop_on_failure,
+        ) as batch:
+            for command in commands:
+                batch.add(command, output_format=output_format, ignore_stderr=ignore_stderr)
+        return batch.results
+
+    @classmethod
+    def batch(cls, **kwargs):
+        """Return a :class:`HammerBatch` for this cli class
+
+        Usage::
+
+            with ContentView.batch() as batch:
+                for repo_id in repo_ids:
+                    batch.add(
+                        ContentView._construct_command(
+                            {'id': cv_id, 'repository-id': repo_id},
+                            command_sub='add-repository',
+                        )
+                    )
+            results = batch.results
+        """
+        return HammerBatch(cls, **kwargs)
 
     @classmethod
     def sm_execute(cls, command, hostname=None, timeout=None, **kwargs):
@@ -248,17 +361,22 @@ class Base:
 
     @classmethod
     def info(cls, options=None, output_format=None, return_raw_response=None):
-        """Reads the entity information."""
-        cls.command_sub = 'info'
+        """Reads the entity information.
 
+        The human readable output is parsed with :func:`robottelo.cli.hammer.parse_info`,
+        unless ``settings.performance.hammer_json_output`` is set, then ``--output=json``
+        is requested instead.
+        """
         if options is None:
             options = {}
 
         if cls.command_requires_org and 'organization-id' not in options:
             raise CLIError(f'organization-id option is required for {cls.__name__}.info')
 
+        if output_format is None and settings.performance.hammer_json_output:
+            output_format = 'json'
         result = cls.execute(
-            command=cls._construct_command(options),
+            command=cls._construct_command(options, command_sub='info'),
             output_format=output_format,
             return_raw_response=return_raw_response,
         )
@@ -266,6 +384,44 @@ class Base:
             result = hammer.parse_info(result)
         return result
 
+    @classmethod
+    def iter_list(cls, options=None, per_page=1000, prefetch=False):
+        """Iterate over the entities of ``list``, fetching one page at a time.
+
+        Pages are requested with ``--page`` and ``--per-page`` only when the previous one
+        is exhausted, so breaking out of the loop early skips the remaining pages.
+
+        :param options: options passed to ``list``, ``page`` and ``per-page`` are set here
+        :param int per_page: number of entities fetched per hammer call
+        :param bool prefetch: fetch the next page in a background thread while the
+            current one is consumed
+        :return: a generator of the listed entities
+        """
+        options = dict(options or {})
+        options.pop('page', None)
+        options['per-page'] = per_page
+
+        def fetch(page):
+            return cls.list({**options, 'page': page}) or []
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page, next_page = 1, None
+            while True:
+                rows = next_page.result() if next_page is not None else fetch(page)
+                last = len(rows) < per_page
+                page += 1
+                if executor and not last:
+                    next_page = executor.submit(fetch, page)
+                else:
+                    next_page = None
+                yield from rows
+                if last:
+                    return
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
     @classmethod
     def list(cls, options=None, per_page=True, output_format='csv'):
         """
@@ -273,8 +429,6 @@ class Base:
         @param options: ID (sometimes name works as well) to retrieve info.
         """
 
-        cls.command_sub = 'list'
-
         if options is None:
             options = {}
 
@@ -287,7 +441,9 @@ class Base:
         # if cls.command_requires_org and 'organization-id' not in options:
         #     raise CLIError(f'organization-id option is required for {cls.__name__}.list')
 
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command(options, command_sub='list'), output_format=output_format
+        )
 
     @classmethod
     def puppetclasses(cls, options=None):
@@ -295,9 +451,9 @@ class Base:
         Lists all puppet classes.
         """
 
-        cls.command_sub = 'puppet-classes'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='puppet-classes'), output_format='csv'
+        )
 
     @classmethod
     def remove_operating_system(cls, options=None):
@@ -305,9 +461,7 @@ class Base:
         Removes OS from record.
         """
 
-        cls.command_sub = 'remove-operatingsystem'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='remove-operatingsystem'))
 
     @classmethod
     def sc_params(cls, options=None):
@@ -315,9 +469,9 @@ class Base:
         Lists all smart class parameters.
         """
 
-        cls.command_sub = 'sc-params'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='sc-params'), output_format='csv'
+        )
 
     @classmethod
     def set_parameter(cls, options=None):
@@ -325,9 +479,7 @@ class Base:
         Creates or updates parameter for a record.
         """
 
-        cls.command_sub = 'set-parameter'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='set-parameter'))
 
     @classmethod
     def update(cls, options=None, return_raw_response=None):
@@ -335,10 +487,8 @@ class Base:
         Updates existing record.
         """
 
-        cls.command_sub = 'update'
-
         return cls.execute(
-            cls._construct_command(options),
+            cls._construct_command(options, command_sub='update'),
             output_format='csv',
             return_raw_response=return_raw_response,
         )
@@ -359,13 +509,33 @@ class Base:
         return Wrapper
 
     @classmethod
-    def _construct_command(cls, options=None):
-        """Build a hammer cli command based on the options passed"""
+    def _construct_command(
+        cls, options=None, command_sub=None, command_end=None, command_base=None
+    ):
+        """Build a hammer cli command based on the options passed
+
+        The command parts are passed per call rather than set on the class, so concurrent
+        calls on the same class never see each other's subcommand.
+
+        :param command_sub: the subcommand, defaults to the ``command_sub`` attribute
+        :param command_end: the trailing arguments, defaults to the ``command_end`` attribute
+        :param command_base: the hammer resource, defaults to the ``command_base`` attribute
+        :raises robottelo.exceptions.CLIUnknownOptionError: if the cached hammer schema
+            says the command does not accept one of the options, see
+            :mod:`robottelo.cli.hammer_schema`
+        """
         tail = ''
+        command_sub = command_sub or cls.command_sub
+        command_end = command_end or cls.command_end
+        command_base = command_base or cls.command_base
 
         if options is None:
             options = {}
 
+        hammer_schema.check_options(
+            f"{command_base or ''} {command_sub or ''}",
+            (key for key, val in options.items() if val is not None and val is not False),
+        )
         for key, val in options.items():
             if val is None:
                 continue
@@ -375,6 +545,142 @@ class Base:
                 if isinstance(val, list):
                     val = ','.join(str(el) for el in val)
                 tail += f' --{key}="{val}"'
-        cmd = f"{cls.command_base or ''} {cls.command_sub or ''} {tail.strip()} {cls.command_end or ''}"
+        cmd = f"{command_base or ''} {command_sub or ''} {tail.strip()} {command_end or ''}"
 
         return cmd
+
+
+class HammerBatch:
+    """Queue of hammer commands executed on the server in a single ssh invocation
+
+    The queued commands are run one after another by a remote shell script, which then
+    prints the stdout, stderr and exit status of each command between delimiter lines.
+    Used as a context manager, the batch is executed when the block exits without error
+    and the results are stored in :attr:`results`.
+
+    :param cli_cls: the :class:`Base` subclass handling the responses
+    :param hostname: the server to run the commands on
+    :param user: hammer username, see ``Base._get_username_password``
+    :param password: hammer password, see ``Base._get_username_password``
+    :param timeout: time to wait for the whole batch to finish
+    :param return_raw_response: return the result objects instead of the handled output
+    :param stop_on_failure: do not run the commands following a failed one
+    """
+
+    def __init__(
+        self,
+        cli_cls,
+        hostname=None,
+        user=None,
+        password=None,
+        timeout=None,
+        return_raw_response=None,
+        stop_on_failure=True,
+    ):
+        self.cli_cls = cli_cls
+        self.hostname = hostname
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self.return_raw_response = return_raw_response
+        self.stop_on_failure = stop_on_failure
+        self.results = None
+        self._commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_args):
+        if exc_type is None:
+            self.execute()
+
+    def add(self, command, output_format=None, ignore_stderr=None):
+        """Queue a command built by ``_construct_command``
+
+        :return: the index of the command result in :attr:`results`
+        """
+        self._commands.append((command, output_format, ignore_stderr))
+        return len(self._commands) - 1
+
+    def _script(self, token):
+        """Build the remote script running all the queued commands"""
+        if self.cli_cls.omitting_credentials:
+            user, password = None, None
+        else:
+            user, password = self.cli_cls._get_username_password(self.user, self.password)
+        lines = ['__batch_dir=$(mktemp -d)', '(']
+        for index, (command, output_format, _) in enumerate(self._commands):
+            hammer_cmd = self.cli_cls._hammer_command(command, user, password, output_format)
+            line = (
+                f'{{ {hammer_cmd}; }} >$__batch_dir/{index}.out 2>$__batch_dir/{index}.err; '
+                f'__batch_rc=$?; echo $__batch_rc >$__batch_dir/{index}.rc'
+            )
+            if self.stop_on_failure:
+                line += '; [ $__batch_rc -eq 0 ] || exit $__batch_rc'
+            lines.append(line)
+        lines.append(')')
+        lines.append(
+            f'for i in $(seq 0 {len(self._commands) - 1}); do '
+            '[ -f $__batch_dir/$i.rc ] || break; '
+            f'printf "\\n{token} %s stdout\\n" $i; cat $__batch_dir/$i.out; '
+            f'printf "\\n{token} %s stderr\\n" $i; cat $__batch_dir/$i.err; '
+            f'printf "\\n{token} %s status %s\\n" $i $(cat $__batch_dir/$i.rc); '
+            'done'
+        )
+        lines.append('rm -rf $__batch_dir')
+        return '\n'.join(lines)
+
+    def _parse(self, response, token):
+        """Split the batch output into one result object per command which was run"""
+        marker = re.compile(rf'\n{token} (\d+) (stdout|stderr|status)(?: (-?\d+))?\n')
+        parts = marker.split(response.stdout)
+        if len(parts) < 2:
+            raise CLIReturnCodeError(
+                response.status,
+                response.stderr,
+                f'hammer batch of {len(self._commands)} commands failed to run\n'
+                f'stderr contains:\n{response.stderr}',
+            )
+        outputs = {}
+        # parts[0] is empty, followed by groups of (index, stream, status, text)
+        for index, stream, status, text in zip(*[iter(parts[1:])] * 4, strict=True):
+            output = outputs.setdefault(int(index), {})
+            if stream == 'status':
+                output['status'] = int(status)
+            else:
+                output[stream] = text
+        results = []
+        for index in sorted(outputs):
+            output_format = self._commands[index][1]
+            result = Result(**outputs[index])
+            results.append(ssh.parse_output(result, output_format))
+        return results
+
+    def execute(self):
+        """Run the queued commands and return their results in order
+
+        Unless ``return_raw_response`` is set, the responses are handled by the cli class
+        ``_handle_response``, so the error of the first failed command is raised.
+        """
+        if not self._commands:
+            self.results = []
+            return self.results
+        token = f'__hammer_batch_{uuid.uuid4().hex}'
+        response = ssh.command(
+            self._script(token).encode('utf-8'),
+            hostname=self.hostname or self.cli_cls.hostname or settings.server.hostname,
+            timeout=self.timeout,
+        )
+        results = self._parse(response, token)
+        if settings.performance.time_hammer:
+            for result, (command, _, _) in zip(results, self._commands, strict=False):
+                self.cli_cls._record_timing(command, result)
+        if not self.return_raw_response:
+            results = [
+                self.cli_cls._handle_response(result, ignore_stderr=ignore_stderr, command=command)
+                for result, (command, _, ignore_stderr) in zip(
+                    results, self._commands, strict=False
+                )
+            ]
+        self.results = results
+        return self.results
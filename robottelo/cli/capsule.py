@@ -33,9 +33,10 @@ class Capsule(Base):
     def content_add_lifecycle_environment(cls, options):
         """Add lifecycle environments to the capsule."""
 
-        cls.command_sub = 'content add-lifecycle-environment'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='content add-lifecycle-environment'),
+            output_format='csv',
+        )
 
         return result
 
@@ -43,9 +44,10 @@ class Capsule(Base):
     def content_available_lifecycle_environments(cls, options):
         """List the lifecycle environments not attached to the capsule."""
 
-        cls.command_sub = 'content available-lifecycle-environments'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='content available-lifecycle-environments'),
+            output_format='csv',
+        )
 
         return result
 
@@ -53,9 +55,9 @@ class Capsule(Base):
     def content_info(cls, options):
         """Get current capsule synchronization status."""
 
-        cls.command_sub = 'content info'
-
-        result = cls.execute(cls._construct_command(options), output_format='json')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='content info'), output_format='json'
+        )
 
         return result
 
@@ -63,9 +65,10 @@ class Capsule(Base):
     def content_lifecycle_environments(cls, options):
         """List the lifecycle environments attached to the capsule."""
 
-        cls.command_sub = 'content lifecycle-environments'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='content lifecycle-environments'),
+            output_format='csv',
+        )
 
         return result
 
@@ -73,9 +76,10 @@ class Capsule(Base):
     def content_remove_lifecycle_environment(cls, options):
         """Remove lifecycle environments from the capsule."""
 
-        cls.command_sub = 'content remove-lifecycle-environment'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='content remove-lifecycle-environment'),
+            output_format='csv',
+        )
 
         return result
 
@@ -83,9 +87,10 @@ class Capsule(Base):
     def content_synchronization_status(cls, options):
         """Get current capsule synchronization status."""
 
-        cls.command_sub = 'content synchronization-status'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='content synchronization-status'),
+            output_format='csv',
+        )
 
         return result
 
@@ -93,10 +98,8 @@ class Capsule(Base):
     def content_synchronize(cls, options, return_raw_response=None, timeout=3600000):
         """Synchronize the content to the capsule."""
 
-        cls.command_sub = 'content synchronize'
-
         result = cls.execute(
-            cls._construct_command(options),
+            cls._construct_command(options, command_sub='content synchronize'),
             output_format='csv',
             ignore_stderr=True,
             return_raw_response=return_raw_response,
@@ -109,9 +112,10 @@ class Capsule(Base):
     def content_update_counts(cls, options):
         """Trigger content counts update."""
 
-        cls.command_sub = 'content update-counts'
-
-        result = cls.execute(cls._construct_command(options), output_format='json')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='content update-counts'),
+            output_format='json',
+        )
 
         return result
 
@@ -119,9 +123,9 @@ class Capsule(Base):
     def import_classes(cls, options):
         """Import puppet classes from puppet Capsule."""
 
-        cls.command_sub = 'import-classes'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='import-classes'), output_format='csv'
+        )
 
         return result
 
@@ -129,8 +133,8 @@ class Capsule(Base):
     def refresh_features(cls, options):
         """Refresh capsule features."""
 
-        cls.command_sub = 'refresh-features'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='refresh-features'), output_format='csv'
+        )
 
         return result
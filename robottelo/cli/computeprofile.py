@@ -31,5 +31,6 @@ class ComputeProfile(Base):
     @classmethod
     def values_create(cls, options=None):
         """Create Compute profile values"""
-        cls.command_sub = 'values create'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='values create'), output_format='csv'
+        )
@@ -35,17 +35,19 @@ class ContentExport(Base):
         """
         List previous exports
         """
-        cls.command_sub = 'list'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command(options, command_sub='list'), output_format=output_format
+        )
 
     @classmethod
     def completeLibrary(cls, options, output_format='json', timeout=None):
         """
         Make full library export
         """
-        cls.command_sub = 'complete library'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='complete library'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -53,9 +55,10 @@ class ContentExport(Base):
         """
         Make full repository export
         """
-        cls.command_sub = 'complete repository'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='complete repository'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -63,9 +66,10 @@ class ContentExport(Base):
         """
         Make full CV version export
         """
-        cls.command_sub = 'complete version'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='complete version'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -73,9 +77,10 @@ class ContentExport(Base):
         """
         Make incremental library export
         """
-        cls.command_sub = 'incremental library'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='incremental library'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -83,9 +88,10 @@ class ContentExport(Base):
         """
         Make incremental repository export
         """
-        cls.command_sub = 'incremental repository'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='incremental repository'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -93,9 +99,10 @@ class ContentExport(Base):
         """
         Make incremental CV version export
         """
-        cls.command_sub = 'incremental version'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='incremental version'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -103,5 +110,7 @@ class ContentExport(Base):
         """
         Generates export metadata
         """
-        cls.command_sub = 'generate-metadata'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command(options, command_sub='generate-metadata'),
+            output_format=output_format,
+        )
@@ -32,29 +32,39 @@ class ContentImport(Base):
         """
         List previous imports
         """
-        cls.command_sub = 'list'
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(
+            cls._construct_command(options, command_sub='list'), output_format='json'
+        )
 
     @classmethod
     def library(cls, options, timeout=None):
         """
         Make library import
         """
-        cls.command_sub = 'library'
-        return cls.execute(cls._construct_command(options), output_format='json', timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='library'),
+            output_format='json',
+            timeout=timeout,
+        )
 
     @classmethod
     def version(cls, options, timeout=None):
         """
         Make CV version export
         """
-        cls.command_sub = 'version'
-        return cls.execute(cls._construct_command(options), output_format='json', timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='version'),
+            output_format='json',
+            timeout=timeout,
+        )
 
     @classmethod
     def repository(cls, options, timeout=None):
         """
         Make a repository import
         """
-        cls.command_sub = 'repository'
-        return cls.execute(cls._construct_command(options), output_format='json', timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='repository'),
+            output_format='json',
+            timeout=timeout,
+        )
@@ -40,8 +40,7 @@ class Defaults(Base):
                                           providers see `hammer defaults
                                           providers`.
         """
-        cls.command_sub = 'add'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='add'))
 
     @classmethod
     def delete(cls, options=None):
@@ -54,5 +53,4 @@ class Defaults(Base):
 
             --param-name OPTION_NAME      The name of the default option
         """
-        cls.command_sub = 'delete'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='delete'))
@@ -27,5 +27,7 @@ class Filter(Base):
 
     @classmethod
     def available_permissions(cls, options=None):
-        cls.command_sub = 'available-permissions'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='available-permissions'),
+            output_format='csv',
+        )
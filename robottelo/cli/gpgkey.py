@@ -33,6 +33,6 @@ class GPGKey(Base):
         Gets information for GPG Key
         """
 
-        cls.command_sub = 'info'
-
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(
+            cls._construct_command(options, command_sub='info'), output_format='json'
+        )
@@ -1,63 +1,175 @@
 """Helpers to interact with hammer command line utility."""
+from collections.abc import Mapping
 import csv
+import itertools
 import json
 import re
 
+PUPPET_DEPRECATION_WARNING = 'Puppet and OSTree will no longer be supported in Katello 3.16\n'
+# the trailer ``time -p`` appends to stderr
+TIME_P_REGEX = re.compile(
+    r'(?:^|\n)real (?P<real>[\d.]+)\nuser (?P<user>[\d.]+)\nsys (?P<sys>[\d.]+)\n?$'
+)
+
 
 def _normalize(header):
     """Replace empty spaces with '-' and lower all chars"""
     return header.replace(' ', '-').lower()
 
 
+def _normalize_pairs(pairs):
+    """Build a JSON object with normalized keys, see :func:`parse_json`"""
+    return {_normalize(key): value for key, value in pairs}
+
+
 def parse_json(stdout):
     """Parse JSON output from Hammer CLI and convert it to python dictionary
     while normalizing keys.
+
+    Keys are normalized and integers converted to strings while decoding, so the output
+    is walked only once.
     """
     new_object_index = stdout.find('\n}\n{')
     if new_object_index > -1:
         stdout = stdout[new_object_index + 3 :]  # noqa: E203
-    parsed = json.loads(stdout)
-    return _normalize_obj(parsed)
+    # integers are converted to conform to csv parser
+    return json.loads(stdout, parse_int=str, object_pairs_hook=_normalize_pairs)
+
+
+def _first_line(output):
+    """Return the first line of ``output`` without scanning the rest of it"""
+    end = output.find('\n')
+    return output if end == -1 else output[:end]
 
 
-def _normalize_obj(obj):
-    """Normalize all dict's keys replacing empty spaces with "-" and lowering
-    chars
+def _iter_lines(output):
+    """Lazily yield the lines of ``output``, keeping the line endings"""
+    start, size = 0, len(output)
+    while start < size:
+        end = output.find('\n', start) + 1 or size
+        yield output[start:end]
+        start = end
+
+
+def _is_csv_header_field(field):
+    """A hammer column title, e.g. ``Content View``, is not surrounded by spaces and is
+    not a ``label:`` or a ``Warning: ...`` message"""
+    return bool(field) and field == field.strip() and not field.endswith(':') and ': ' not in field
+
+
+def _is_csv_header(fields):
+    """A hammer CSV header has at least one column, all of them column titles
+
+    Single column outputs, e.g. ``Message`` or ``Repository created.``, are CSV too.
     """
-    if isinstance(obj, dict):
-        return {_normalize(k): _normalize_obj(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_normalize_obj(v) for v in obj]
-    # doing this to conform to csv parser
-    elif isinstance(obj, int) and not isinstance(obj, bool):
-        return str(obj)
-    return obj
+    return bool(fields) and all(_is_csv_header_field(field) for field in fields)
 
 
 def is_csv(output):
-    """Verifies if the output string is eligible for converting into CSV"""
-    sniffer = csv.Sniffer()
-    try:
-        sniffer.sniff(output)
-        return True
-    except csv.Error:
-        return False
+    """Verifies if the output string is eligible for converting into CSV
+
+    Only the header line is checked, so this is cheap even for huge outputs.
+    """
+    return _is_csv_header(next(csv.reader([_first_line(output)]), None))
+
+
+class CSVRecord(Mapping):
+    """Read-only row of hammer CSV output.
+
+    The values are kept in a tuple and the keys are shared by every row of the same
+    output, so a record is much smaller than a dict. Records compare equal to dicts with
+    the same items. Use :meth:`with_keys` to get the record class of a header.
+    """
+
+    __slots__ = ('_values',)
+    _index = {}
+
+    def __init__(self, values):
+        values = tuple(values)
+        if len(values) != len(self._index):
+            raise ValueError(f'Expected {len(self._index)} values, got {len(values)}')
+        self._values = values
+
+    @classmethod
+    def with_keys(cls, keys):
+        """Return a record class for rows with the given keys"""
+        return type(
+            cls.__name__, (cls,), {'__slots__': (), '_index': {k: i for i, k in enumerate(keys)}}
+        )
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
 
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self)!r})'
 
-def parse_csv(output):
-    """Parse CSV output from Hammer CLI and convert it to python dictionary."""
+
+def iter_csv(output, compact=False):
+    """Lazily parse CSV output from Hammer CLI.
+
+    Rows are parsed one at a time while the result is iterated, without copying or
+    splitting ``output`` first.
+
+    :param str output: the hammer command output
+    :param bool compact: yield :class:`CSVRecord` rows instead of dicts
+    :return: an iterator over the rows, keyed by the normalized header names
+    :raises ValueError: if ``output`` is not CSV
+    """
     # ignore warning about puppet and ostree deprecation
-    output.replace('Puppet and OSTree will no longer be supported in Katello 3.16\n', '')
-    is_rex = True if 'Job invocation' in output else False
-    # Validate if the output is eligible for CSV conversions else return as it is
-    if not is_csv(output) and not is_rex:
-        return output
-    output = output.splitlines()[0:2] if is_rex else output.splitlines()
-    reader = csv.reader(output)
+    if PUPPET_DEPRECATION_WARNING in output:
+        output = output.replace(PUPPET_DEPRECATION_WARNING, '')
+    # remote execution outputs a summary after the first row
+    is_rex = 'Job invocation' in output
+    reader = csv.reader(_iter_lines(output))
+    header = next(reader, None)
+    if header is None or not (is_rex or _is_csv_header(header)):
+        raise ValueError('Output is not hammer CSV')
     # Generate the key names, spaces will be converted to dashes "-"
-    keys = [_normalize(header) for header in next(reader)]
+    keys = [_normalize(field) for field in header]
+    if is_rex:
+        reader = itertools.islice(reader, 1)
+    if compact:
+        record = CSVRecord.with_keys(keys)
+        return (record(values) for values in reader if values)
     # For each entry, create a dict mapping each key with each value
-    return [dict(zip(keys, values, strict=True)) for values in reader if len(values) > 0]
+    return (dict(zip(keys, values, strict=True)) for values in reader if values)
+
+
+def parse_csv(output, compact=False):
+    """Parse CSV output from Hammer CLI and convert it to python dictionary.
+
+    The first line is taken as the header when it looks like hammer column titles, so a
+    header without rows, e.g. ``Repository created.``, gives an empty list. Output which is
+    not CSV, e.g. a message or rows not as wide as the header, is returned as it is.
+
+    :param str output: the hammer command output
+    :param bool compact: return :class:`CSVRecord` rows instead of dicts, see
+        :func:`iter_csv`
+    """
+    try:
+        return list(iter_csv(output, compact=compact))
+    except ValueError:
+        return output
+
+
+def parse_time_p(stderr):
+    """Split the ``time -p`` trailer from the stderr of a command
+
+    :param str stderr: stderr of a command run with ``time -p``
+    :return: a tuple with the stderr without the trailer and a dict with the ``real``,
+        ``user`` and ``sys`` times in seconds, or ``None`` when there is no trailer
+    """
+    match = TIME_P_REGEX.search(stderr)
+    if match is None:
+        return stderr, None
+    timing = {key: float(value) for key, value in match.groupdict().items()}
+    return stderr[: match.start()] + ('\n' if match.group().startswith('\n') else ''), timing
 
 
 def parse_help(output):
@@ -73,8 +185,9 @@ def parse_help(output):
     contents = {'subcommands': [], 'options': []}
     option_regex = re.compile(
         r'^ (-(?P<shortname>\w), )?(--(\[.*?\])?(?P<name>[\w\[\]|-]+))?'
-        r'(, --(?P<deprecation_name>[\w-]+))?( (?P<value>[\w-]+))?\s+(?P<help>.*)$'
+        r'(?P<aliases>(, --[\w\[\]|-]+)*)( (?P<value>[\w-]+))?\s+(?P<help>.*)$'
     )
+    alias_regex = re.compile(r'--([\w\[\]|-]+)')
     subcommand_regex = re.compile(r'^ (?P<name>[\w-]+)?(, [\w-]+)?\s+(?P<description>.*)$')
 
     for line in output.splitlines():
@@ -109,6 +222,7 @@ def parse_help(output):
                 contents['options'].append(
                     {
                         'name': match.group('name'),
+                        'aliases': alias_regex.findall(match.group('aliases')),
                         'shortname': match.group('shortname'),
                         'value': match.group('value'),
                         'help': match.group('help'),
@@ -117,19 +231,24 @@ def parse_help(output):
 
     # handle multiple options disguised as one, e.g. --hostgroup[s|-ids|-titles]
     grouped_option_regex = re.compile(r'^(?P<prefix>[\w-]+)\[(?P<postfixes>\S+)\]$')
-    new_options = []
-    for option in contents['options']:
-        match = grouped_option_regex.search(option['name'])
+
+    def explode(name):
+        match = grouped_option_regex.search(name)
         if not match:
-            new_options.append(option)
-            continue
+            return [name]
         prefix = match.group('prefix')
         postfixes = match.group('postfixes').split('|')
         if postfixes[0].startswith('-'):
             postfixes.insert(0, '')
-        names = [f'{prefix}{postfix}' for postfix in postfixes]
-        exploded = [{**option, **{'name': name}} for name in names]
-        new_options.extend(exploded)
+        return [f'{prefix}{postfix}' for postfix in postfixes]
+
+    new_options = []
+    for option in contents['options']:
+        # other names of the option, e.g. --environment-id for --lifecycle-environment-id
+        aliases = [alias for name in option['aliases'] for alias in explode(name)]
+        new_options.extend(
+            {**option, **{'name': name, 'aliases': aliases}} for name in explode(option['name'])
+        )
     contents['options'] = new_options
 
     return contents
@@ -0,0 +1,144 @@
+"""On-disk cache of the hammer commands and the options they accept.
+
+The schema is the tree of ``hammer --help`` outputs parsed by
+:func:`robottelo.cli.hammer.parse_help`, as in ``tests/foreman/data/hammer_commands.json``.
+It is built once per Satellite version with :func:`build_schema`, e.g. by
+``scripts/hammer_command_tree.py``, and saved to ``settings.performance.hammer_schema_dir``.
+
+When a schema for ``settings.server.version.release`` exists there,
+:meth:`robottelo.cli.base.Base._construct_command` rejects options the hammer command does
+not accept with :class:`robottelo.exceptions.CLIUnknownOptionError`, without running it.
+"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import json
+from pathlib import Path
+import threading
+
+from robottelo import ssh
+from robottelo.cli import hammer
+from robottelo.exceptions import CLIUnknownOptionError
+from robottelo.logging import logger
+
+# hammer exits with EX_USAGE on unknown options
+EX_USAGE = 64
+
+
+def build_schema(hostname=None, max_workers=8, run_help=None):
+    """Walk every hammer command and subcommand concurrently and parse their help
+
+    :param str hostname: the Satellite to run ``hammer --help`` on
+    :param int max_workers: number of ``--help`` outputs fetched at once
+    :param run_help: callable returning the help output of a command path such as
+        ``repository synchronize``, defaults to running hammer over ssh on ``hostname``
+    :return: the command tree, the root being ``hammer`` itself
+    """
+    if run_help is None:
+
+        def run_help(path):
+            return ssh.command(f'hammer {path} --help', hostname=hostname).stdout
+
+    def visit(path, node):
+        node.update(hammer.parse_help(run_help(path)))
+        return [(f'{path} {sub["name"]}'.strip(), sub) for sub in node['subcommands']]
+
+    root = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(visit, '', root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending |= {executor.submit(visit, *child) for child in future.result()}
+    return root
+
+
+def schema_path(version, directory=None):
+    """Return the schema file of a Satellite version"""
+    if directory is None:
+        from robottelo.config import settings
+
+        directory = settings.performance.hammer_schema_dir
+    return Path(directory) / f'hammer-{version}.json' if directory else None
+
+
+def save_schema(tree, version, directory=None):
+    """Write the command tree returned by :func:`build_schema` to the cache"""
+    path = schema_path(version, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(tree, indent=2, sort_keys=True))
+    with _schemas_lock:
+        _schemas.pop(str(path), None)
+    return path
+
+
+def _flatten(tree):
+    """Map every command path, e.g. ``repository synchronize``, to its option names
+
+    The aliases of the options, e.g. ``--environment-id`` for ``--lifecycle-environment-id``,
+    are accepted names too. Trees recorded before they were parsed have no ``aliases``.
+    """
+    commands = {}
+    stack = [('', tree)]
+    while stack:
+        path, node = stack.pop()
+        commands[path] = frozenset(
+            name
+            for option in node.get('options', [])
+            for name in (option['name'], *option.get('aliases', ()))
+        )
+        stack.extend((f'{path} {sub["name"]}'.strip(), sub) for sub in node['subcommands'])
+    return commands
+
+
+_schemas = {}
+_schemas_lock = threading.Lock()
+
+
+def load_schema(version=None, directory=None):
+    """Return the flattened schema of a Satellite version, read from disk once
+
+    :return: a dict mapping command paths to the options they accept, ``None`` when no
+        schema was saved for ``version``
+    """
+    if version is None:
+        from robottelo.config import settings
+
+        version = settings.server.version.release
+    path = schema_path(version, directory)
+    if path is None:
+        return None
+    with _schemas_lock:
+        if str(path) not in _schemas:
+            try:
+                _schemas[str(path)] = _flatten(json.loads(path.read_text()))
+            except FileNotFoundError:
+                _schemas[str(path)] = None
+            else:
+                logger.debug(f'Loaded hammer schema {path}')
+        return _schemas[str(path)]
+
+
+def check_options(command, options, schema=None):
+    """Raise if the hammer ``command`` does not accept one of ``options``
+
+    Commands missing from the schema, e.g. ``satellite-maintain`` ones, are not checked.
+
+    :param str command: the command path, e.g. ``repository synchronize``
+    :param options: the option names, without the leading ``--``
+    :param schema: a schema returned by :func:`load_schema`, loaded when not given
+    :raises robottelo.exceptions.CLIUnknownOptionError: on the first unknown option
+    """
+    schema = load_schema() if schema is None else schema
+    command = ' '.join(command.split())
+    if not schema or command not in schema:
+        return
+    for option in options:
+        if option not in schema[command]:
+            stderr = (
+                f"Error: Unrecognised option '--{option}'.\n\nSee: 'hammer {command} --help'.\n"
+            )
+            raise CLIUnknownOptionError(
+                EX_USAGE,
+                stderr,
+                f'Command "{command}" does not accept option --{option}, '
+                'according to the cached hammer schema',
+            )
@@ -0,0 +1,230 @@
+"""Long-lived ``hammer shell`` transport for hammer cli commands.
+
+Starting hammer loads the whole Ruby stack and authenticates against the API, which
+usually takes much longer than the command itself. When
+``settings.performance.hammer_transport`` is set to ``shell``,
+:meth:`robottelo.cli.base.Base.execute` streams its commands into one ``hammer shell``
+process per Satellite hostname and credentials instead, see :func:`get_shell`.
+"""
+import atexit
+import threading
+import time
+import uuid
+
+from broker.helpers import Result, translate_timeout
+
+from robottelo import ssh
+from robottelo.logging import logger
+
+# returned by non-blocking ssh2 channel operations which would have blocked
+LIBSSH2_ERROR_EAGAIN = -37
+SENTINEL_PREFIX = '__robottelo_end_'
+STATUS_PREFIX = '__robottelo_status '
+# loaded by the shell ruby process with RUBYOPT, reports the exit status of every command
+SHELL_SCRIPT = f'''\
+# non-tty ruby buffers stdout, which would break the framing of the output
+$stdout.sync = true
+TracePoint.new(:end) do |tp|
+  next unless tp.self.name == 'HammerCLI::ShellMainCommand'
+  tp.disable
+  tp.self.singleton_class.prepend(Module.new do
+    def run(*args)
+      status = 1
+      status = super
+    rescue SystemExit => e
+      status = e.status
+      raise
+    ensure
+      $stderr.puts("{STATUS_PREFIX}#{{status.is_a?(Integer) ? status : 0}}")
+    end
+  end)
+end.enable
+'''
+
+
+class HammerShell:
+    """A ``hammer shell`` process kept open over a dedicated ssh session.
+
+    Commands are written to the shell stdin, one per line. ``hammer shell`` does not report
+    exit statuses, so every command is followed by a sentinel line naming a sub-command
+    that does not exist. The resulting error on stderr marks the end of the command output.
+    :data:`SHELL_SCRIPT` makes the shell write the exit status of every command to stderr,
+    the status and stderr of the command are then handled by
+    :meth:`robottelo.cli.base.Base._handle_response` as for a ``hammer`` invocation.
+
+    A shell which exited is restarted before the next command. A command which does not
+    finish within its timeout kills the shell and is reported with status -1.
+    """
+
+    prompt = 'hammer> '
+    shell_script = '/tmp/robottelo_hammer_shell.rb'
+    poll_interval = 0.01
+
+    def __init__(self, hostname, user=None, password=None, locale='en_US.UTF-8'):
+        self.hostname = hostname
+        self.user = user
+        self.password = password
+        self.locale = locale
+        self.restarts = 0
+        self._client = None
+        self._channel = None
+        self._lock = threading.Lock()
+
+    def _shell_command(self):
+        """The command starting ``hammer shell`` on the remote host"""
+        credentials = f'-u {self.user} -p {self.password}' if self.user else '--interactive no'
+        return f'LANG={self.locale} RUBYOPT=-r{self.shell_script} hammer -v {credentials} shell'
+
+    def _open_channel(self):
+        """Open a dedicated ssh session and start ``hammer shell`` on it"""
+        self._client = ssh.get_client(hostname=self.hostname)
+        self._client.execute(f"cat > {self.shell_script} << 'EOF'\n{SHELL_SCRIPT}EOF")
+        session = self._client.session.session
+        channel = session.open_session()
+        channel.execute(self._shell_command())
+        session.set_blocking(False)
+        return channel
+
+    @property
+    def alive(self):
+        return self._channel is not None and not self._channel.eof()
+
+    def start(self):
+        logger.debug(f'Starting hammer shell on {self.hostname}')
+        self._channel = self._open_channel()
+
+    def close(self):
+        """Terminate the shell process and its ssh session"""
+        channel, client = self._channel, self._client
+        self._channel = self._client = None
+        for resource in (channel, client):
+            if resource is None:
+                continue
+            try:
+                resource.close()
+            except Exception as err:
+                logger.debug(f'Failed to close hammer shell on {self.hostname}: {err}')
+
+    def restart(self):
+        self.close()
+        self.restarts += 1
+        self.start()
+
+    def _write(self, data):
+        data = data.encode('utf-8')
+        while data:
+            rc, written = self._channel.write(data)
+            if rc == LIBSSH2_ERROR_EAGAIN:
+                time.sleep(self.poll_interval)
+                continue
+            data = data[written:]
+
+    def _read_until(self, token, timeout):
+        """Read stdout and stderr until ``token`` shows up on stderr
+
+        :return: a tuple with stdout and stderr
+        :raises TimeoutError: when ``token`` was not received in time
+        :raises EOFError: when the shell exited before ``token`` was received
+        """
+        stdout, stderr = b'', b''
+        deadline = time.monotonic() + timeout if timeout else None
+        while token.encode() not in stderr:
+            out_size, out_data = self._channel.read()
+            err_size, err_data = self._channel.read_stderr()
+            if out_size > 0:
+                stdout += out_data
+            if err_size > 0:
+                stderr += err_data
+            if out_size > 0 or err_size > 0:
+                continue
+            if self._channel.eof():
+                raise EOFError(f'hammer shell on {self.hostname} exited unexpectedly')
+            if deadline and time.monotonic() > deadline:
+                raise TimeoutError(f'hammer shell command timed out after {timeout} seconds')
+            time.sleep(self.poll_interval)
+        # the ssh transport is ordered, anything written to stdout before the sentinel
+        # error is already buffered by libssh2
+        out_size, out_data = self._channel.read()
+        while out_size > 0:
+            stdout += out_data
+            out_size, out_data = self._channel.read()
+        return stdout.decode('utf-8'), stderr.decode('utf-8')
+
+    def _drain(self):
+        """Discard output left over from the previous sentinel, e.g. a trailing usage hint"""
+        for read in (self._channel.read, self._channel.read_stderr):
+            size, _ = read()
+            while size > 0:
+                size, _ = read()
+
+    def _clean_stdout(self, stdout, command):
+        """Drop shell prompts and echoed input from the command output"""
+        return ''.join(
+            line
+            for line in stdout.replace(self.prompt, '').splitlines(keepends=True)
+            if line.strip() != command.strip() and SENTINEL_PREFIX not in line
+        )
+
+    def _split_status(self, stderr):
+        """Return the command stderr without the status line, and the exit status"""
+        lines = stderr.splitlines(keepends=True)
+        statuses = [i for i, line in enumerate(lines) if line.startswith(STATUS_PREFIX)]
+        if not statuses:
+            # SHELL_SCRIPT could not hook the shell, e.g. with an unexpected hammer version
+            logger.warning(f'hammer shell on {self.hostname} did not report an exit status')
+            return stderr, 1 if stderr.strip() else 0
+        status = int(lines[statuses[-1]][len(STATUS_PREFIX) :])
+        return ''.join(line for line in lines if not line.startswith(STATUS_PREFIX)), status
+
+    def execute(self, command, timeout=None, output_format=None):
+        """Run a hammer command, without the leading ``hammer``, in the shell
+
+        :param str command: hammer arguments, e.g. ``--output=csv organization list``
+        :param timeout: time to wait for the command, see ``broker.helpers.translate_timeout``
+        :param str output_format: json, csv or None
+        :return: a ``broker.helpers.Result``
+        """
+        timeout = translate_timeout(timeout) / 1000 if timeout else None
+        token = f'{SENTINEL_PREFIX}{uuid.uuid4().hex}'
+        with self._lock:
+            if not self.alive:
+                if self._channel is not None:
+                    logger.warning(f'hammer shell on {self.hostname} died, restarting it')
+                    self.restart()
+                else:
+                    self.start()
+            self._drain()
+            self._write(f'{command}\n{token}\n')
+            try:
+                stdout, stderr = self._read_until(token, timeout)
+            except (TimeoutError, EOFError) as err:
+                logger.warning(f'{err}, restarting hammer shell on {self.hostname}')
+                self.restart()
+                return Result(stdout='', stderr=str(err), status=-1)
+        # everything from the sentinel error on is not part of the command output
+        stderr = stderr[: stderr.rfind('\n', 0, stderr.find(token)) + 1]
+        stderr, status = self._split_status(stderr)
+        result = Result(stdout=self._clean_stdout(stdout, command), stderr=stderr, status=status)
+        return ssh.parse_output(result, output_format)
+
+
+_shells = {}
+_shells_lock = threading.Lock()
+
+
+def get_shell(hostname, user=None, password=None, locale='en_US.UTF-8'):
+    """Return the ``hammer shell`` of this process for a Satellite and credentials"""
+    key = (hostname, user, password, locale)
+    with _shells_lock:
+        if key not in _shells:
+            _shells[key] = HammerShell(hostname, user=user, password=password, locale=locale)
+        return _shells[key]
+
+
+@atexit.register
+def close_shells():
+    """Terminate every ``hammer shell`` started by this process"""
+    with _shells_lock:
+        for shell in _shells.values():
+            shell.close()
+        _shells.clear()
@@ -0,0 +1,73 @@
+"""Collect the duration of hammer commands timed with ``time -p``.
+
+When ``settings.performance.time_hammer`` is set, :meth:`robottelo.cli.base.Base.execute`
+prefixes hammer with ``time -p``, strips the timing trailer from stderr and records it in
+:data:`collector`. The ``pytest_plugins.hammer_timing`` plugin reports the collected times
+at the end of the session.
+"""
+from collections import defaultdict
+import json
+import math
+import threading
+
+
+def _percentile(values, percent):
+    """Return the nearest-rank percentile of the sorted ``values``"""
+    return values[max(math.ceil(len(values) * percent / 100) - 1, 0)]
+
+
+class HammerTimings:
+    """Thread-safe store of hammer command timings keyed by ``command_base command_sub``"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = defaultdict(list)  # label -> [[real, user, sys]]
+
+    def record(self, label, real, user, sys):
+        """Record the times in seconds of one run of the ``label`` command"""
+        with self._lock:
+            self._samples[label].append([real, user, sys])
+
+    @property
+    def samples(self):
+        """A JSON serializable copy of the recorded samples, see :meth:`merge`"""
+        with self._lock:
+            return {label: list(samples) for label, samples in self._samples.items()}
+
+    def merge(self, samples):
+        """Add the samples of another collector, e.g. from a pytest-xdist worker"""
+        with self._lock:
+            for label, label_samples in samples.items():
+                self._samples[label].extend(label_samples)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        """Return the latency statistics of every command, slowest total first
+
+        :return: a dict mapping the command to its ``count``, ``total``, ``p50``, ``p95``
+            and ``max`` real time along with the ``user`` and ``sys`` totals, in seconds
+        """
+        summary = {}
+        for label, samples in self.samples.items():
+            real, user, sys = (sorted(times) for times in zip(*samples, strict=True))
+            summary[label] = {
+                'count': len(real),
+                'total': round(sum(real), 3),
+                'p50': _percentile(real, 50),
+                'p95': _percentile(real, 95),
+                'max': real[-1],
+                'user': round(sum(user), 3),
+                'sys': round(sum(sys), 3),
+            }
+        return dict(sorted(summary.items(), key=lambda item: item[1]['total'], reverse=True))
+
+    def write_report(self, path):
+        """Write :meth:`summary` as JSON to ``path``"""
+        with open(path, 'w') as report:
+            json.dump(self.summary(), report, indent=2)
+
+
+collector = HammerTimings()
@@ -33,20 +33,23 @@ class HostGroup(Base):
     @classmethod
     def ansible_roles_assign(cls, options):
         """Assigns Ansible roles to a hostgroup"""
-        cls.command_sub = 'ansible-roles assign'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ansible-roles assign'), output_format='csv'
+        )
 
     @classmethod
     def ansible_roles_remove(cls, options=None):
         """Disassociate an Ansible role"""
-        cls.command_sub = 'ansible-roles remove'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ansible-roles remove'), output_format='csv'
+        )
 
     @classmethod
     def ansible_roles_add(cls, options):
         """Associate an Ansible role"""
-        cls.command_sub = 'ansible-roles add'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ansible-roles add'), output_format='csv'
+        )
 
     @classmethod
     def sc_params(cls, options=None):
@@ -66,5 +69,6 @@ class HostGroup(Base):
             --per-page PER_PAGE               number of entries per request
             --search SEARCH                   filter results
         """
-        cls.command_sub = 'sc-params'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='sc-params'), output_format='csv'
+        )
@@ -28,11 +28,11 @@ class JobInvocation(Base):
     @classmethod
     def get_output(cls, options):
         """Get output of the job invocation"""
-        cls.command_sub = 'output'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='output'))
 
     @classmethod
     def create(cls, options):
         """Create a job"""
-        cls.command_sub = 'create'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='create'), output_format='csv'
+        )
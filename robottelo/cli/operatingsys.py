@@ -43,9 +43,7 @@ class OperatingSys(Base):
         Adds existing architecture to OS.
         """
 
-        cls.command_sub = 'add-architecture'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, command_sub='add-architecture'))
 
         return result
 
@@ -55,9 +53,9 @@ class OperatingSys(Base):
         Adds existing template to OS.
         """
 
-        cls.command_sub = 'add-provisioning-template'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, command_sub='add-provisioning-template')
+        )
 
         return result
 
@@ -67,9 +65,7 @@ class OperatingSys(Base):
         Adds existing partitioning table to OS.
         """
 
-        cls.command_sub = 'add-ptable'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, command_sub='add-ptable'))
 
         return result
 
@@ -79,9 +75,7 @@ class OperatingSys(Base):
         Removes architecture from OS.
         """
 
-        cls.command_sub = 'remove-architecture'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, command_sub='remove-architecture'))
 
         return result
 
@@ -91,9 +85,9 @@ class OperatingSys(Base):
         Removes template from OS.
         """
 
-        cls.command_sub = 'remove-provisioning-template'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, command_sub='remove-provisioning-template')
+        )
 
         return result
 
@@ -103,8 +97,6 @@ class OperatingSys(Base):
         Removes partitioning table from OS.
         """
 
-        cls.command_sub = 'remove-ptable '
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, command_sub='remove-ptable '))
 
         return result
@@ -37,9 +37,7 @@ class Product(Base):
         Delete assignment sync plan and product.
         """
 
-        cls.command_sub = 'remove-sync-plan'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, command_sub='remove-sync-plan'))
 
         return result
 
@@ -49,17 +47,16 @@ class Product(Base):
         Assign sync plan to product.
         """
 
-        cls.command_sub = 'set-sync-plan'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, command_sub='set-sync-plan'))
 
         return result
 
     @classmethod
     def synchronize(cls, options=None):
         """Synchronize a product."""
-        cls.command_sub = 'synchronize'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command(options, command_sub='synchronize'), ignore_stderr=True
+        )
 
     @classmethod
     def update_proxy(cls, options=None):
@@ -67,8 +64,6 @@ class Product(Base):
         Assign Http Proxy to products.
         """
 
-        cls.command_sub = 'update-proxy'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, command_sub='update-proxy'))
 
         return result
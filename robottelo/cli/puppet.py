@@ -38,5 +38,6 @@ class Puppet(Base):
              --puppet-class-id PUPPET_CLASS_ID  ID of Puppet class
              --search SEARCH                    filter results
         """
-        cls.command_sub = 'sc-params'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='sc-params'), output_format='csv'
+        )
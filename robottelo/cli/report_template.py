@@ -41,8 +41,6 @@ class ReportTemplate(Base):
         Creates a new record using the arguments passed via dictionary.
         """
 
-        cls.command_sub = 'create'
-
         if options is None:
             options = {}
 
@@ -73,7 +71,9 @@ class ReportTemplate(Base):
 
         options['file'] = layout
 
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='create'), output_format='csv'
+        )
 
         # Extract new object ID if it was successfully created
         if len(result) > 0 and 'id' in result[0]:
@@ -98,23 +98,19 @@ class ReportTemplate(Base):
     @classmethod
     def generate(cls, options=None):
         """Generate a report"""
-        cls.command_sub = 'generate'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='generate'))
 
     @classmethod
     def clone(cls, options=None):
         """Clone a report template"""
-        cls.command_sub = 'clone'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='clone'))
 
     @classmethod
     def report_data(cls, options=None):
         """Downloads a generated report"""
-        cls.command_sub = 'report-data'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='report-data'))
 
     @classmethod
     def schedule(cls, options=None):
         """Schedule generating of a report"""
-        cls.command_sub = 'schedule'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='schedule'))
@@ -28,38 +28,14 @@ class Repository(Base):
     """
 
     command_base = 'repository'
-    command_requires_org = True
-
-    @classmethod
-    def create(cls, options=None):
-        """Create a custom repository"""
-        cls.command_requires_org = False
-
-        try:
-            result = super().create(options)
-        finally:
-            cls.command_requires_org = True
-
-        return result
-
-    @classmethod
-    def info(cls, options=None):
-        """Show a custom repository"""
-        cls.command_requires_org = False
-
-        try:
-            result = super().info(options)
-        finally:
-            cls.command_requires_org = True
-
-        return result
+    # repository ids are global, create and info do not need the organization-id
+    command_requires_org = False
 
     @classmethod
     def synchronize(cls, options, return_raw_response=None, timeout=3600000):
         """Synchronizes a repository."""
-        cls.command_sub = 'synchronize'
         return cls.execute(
-            cls._construct_command(options),
+            cls._construct_command(options, command_sub='synchronize'),
             output_format='base',
             ignore_stderr=True,
             return_raw_response=return_raw_response,
@@ -69,11 +45,17 @@ class Repository(Base):
     @classmethod
     def remove_content(cls, options):
         """Remove content from a repository"""
-        cls.command_sub = 'remove-content'
-        return cls.execute(cls._construct_command(options), output_format='csv', ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command(options, command_sub='remove-content'),
+            output_format='csv',
+            ignore_stderr=True,
+        )
 
     @classmethod
     def upload_content(cls, options):
         """Upload content to repository."""
-        cls.command_sub = 'upload-content'
-        return cls.execute(cls._construct_command(options), output_format='csv', ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command(options, command_sub='upload-content'),
+            output_format='csv',
+            ignore_stderr=True,
+        )
@@ -51,8 +51,9 @@ class SmartClassParameter(Base):
             --smart-class-parameter[-id]  Name/Id of associated smart class parameter
             --value VALUE                 Override value, required if omit is false
         """
-        cls.command_sub = 'add-matcher'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='add-matcher'), output_format='csv'
+        )
 
     @classmethod
     def remove_matcher(cls, options=None):
@@ -70,5 +71,6 @@ class SmartClassParameter(Base):
             --puppet-class[-id]           Name/Id of associated puppetclass
             --smart-class-parameter[-id]  Name/Id of associated smart class parameter
         """
-        cls.command_sub = 'remove-matcher'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='remove-matcher'), output_format='csv'
+        )
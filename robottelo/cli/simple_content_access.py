@@ -17,6 +17,8 @@ Subcommands::
 
 """
 from robottelo.cli.base import Base
+from robottelo.config import settings
+from robottelo.utils import subscription_index
 
 
 class SimpleContentAccess(Base):
@@ -26,20 +28,42 @@ class SimpleContentAccess(Base):
 
     command_base = 'simple-content-access'
 
+    @classmethod
+    def _invalidate_subscription_index(cls, options):
+        """Drop the organization from the subscription index of the Satellite"""
+        subscription_index.invalidate(
+            cls.hostname or settings.server.hostname, (options or {}).get('organization-id')
+        )
+
     @classmethod
     def disable(cls, options=None, timeout=None):
         """Disable simple content access for a manifest"""
-        cls.command_sub = 'disable'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        try:
+            return cls.execute(
+                cls._construct_command(options, command_sub='disable'),
+                ignore_stderr=True,
+                timeout=timeout,
+            )
+        finally:
+            cls._invalidate_subscription_index(options)
 
     @classmethod
     def enable(cls, options=None, timeout=None):
         """Enable simple content access for a manifest"""
-        cls.command_sub = 'enable'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        try:
+            return cls.execute(
+                cls._construct_command(options, command_sub='enable'),
+                ignore_stderr=True,
+                timeout=timeout,
+            )
+        finally:
+            cls._invalidate_subscription_index(options)
 
     @classmethod
     def status(cls, options=None, timeout=None):
         """Check if the specified organization has Simple Content Access enabled"""
-        cls.command_sub = 'status'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='status'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
@@ -28,20 +28,17 @@ class AdvancedByTag(Base):
     @classmethod
     def post_migrations(cls, options=None):
         """Build satellite-maintain advanced procedure by-tag post-migrations"""
-        cls.command_sub = 'post-migrations'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='post-migrations'))
 
     @classmethod
     def pre_migrations(cls, options=None):
         """Build satellite-maintain advanced procedure by-tag pre-migrations"""
-        cls.command_sub = 'pre-migrations'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='pre-migrations'))
 
     @classmethod
     def restore(cls, options=None):
         """Build satellite-maintain advanced procedure by-tag restore"""
-        cls.command_sub = 'restore'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='restore'))
@@ -25,7 +25,8 @@ class Backup(Base):
     @classmethod
     def run_backup(cls, backup_dir='/tmp/', backup_type='online', options=None, timeout=None):
         """Build satellite-maintain backup online/offline/snapshot"""
-        cls.command_sub = backup_type
-        cls.command_end = backup_dir
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), timeout=timeout)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub=backup_type, command_end=backup_dir),
+            timeout=timeout,
+        )
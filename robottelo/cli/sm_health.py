@@ -25,20 +25,19 @@ class Health(Base):
     @classmethod
     def check(cls, options=None, env_var=None):
         """Build satellite-maintain health check"""
-        cls.command_sub = 'check'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command(options, command_sub='check'), env_var=env_var)
 
     @classmethod
     def list(cls, options=None, env_var=None):
         """Build satellite-maintain health list"""
-        cls.command_sub = 'list'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command(options, command_sub='list'), env_var=env_var)
 
     @classmethod
     def list_tags(cls, options=None, env_var=None):
         """Build satellite-maintain health list-tags"""
-        cls.command_sub = 'list-tags'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='list-tags'), env_var=env_var
+        )
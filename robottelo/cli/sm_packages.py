@@ -29,55 +29,45 @@ class Packages(Base):
     @classmethod
     def lock(cls, options=None):
         """Build satellite-maintain packages lock"""
-        cls.command_sub = 'lock'
-        cls.command_end = None
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='lock'))
 
     @classmethod
     def unlock(cls, options=None):
         """Build satellite-maintain packages unlock"""
-        cls.command_sub = 'unlock'
-        cls.command_end = None
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='unlock'))
 
     @classmethod
     def is_locked(cls, options=None):
         """Build satellite-maintain packages is-locked"""
-        cls.command_sub = 'is-locked'
-        cls.command_end = None
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='is-locked'))
 
     @classmethod
     def status(cls, options=None):
         """Build satellite-maintain packages status"""
-        cls.command_sub = 'status'
-        cls.command_end = None
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='status'))
 
     @classmethod
     def install(cls, packages='', options=None):
         """Build satellite-maintain packages install"""
-        cls.command_sub = 'install'
-        cls.command_end = packages
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='install', command_end=packages)
+        )
 
     @classmethod
     def update(cls, packages='', options=None):
         """Build satellite-maintain packages update"""
-        cls.command_sub = 'update'
-        cls.command_end = packages
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='update', command_end=packages)
+        )
 
     @classmethod
     def check_update(cls, options=None):
         """Build satellite-maintain packages check-update"""
-        cls.command_sub = 'check-update'
-        cls.command_end = None
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='check-update'))
@@ -23,7 +23,7 @@ class Restore(Base):
     @classmethod
     def run(cls, backup_dir='/tmp/', timeout='30m', options=None):
         """Build satellite-maintain restore"""
-        # cls.command_sub = 'No subcommand for restore'
-        cls.command_end = backup_dir
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), timeout=timeout)
+        return cls.sm_execute(
+            cls._construct_command(options, command_end=backup_dir), timeout=timeout
+        )
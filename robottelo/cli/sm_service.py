@@ -29,48 +29,49 @@ class Service(Base):
     @classmethod
     def start(cls, options=None, env_var=None):
         """Build satellite-maintain service start"""
-        cls.command_sub = 'start'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command(options, command_sub='start'), env_var=env_var)
 
     @classmethod
     def stop(cls, options=None, env_var=None):
         """Build satellite-maintain service stop"""
-        cls.command_sub = 'stop'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command(options, command_sub='stop'), env_var=env_var)
 
     @classmethod
     def restart(cls, options=None, env_var=None):
         """Build satellite-maintain service"""
-        cls.command_sub = 'restart'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='restart'), env_var=env_var
+        )
 
     @classmethod
     def status(cls, options=None, env_var=None):
         """Build satellite-maintain service status"""
-        cls.command_sub = 'status'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='status'), env_var=env_var
+        )
 
     @classmethod
     def enable(cls, options=None, env_var=None):
         """Build satellite-maintain service enable"""
-        cls.command_sub = 'enable'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='enable'), env_var=env_var
+        )
 
     @classmethod
     def disable(cls, options=None, env_var=None):
         """Build satellite-maintain service disable"""
-        cls.command_sub = 'disable'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='disable'), env_var=env_var
+        )
 
     @classmethod
     def list(cls, options=None, env_var=None):
         """Build satellite-maintain service list"""
-        cls.command_sub = 'list'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command(options, command_sub='list'), env_var=env_var)
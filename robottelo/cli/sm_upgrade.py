@@ -25,20 +25,19 @@ class Upgrade(Base):
     @classmethod
     def list_versions(cls, options=None, env_var=None):
         """Build satellite-maintain upgrade list-versions"""
-        cls.command_sub = 'list-versions'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='list-versions'), env_var=env_var
+        )
 
     @classmethod
     def check(cls, options=None, env_var=None):
         """Build satellite-maintain upgrade check"""
-        cls.command_sub = 'check'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command(options, command_sub='check'), env_var=env_var)
 
     @classmethod
     def run(cls, options=None, env_var=None):
         """Build satellite-maintain upgrade run"""
-        cls.command_sub = 'run'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command(options, command_sub='run'), env_var=env_var)
@@ -23,17 +23,17 @@ class Srpm(Base):
     @classmethod
     def info(cls, options=None):
         """Show a SRPM Info"""
-        cls.command_sub = 'info'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='info'), output_format='csv'
+        )
 
         return result
 
     @classmethod
     def list(cls, options=None):
         """List SRPMs"""
-        cls.command_sub = 'list'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='list'), output_format='csv'
+        )
 
         return result
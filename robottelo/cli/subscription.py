@@ -19,6 +19,8 @@ Subcommands::
 
 """
 from robottelo.cli.base import Base
+from robottelo.config import settings
+from robottelo.utils import subscription_index
 
 
 class Subscription(Base):
@@ -28,26 +30,54 @@ class Subscription(Base):
 
     command_base = 'subscription'
 
+    @classmethod
+    def _invalidate_subscription_index(cls, options):
+        """Drop the organization from the subscription index of the Satellite"""
+        subscription_index.invalidate(
+            cls.hostname or settings.server.hostname, (options or {}).get('organization-id')
+        )
+
     @classmethod
     def upload(cls, options=None, timeout=None):
         """Upload a subscription manifest."""
-        cls.command_sub = 'upload'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        try:
+            return cls.execute(
+                cls._construct_command(options, command_sub='upload'),
+                ignore_stderr=True,
+                timeout=timeout,
+            )
+        finally:
+            cls._invalidate_subscription_index(options)
 
     @classmethod
     def delete_manifest(cls, options=None, timeout=None):
         """Deletes a subscription manifest."""
-        cls.command_sub = 'delete-manifest'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        try:
+            return cls.execute(
+                cls._construct_command(options, command_sub='delete-manifest'),
+                ignore_stderr=True,
+                timeout=timeout,
+            )
+        finally:
+            cls._invalidate_subscription_index(options)
 
     @classmethod
     def refresh_manifest(cls, options=None, timeout=None):
         """Refreshes a subscription manifest."""
-        cls.command_sub = 'refresh-manifest'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        try:
+            return cls.execute(
+                cls._construct_command(options, command_sub='refresh-manifest'),
+                ignore_stderr=True,
+                timeout=timeout,
+            )
+        finally:
+            cls._invalidate_subscription_index(options)
 
     @classmethod
     def manifest_history(cls, options=None, timeout=None):
         """Provided history for subscription manifest"""
-        cls.command_sub = 'manifest-history'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='manifest-history'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
@@ -31,12 +31,12 @@ class TemplateInput(Base):
         Creates a new record using the arguments passed via dictionary.
         """
 
-        cls.command_sub = 'create'
-
         if options is None:
             options = {}
 
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command(options, command_sub='create'), output_format='csv'
+        )
 
         # Extract new object ID if it was successfully created
         if len(result) > 0 and 'id' in result[0]:
@@ -48,17 +48,13 @@ class TemplateSync(Base):
     @classmethod
     def exports(cls, options=None):
         """Export Satellite Templates to Git/Local Directory."""
-        cls.command_base = 'export-templates'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, command_base='export-templates'))
 
         return result
 
     @classmethod
     def imports(cls, options=None):
         """Import Satellite Templates to Git/Local Directory."""
-        cls.command_base = 'import-templates'
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, command_base='import-templates'))
 
         return result
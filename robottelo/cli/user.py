@@ -33,14 +33,16 @@ class User(Base):
     @classmethod
     def add_role(cls, options=None):
         """Add a role to a user."""
-        cls.command_sub = 'add-role'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='add-role'), output_format='csv'
+        )
 
     @classmethod
     def remove_role(cls, options=None):
         """Remove a role from user."""
-        cls.command_sub = 'remove-role'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='remove-role'), output_format='csv'
+        )
 
     @classmethod
     def ssh_keys_add(cls, options=None):
@@ -62,8 +64,9 @@ class User(Base):
         --user-id USER_ID
 
         """
-        cls.command_sub = 'ssh-keys add'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ssh-keys add'), output_format='csv'
+        )
 
     @classmethod
     def ssh_keys_delete(cls, options=None):
@@ -72,8 +75,9 @@ class User(Base):
         hammer user ssh-keys delete [OPTIONS]
 
         """
-        cls.command_sub = 'ssh-keys delete'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ssh-keys delete'), output_format='csv'
+        )
 
     @classmethod
     def ssh_keys_list(cls, options=None):
@@ -82,8 +86,9 @@ class User(Base):
         hammer user ssh-keys list [OPTIONS]
 
         """
-        cls.command_sub = 'ssh-keys list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ssh-keys list'), output_format='csv'
+        )
 
     @classmethod
     def ssh_keys_info(cls, options=None):
@@ -92,8 +97,9 @@ class User(Base):
         hammer user ssh-keys info [OPTIONS]
 
         """
-        cls.command_sub = 'ssh-keys info'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ssh-keys info'), output_format='csv'
+        )
 
     @classmethod
     def access_token(cls, action=None, options=None):
@@ -103,8 +109,10 @@ class User(Base):
 
         action: create | revoke
         """
-        cls.command_sub = f'access-token {action}'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub=f'access-token {action}'),
+            output_format='csv',
+        )
 
     @classmethod
     def mail_notification_add(cls, options=None):
@@ -129,5 +137,7 @@ class User(Base):
             --user[-id] VALUE
 
         """
-        cls.command_sub = 'mail-notification add'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='mail-notification add'),
+            output_format='csv',
+        )
@@ -24,8 +24,6 @@ class Webhook(Base):
     @classmethod
     def create(cls, options=None):
         """Create a webhook"""
-        cls.command_sub = 'create'
-
         if options is None:
             options = dict()
 
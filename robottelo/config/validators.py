@@ -32,9 +32,13 @@ VALIDATORS = dict(
         Validator('server.ssh_username', default='root'),
         Validator('server.ssh_password', default=None),
         Validator('server.verify_ca', default=False),
+        Validator('server.ssh_client.pool_size', default=8, gte=1),
+        Validator('server.ssh_client.pool_health_check_interval', default=60),
+        Validator('server.api_pool_size', default=10, gte=1),
     ],
     content_host=[
         Validator('content_host.default_rhel_version', must_exist=True),
+        Validator('content_host.warm_pool_size', default=0, gte=0),
     ],
     subscription=[
         Validator('subscription.rhn_username', must_exist=True),
@@ -61,10 +65,16 @@ VALIDATORS = dict(
         ),
         Validator('azurerm.azure_region', is_in=AZURERM_VALID_REGIONS),
     ],
-    broker=[Validator('broker.broker_directory', default='.')],
+    broker=[
+        Validator('broker.broker_directory', default='.'),
+        Validator('broker.checkin_workers', default=4, gte=0),
+        Validator('broker.checkin_queue_size', default=16, gte=1),
+    ],
     bugzilla=[
         Validator('bugzilla.url', default='https://bugzilla.redhat.com'),
         Validator('bugzilla.api_key', must_exist=True),
+        Validator('bugzilla.cache_ttl', default=3600, gte=0),
+        Validator('bugzilla.max_workers', default=4, gte=1),
     ],
     capsule=[
         Validator('capsule.version.release', must_exist=True),
@@ -239,7 +249,20 @@ VALIDATORS = dict(
             must_exist=True,
         ),
     ],
-    performance=[Validator('performance.time_hammer', default=False)],
+    performance=[
+        Validator('performance.time_hammer', default=False),
+        Validator('performance.hammer_transport', default='ssh', is_in=['ssh', 'shell']),
+        Validator('performance.hammer_json_output', default=False),
+        Validator('performance.hammer_schema_dir', default=None),
+        Validator('performance.task_poll_min_interval', default=1, gt=0),
+        Validator('performance.task_poll_max_interval', default=15, gt=0),
+        Validator('performance.async_repository_sync', default=True, is_type_of=bool),
+        Validator('performance.repository_sync_concurrency', default=4, gte=1),
+        Validator('performance.host_fan_out_concurrency', default=8, gte=1),
+        Validator('performance.registration_command_ttl', default=3600, gte=0),
+        Validator('performance.version_probe_timeout', default=30, gt=0),
+        Validator('performance.version_cache_ttl', default=0, gte=0),
+    ],
     report_portal=[
         Validator(
             'report_portal.portal_url',
@@ -324,6 +347,8 @@ VALIDATORS = dict(
         Validator('shared_function.redis_db', default=0),
         Validator('shared_function.call_retries', default=2),
         Validator('shared_function.redis_password', default=None),
+        Validator('shared_function.content_cache', default=False, is_type_of=bool),
+        Validator('shared_function.content_cache_timeout', default=86400, gt=0),
     ],
     upgrade=[
         Validator('upgrade.rhev_cap_host', must_exist=False)
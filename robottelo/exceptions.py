@@ -67,6 +67,15 @@ class DownloadFileError(Exception):
     """Indicates an error when failure in downloading file from server."""
 
 
+class HostsFanOutError(Exception):
+    """Indicates that a step run on several hosts failed on some of them"""
+
+    def __init__(self, results):
+        self.results = results
+        errors = '\n'.join(f'{result.host.hostname}: {result.error!r}' for result in results.errors)
+        super().__init__(f'{len(results.errors)} of {len(results)} hosts failed:\n{errors}')
+
+
 class CLIFactoryError(Exception):
     """Indicates an error occurred while creating an entity using hammer"""
 
@@ -113,6 +122,13 @@ class CLIReturnCodeError(CLIBaseError):
     """
 
 
+class CLIUnknownOptionError(CLIReturnCodeError):
+    """Error to be raised, without running hammer, for an option the hammer command
+    does not accept according to the cached hammer schema.
+    See: :mod:`robottelo.cli.hammer_schema`
+    """
+
+
 class CLIDataBaseError(CLIBaseError):
     """Error to be raised when an error occurs due to some missing parameter
     which cause a data base error on hammer
@@ -662,11 +662,10 @@ class APIFactory:
         :param int from_when: Epoch Time (seconds in UTC) to limit number of returned tasks to investigate.
         :param int search_rate: Delay between searches.
         :param int max_tries: How many times search should be executed.
-        :param int poll_rate: Delay between the end of one task check-up and
-                the start of the next check-up. Parameter for
-                ``nailgun.entities.ForemanTask.poll()`` method.
+        :param int poll_rate: Maximum delay between two check-ups of the tasks.
+                Parameter for ``sat.task_watcher.wait()`` method.
         :param int poll_timeout: Maximum number of seconds to wait until timing out.
-                Parameter for ``nailgun.entities.ForemanTask.poll()`` method.
+                Parameter for ``sat.task_watcher.wait()`` method.
         :return: Relevant errata applicability task.
         :raises: ``AssertionError``. If not tasks were found for given host until timeout.
         """
@@ -688,23 +687,24 @@ class APIFactory:
                 f' started_at >= "{long_format}" '
             )
             tasks = self._satellite.api.ForemanTask().search(query={'search': search_query})
-            tasks_finished = 0
-            for task in tasks:
+            host_tasks = [
+                task
+                for task in tasks
                 if (
                     task.label == 'Actions::Katello::Applicability::Hosts::BulkGenerate'
                     and 'host_ids' in task.input
                     and host_id in task.input['host_ids']
-                ):
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout)
-                    tasks_finished += 1
-                elif (
+                )
+                or (
                     task.label == 'Actions::Katello::Host::UploadPackageProfile'
                     and 'host' in task.input
                     and host_id == task.input['host']['id']
-                ):
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout)
-                    tasks_finished += 1
-            if tasks_finished > 0:
+                )
+            ]
+            if host_tasks:
+                self._satellite.task_watcher.wait(
+                    [task.id for task in host_tasks], timeout=poll_timeout, poll_rate=poll_rate
+                )
                 break
             time.sleep(search_rate)
         else:
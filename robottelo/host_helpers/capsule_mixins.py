@@ -41,10 +41,10 @@ class CapsuleInfo:
         :param search_query: Search query that will be passed to API call.
         :param search_rate: Delay between searches.
         :param max_tries: How many times search should be executed.
-        :param poll_rate: Delay between the end of one task check-up and
-            the start of the next check-up. Parameter for ``sat.api.ForemanTask.poll()`` method.
+        :param poll_rate: Maximum delay between two check-ups of the tasks.
+            Parameter for ``sat.task_watcher.wait()`` method.
         :param poll_timeout: Maximum number of seconds to wait until timing out.
-            Parameter for ``sat.api.ForemanTask.poll()`` method.
+            Parameter for ``sat.task_watcher.wait()`` method.
         :param must_succeed: Assert success result on finished task.
         :return: List of ``sat.api.ForemanTask`` entities.
         :raises: ``AssertionError``. If not tasks were found until timeout.
@@ -52,8 +52,12 @@ class CapsuleInfo:
         for _ in range(max_tries):
             tasks = self.satellite.api.ForemanTask().search(query={'search': search_query})
             if tasks:
-                for task in tasks:
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout, must_succeed=must_succeed)
+                self.satellite.task_watcher.wait(
+                    [task.id for task in tasks],
+                    timeout=poll_timeout,
+                    must_succeed=must_succeed,
+                    poll_rate=poll_rate,
+                )
                 break
             else:
                 time.sleep(search_rate)
@@ -77,8 +81,9 @@ class CapsuleInfo:
         )
 
         # Wait till capsule sync finishes and assert the sync task succeeded
-        for task in sync_status['active_sync_tasks']:
-            self.satellite.api.ForemanTask(id=task['id']).poll(timeout=timeout)
+        self.satellite.task_watcher.wait(
+            [task['id'] for task in sync_status['active_sync_tasks']], timeout=timeout
+        )
         sync_status = self.nailgun_capsule.content_get_sync()
         assert len(sync_status['last_failed_sync_tasks']) == 0
 
@@ -0,0 +1,112 @@
+"""Tear down and check in the hosts of finished tests in background threads.
+
+``host.teardown()`` unregisters a content host and deletes its host record from the
+Satellite, ``Broker.checkin`` then releases the host, both take long enough to delay the
+next test of the worker. :func:`checkin` queues both steps on a thread pool of
+``broker.checkin_workers`` threads instead. At most ``broker.checkin_queue_size`` hosts
+wait in the queue, a fixture queuing more blocks until a check-in finished. The queue is
+drained at the end of the session, failed check-ins are logged and reported then.
+"""
+from concurrent import futures
+from contextlib import contextmanager
+import threading
+
+from broker import Broker
+
+from robottelo.config import settings
+from robottelo.logging import logger
+
+
+class CheckinQueue:
+    """Bounded queue of hosts to tear down and check in
+
+    :param int workers: number of background threads, 0 checks the hosts in on the
+        calling thread and raises their errors
+    :param int size: maximum number of queued hosts
+    """
+
+    def __init__(self, workers=4, size=16):
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max(size, 1))
+        self._executor = None
+        self._lock = threading.Lock()
+        self.failures = []
+
+    def _checkin(self, host, teardown):
+        try:
+            if teardown:
+                host.teardown()
+        except Exception as err:
+            self._failed(host, 'teardown', err)
+        try:
+            Broker(hosts=[host]).checkin()
+        except Exception as err:
+            self._failed(host, 'checkin', err)
+
+    def _failed(self, host, step, err):
+        logger.warning(f'Background {step} of {host.hostname} failed: {err}')
+        with self._lock:
+            self.failures.append((host.hostname, step, str(err)))
+
+    def submit(self, host, teardown=True):
+        """Queue the teardown and check in of ``host``"""
+        if self.workers < 1:
+            try:
+                if teardown:
+                    host.teardown()
+            finally:
+                Broker(hosts=[host]).checkin()
+            return
+        self._slots.acquire()
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix='checkin'
+                )
+            future = self._executor.submit(self._checkin, host, teardown)
+        future.add_done_callback(lambda _: self._slots.release())
+
+    def drain(self):
+        """Wait for the queued check-ins, return the failures as (hostname, step, error)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        return list(self.failures)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_queue():
+    """Return the check-in queue of this process"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = CheckinQueue(
+                workers=settings.broker.checkin_workers, size=settings.broker.checkin_queue_size
+            )
+        return _queue
+
+
+def drain():
+    """Wait for the check-ins queued by this process, see :meth:`CheckinQueue.drain`"""
+    return _queue.drain() if _queue is not None else []
+
+
+def checkin(hosts, teardown=True):
+    """Queue the teardown and check in of ``hosts``, a host or a list of hosts"""
+    queue = get_queue()
+    for host in hosts if isinstance(hosts, list) else [hosts]:
+        queue.submit(host, teardown=teardown)
+
+
+@contextmanager
+def checked_out(broker):
+    """Like ``with broker as hosts`` with the teardown and check in queued on exit"""
+    hosts = broker.__enter__()
+    try:
+        yield hosts
+    finally:
+        checkin(hosts)
@@ -3,6 +3,7 @@ This module is a more object oriented replacement for robottelo.cli.factory
 It is not meant to be used directly, but as part of a robottelo.hosts.Satellite instance
 example: my_satellite.cli_factory.make_org()
 """
+from concurrent import futures
 import datetime
 from functools import lru_cache, partial
 import inspect
@@ -10,7 +11,9 @@ import os
 from os import chmod
 import pprint
 import random
+import re
 from tempfile import mkstemp
+import time
 from time import sleep
 
 from box import Box
@@ -29,8 +32,13 @@ from robottelo import constants
 from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import settings
 from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
+from robottelo.host_helpers import content_cache
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
+from robottelo.logging import logger
 from robottelo.utils.manifest import clone
+from robottelo.utils.step_graph import StepGraph
+
+_uuid_regex = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
 
 
 def create_object(cli_object, options, values=None, credentials=None):
@@ -548,33 +556,30 @@ class CLIFactory:
 
     def activationkey_add_subscription_to_repo(self, options=None):
         """Helper function that adds subscription to an activation key"""
-        # List the subscriptions in given org
-        subscriptions = self._satellite.cli.Subscription.list(
-            {'organization-id': options['organization-id']}, per_page=False
+        # the quantity is checked, list the subscriptions again
+        subscription = self._satellite.subscription_index.find(
+            options['organization-id'], options['subscription'], reload=True
         )
-        # Add subscription to activation-key
-        if options['subscription'] not in (sub['name'] for sub in subscriptions):
+        if subscription is None:
             raise CLIFactoryError(
                 'Subscription {} not found in the given org'.format(options['subscription'])
             )
-        for subscription in subscriptions:
-            if subscription['name'] == options['subscription']:
-                if subscription['quantity'] != 'Unlimited' and int(subscription['quantity']) == 0:
-                    raise CLIFactoryError('All the subscriptions are already consumed')
-                try:
-                    self._satellite.cli.ActivationKey.add_subscription(
-                        {
-                            'id': options['activationkey-id'],
-                            'subscription-id': subscription['id'],
-                            'quantity': 1,
-                        }
-                    )
-                except CLIReturnCodeError as err:
-                    raise CLIFactoryError(
-                        f'Failed to add subscription to activation key\n{err.msg}'
-                    ) from err
+        if subscription['quantity'] != 'Unlimited' and int(subscription['quantity']) == 0:
+            raise CLIFactoryError('All the subscriptions are already consumed')
+        try:
+            self._satellite.cli.ActivationKey.add_subscription(
+                {
+                    'id': options['activationkey-id'],
+                    'subscription-id': subscription['id'],
+                    'quantity': 1,
+                }
+            )
+        except CLIReturnCodeError as err:
+            raise CLIFactoryError(
+                f'Failed to add subscription to activation key\n{err.msg}'
+            ) from err
 
-    def setup_org_for_a_custom_repo(self, options=None):
+    def setup_org_for_a_custom_repo(self, options=None, shared=False):
         """Sets up Org for the given custom repo by:
 
         1. Checks if organization and lifecycle environment were given, otherwise
@@ -589,56 +594,133 @@ class CLIFactory:
         5. Adds the custom repo subscription to the activation key
         6. Override custom product to true ( turned off by default in 6.14 )
 
+        Steps not depending on each other run at the same time, e.g. the content view is
+        created while the repository syncs.
+
+        :param bool shared: reuse the entities set up with the same options by any module
+            or worker, see :mod:`robottelo.host_helpers.content_cache`. The shared entities
+            must not be modified.
         :return: A dictionary with the entity ids of Activation key, Content view,
             Lifecycle Environment, Organization, Product and Repository
 
         """
-        # Create new organization and lifecycle environment if needed
+        if shared:
+            return content_cache.shared_content_stack(
+                self._satellite,
+                'setup_org_for_a_custom_repo',
+                dict(options, **{'content-type': 'yum', 'download-policy': None}),
+                lambda: self.setup_org_for_a_custom_repo(options),
+                is_valid=self._activation_key_exists,
+            )
+        graph = StepGraph('setup_org_for_a_custom_repo')
+        self._add_org_steps(graph, options)
+        # Create custom product and repository
+        graph.add('custom_product', lambda org_id: self.make_product({'organization-id': org_id}))
+        graph.add(
+            'repo',
+            lambda custom_product: self.make_repository(
+                {
+                    'content-type': 'yum',
+                    'product-id': custom_product['id'],
+                    'url': options.get('url'),
+                }
+            ),
+        )
+
+        def sync(repo):
+            try:
+                self._satellite.cli.Repository.synchronize({'id': repo['id']})
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(f'Failed to synchronize repository\n{err.msg}') from err
+
+        graph.add('sync', sync)
+        self._add_content_view_steps(graph, options)
+        self._add_activation_key_steps(
+            graph, options, lambda custom_product: custom_product['name']
+        )
+        results = graph.run()
+        return {
+            'activationkey-id': results['activationkey_id'],
+            'content-view-id': results['cv_id'],
+            'lifecycle-environment-id': results['env_id'],
+            'organization-id': results['org_id'],
+            'product-id': results['custom_product']['id'],
+            'repository-id': results['repo_info']['id'],
+        }
+
+    def _activation_key_exists(self, entity_ids):
+        """Return whether the activation key of a setup_org_for_a_* result still exists"""
+        try:
+            self._satellite.cli.ActivationKey.info(
+                {
+                    'id': entity_ids['activationkey-id'],
+                    'organization-id': entity_ids['organization-id'],
+                }
+            )
+        except CLIReturnCodeError:
+            return False
+        return True
+
+    def _add_org_steps(self, graph, options):
+        """Add the ``org_id`` and ``env_id`` steps, creating the entities if needed"""
         if options.get('organization-id') is None:
-            org_id = self.make_org()['id']
+            graph.add('org_id', lambda: self.make_org()['id'])
         else:
-            org_id = options['organization-id']
+            graph.value('org_id', options['organization-id'])
         if options.get('lifecycle-environment-id') is None:
-            env_id = self.make_lifecycle_environment({'organization-id': org_id})['id']
+            graph.add(
+                'env_id',
+                lambda org_id: self.make_lifecycle_environment({'organization-id': org_id})['id'],
+            )
         else:
-            env_id = options['lifecycle-environment-id']
-        # Create custom product and repository
-        custom_product = self.make_product({'organization-id': org_id})
-        custom_repo = self.make_repository(
-            {'content-type': 'yum', 'product-id': custom_product['id'], 'url': options.get('url')}
-        )
-        # Synchronize custom repository
-        try:
-            self._satellite.cli.Repository.synchronize({'id': custom_repo['id']})
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to synchronize repository\n{err.msg}') from err
-        # Create CV if needed and associate repo with it
+            graph.value('env_id', options['lifecycle-environment-id'])
+
+    def _add_content_view_steps(self, graph, options):
+        """Add the steps creating the content view if needed, adding the ``repo`` step
+        repository to it once the ``sync`` step finished, publishing the content view and
+        promoting the new version to the ``env_id`` lifecycle environment
+        """
         if options.get('content-view-id') is None:
-            cv_id = self.make_content_view({'organization-id': org_id})['id']
-        else:
-            cv_id = options['content-view-id']
-        try:
-            self._satellite.cli.ContentView.add_repository(
-                {'id': cv_id, 'organization-id': org_id, 'repository-id': custom_repo['id']}
+            graph.add(
+                'cv_id', lambda org_id: self.make_content_view({'organization-id': org_id})['id']
             )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to add repository to content view\n{err.msg}') from err
-        # Publish a new version of CV
-        try:
-            self._satellite.cli.ContentView.publish({'id': cv_id})
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(
-                f'Failed to publish new version of content view\n{err.msg}'
-            ) from err
-        # Get the version id
-        cv_info = self._satellite.cli.ContentView.info({'id': cv_id})
-        assert len(cv_info['versions']) > 0
-        cv_info['versions'].sort(key=lambda version: version['id'])
-        cvv = cv_info['versions'][-1]
-        lce_promoted = cv_info['lifecycle-environments']
-        # Promote version to next env
-        try:
-            if env_id not in [int(lce['id']) for lce in lce_promoted]:
+        else:
+            graph.value('cv_id', options['content-view-id'])
+
+        def add_repository(cv_id, org_id, repo):
+            try:
+                self._satellite.cli.ContentView.add_repository(
+                    {'id': cv_id, 'organization-id': org_id, 'repository-id': repo['id']}
+                )
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(
+                    f'Failed to add repository to content view\n{err.msg}'
+                ) from err
+
+        graph.add('add_repository', add_repository, requires=['sync'])
+
+        def publish(cv_id):
+            try:
+                self._satellite.cli.ContentView.publish({'id': cv_id})
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(
+                    f'Failed to publish new version of content view\n{err.msg}'
+                ) from err
+
+        graph.add('publish', publish, requires=['add_repository'])
+
+        def promote(cv_id, org_id, env_id):
+            try:
+                cv_info = self._satellite.cli.ContentView.info({'id': cv_id})
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(f'Failed to fetch content view info\n{err.msg}') from err
+            assert len(cv_info['versions']) > 0
+            cv_info['versions'].sort(key=lambda version: int(version['id']))
+            cvv = cv_info['versions'][-1]
+            # Promote version to next env
+            if int(env_id) in [int(lce['id']) for lce in cv_info['lifecycle-environments']]:
+                return
+            try:
                 self._satellite.cli.ContentView.version_promote(
                     {
                         'id': cvv['id'],
@@ -646,54 +728,86 @@ class CLIFactory:
                         'to-lifecycle-environment-id': env_id,
                     }
                 )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(
-                f'Failed to promote version to next environment\n{err.msg}'
-            ) from err
-        # Create activation key if needed and associate content view with it
-        if options.get('activationkey-id') is None:
-            activationkey_id = self.make_activation_key(
-                {
-                    'content-view-id': cv_id,
-                    'lifecycle-environment-id': env_id,
-                    'organization-id': org_id,
-                }
-            )['id']
-        else:
-            activationkey_id = options['activationkey-id']
-            # Given activation key may have no (or different) CV associated.
-            # Associate activation key with CV just to be sure
-            try:
-                self._satellite.cli.ActivationKey.update(
-                    {'content-view-id': cv_id, 'id': activationkey_id, 'organization-id': org_id}
-                )
             except CLIReturnCodeError as err:
                 raise CLIFactoryError(
-                    f'Failed to associate activation-key with CV\n{err.msg}'
+                    f'Failed to promote version to next environment\n{err.msg}'
                 ) from err
 
-        # Add custom_product subscription to activation-key, if SCA mode is disabled
-        if self._satellite.is_sca_mode_enabled(org_id) is False:
-            self.activationkey_add_subscription_to_repo(
+        graph.add('promote', promote, requires=['publish'])
+
+    def _add_activation_key_steps(self, graph, options, subscription):
+        """Add the steps creating the activation key if needed or associating it with the
+        ``cv_id`` content view, adding the subscription named by the ``subscription`` step
+        callable to it unless SCA is enabled, and enabling the ``repo`` step repository
+        content on it
+        """
+        if options.get('activationkey-id') is None:
+            graph.add(
+                'activationkey_id',
+                lambda cv_id, env_id, org_id: self.make_activation_key(
+                    {
+                        'content-view-id': cv_id,
+                        'lifecycle-environment-id': env_id,
+                        'organization-id': org_id,
+                    }
+                )['id'],
+                requires=['promote'],
+            )
+        else:
+
+            def associate(cv_id, org_id):
+                # Given activation key may have no (or different) CV associated.
+                # Associate activation key with CV just to be sure
+                try:
+                    self._satellite.cli.ActivationKey.update(
+                        {
+                            'content-view-id': cv_id,
+                            'id': options['activationkey-id'],
+                            'organization-id': org_id,
+                        }
+                    )
+                except CLIReturnCodeError as err:
+                    raise CLIFactoryError(
+                        f'Failed to associate activation-key with CV\n{err.msg}'
+                    ) from err
+                return options['activationkey-id']
+
+            graph.add('activationkey_id', associate, requires=['promote'])
+
+        graph.add(
+            'sca_enabled', lambda org_id: self._satellite.subscription_index.sca_enabled(org_id)
+        )
+        graph.add('subscription', subscription)
+
+        def add_subscription(sca_enabled, activationkey_id, org_id, subscription):
+            # Add the subscription to activation-key, if SCA mode is disabled
+            if sca_enabled is False:
+                self.activationkey_add_subscription_to_repo(
+                    {
+                        'activationkey-id': activationkey_id,
+                        'organization-id': org_id,
+                        'subscription': subscription,
+                    }
+                )
+
+        graph.add('add_subscription', add_subscription)
+        graph.add(
+            'repo_info',
+            lambda repo: self._satellite.cli.Repository.info({'id': repo['id']}),
+            requires=['sync'],
+        )
+
+        def override(activationkey_id, repo_info):
+            # Override the product to true ( turned off by default in 6.14 )
+            self._satellite.cli.ActivationKey.content_override(
                 {
-                    'activationkey-id': activationkey_id,
-                    'organization-id': org_id,
-                    'subscription': custom_product['name'],
+                    'id': activationkey_id,
+                    'content-label': repo_info['content-label'],
+                    'value': 'true',
                 }
             )
-        # Override custom product to true ( turned off by default in 6.14 )
-        custom_repo = self._satellite.cli.Repository.info({'id': custom_repo['id']})
-        self._satellite.cli.ActivationKey.content_override(
-            {'id': activationkey_id, 'content-label': custom_repo['content-label'], 'value': 'true'}
-        )
-        return {
-            'activationkey-id': activationkey_id,
-            'content-view-id': cv_id,
-            'lifecycle-environment-id': env_id,
-            'organization-id': org_id,
-            'product-id': custom_product['id'],
-            'repository-id': custom_repo['id'],
-        }
+
+        graph.add('override', override, requires=['add_subscription'])
 
     def _setup_org_for_a_rh_repo(self, options=None):
         """Sets up Org for the given Red Hat repository by:
@@ -710,6 +824,9 @@ class CLIFactory:
             associates it with the content view.
         6. Adds the RH repo subscription to the activation key
 
+        Steps not depending on each other run at the same time, e.g. the content view is
+        created while the repository syncs.
+
         Note that in most cases you should use ``setup_org_for_a_rh_repo`` instead
         as it's more flexible.
 
@@ -717,136 +834,71 @@ class CLIFactory:
             Lifecycle Environment, Organization and Repository
 
         """
-        # Create new organization and lifecycle environment if needed
-        if options.get('organization-id') is None:
-            org_id = self.make_org()['id']
-        else:
-            org_id = options['organization-id']
-        if options.get('lifecycle-environment-id') is None:
-            env_id = self.make_lifecycle_environment({'organization-id': org_id})['id']
-        else:
-            env_id = options['lifecycle-environment-id']
-        # If manifest does not exist, clone and upload it
-        if len(self._satellite.cli.Subscription.exists({'organization-id': org_id})) == 0:
-            with clone() as manifest:
-                self._satellite.put(manifest.path, manifest.name)
+        graph = StepGraph('setup_org_for_a_rh_repo')
+        self._add_org_steps(graph, options)
+
+        def manifest(org_id):
+            # If manifest does not exist, clone and upload it
+            if len(self._satellite.subscription_index.subscriptions(org_id)) == 0:
+                with clone() as manifest:
+                    self._satellite.put(manifest.path, manifest.name)
+                try:
+                    self._satellite.cli.Subscription.upload(
+                        {'file': manifest.name, 'organization-id': org_id}
+                    )
+                except CLIReturnCodeError as err:
+                    raise CLIFactoryError(f'Failed to upload manifest\n{err.msg}') from err
+
+        graph.add('manifest', manifest)
+
+        def repo(org_id):
+            # Enable repo from Repository Set
             try:
-                self._satellite.cli.Subscription.upload(
-                    {'file': manifest.name, 'organization-id': org_id}
+                self._satellite.cli.RepositorySet.enable(
+                    {
+                        'basearch': 'x86_64',
+                        'name': options['repository-set'],
+                        'organization-id': org_id,
+                        'product': options['product'],
+                        'releasever': options.get('releasever'),
+                    }
                 )
             except CLIReturnCodeError as err:
-                raise CLIFactoryError(f'Failed to upload manifest\n{err.msg}') from err
-        # Enable repo from Repository Set
-        try:
-            self._satellite.cli.RepositorySet.enable(
-                {
-                    'basearch': 'x86_64',
-                    'name': options['repository-set'],
-                    'organization-id': org_id,
-                    'product': options['product'],
-                    'releasever': options.get('releasever'),
-                }
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to enable repository set\n{err.msg}') from err
-        # Fetch repository info
-        try:
-            rhel_repo = self._satellite.cli.Repository.info(
-                {
-                    'name': options['repository'],
-                    'organization-id': org_id,
-                    'product': options['product'],
-                }
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to fetch repository info\n{err.msg}') from err
-        # Synchronize the RH repository
-        try:
-            self._satellite.cli.Repository.synchronize(
-                {
-                    'name': options['repository'],
-                    'organization-id': org_id,
-                    'product': options['product'],
-                }
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to synchronize repository\n{err.msg}') from err
-        # Create CV if needed and associate repo with it
-        if options.get('content-view-id') is None:
-            cv_id = self.make_content_view({'organization-id': org_id})['id']
-        else:
-            cv_id = options['content-view-id']
-        try:
-            self._satellite.cli.ContentView.add_repository(
-                {'id': cv_id, 'organization-id': org_id, 'repository-id': rhel_repo['id']}
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to add repository to content view\n{err.msg}') from err
-        # Publish a new version of CV
-        try:
-            self._satellite.cli.ContentView.publish({'id': cv_id})
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(
-                f'Failed to publish new version of content view\n{err.msg}'
-            ) from err
-        # Get the version id
-        try:
-            cvv = self._satellite.cli.ContentView.info({'id': cv_id})['versions'][-1]
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to fetch content view info\n{err.msg}') from err
-        # Promote version1 to next env
-        try:
-            self._satellite.cli.ContentView.version_promote(
-                {'id': cvv['id'], 'organization-id': org_id, 'to-lifecycle-environment-id': env_id}
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(
-                f'Failed to promote version to next environment\n{err.msg}'
-            ) from err
-        # Create activation key if needed and associate content view with it
-        if options.get('activationkey-id') is None:
-            activationkey_id = self.make_activation_key(
-                {
-                    'content-view-id': cv_id,
-                    'lifecycle-environment-id': env_id,
-                    'organization-id': org_id,
-                }
-            )['id']
-        else:
-            activationkey_id = options['activationkey-id']
-            # Given activation key may have no (or different) CV associated.
-            # Associate activation key with CV just to be sure
+                raise CLIFactoryError(f'Failed to enable repository set\n{err.msg}') from err
+            # Fetch repository info
             try:
-                self._satellite.cli.ActivationKey.update(
-                    {'id': activationkey_id, 'organization-id': org_id, 'content-view-id': cv_id}
+                return self._satellite.cli.Repository.info(
+                    {
+                        'name': options['repository'],
+                        'organization-id': org_id,
+                        'product': options['product'],
+                    }
                 )
             except CLIReturnCodeError as err:
-                raise CLIFactoryError(
-                    f'Failed to associate activation-key with CV\n{err.msg}'
-                ) from err
+                raise CLIFactoryError(f'Failed to fetch repository info\n{err.msg}') from err
 
-        # Add default subscription to activation-key, if SCA mode is disabled
-        if self._satellite.is_sca_mode_enabled(org_id) is False:
-            self.activationkey_add_subscription_to_repo(
-                {
-                    'organization-id': org_id,
-                    'activationkey-id': activationkey_id,
-                    'subscription': options.get(
-                        'subscription', constants.DEFAULT_SUBSCRIPTION_NAME
-                    ),
-                }
-            )
-        # Override RHST product to true ( turned off by default in 6.14 )
-        rhel_repo = self._satellite.cli.Repository.info({'id': rhel_repo['id']})
-        self._satellite.cli.ActivationKey.content_override(
-            {'id': activationkey_id, 'content-label': rhel_repo['content-label'], 'value': 'true'}
+        graph.add('repo', repo, requires=['manifest'])
+
+        def sync(repo):
+            try:
+                self._satellite.cli.Repository.synchronize({'id': repo['id']})
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(f'Failed to synchronize repository\n{err.msg}') from err
+
+        graph.add('sync', sync)
+        self._add_content_view_steps(graph, options)
+        self._add_activation_key_steps(
+            graph,
+            options,
+            lambda: options.get('subscription', constants.DEFAULT_SUBSCRIPTION_NAME),
         )
+        results = graph.run()
         return {
-            'activationkey-id': activationkey_id,
-            'content-view-id': cv_id,
-            'lifecycle-environment-id': env_id,
-            'organization-id': org_id,
-            'repository-id': rhel_repo['id'],
+            'activationkey-id': results['activationkey_id'],
+            'content-view-id': results['cv_id'],
+            'lifecycle-environment-id': results['env_id'],
+            'organization-id': results['org_id'],
+            'repository-id': results['repo_info']['id'],
         }
 
     def setup_org_for_a_rh_repo(
@@ -897,7 +949,10 @@ class CLIFactory:
                     raise CLIFactoryError(f'Failed to upload manifest\n{err.msg}') from err
 
                 # Add default subscription to activation-key, if SCA mode is disabled
-                if self._satellite.is_sca_mode_enabled(result['organization-id']) is False:
+                if (
+                    self._satellite.subscription_index.sca_enabled(result['organization-id'])
+                    is False
+                ):
                     self.activationkey_add_subscription_to_repo(
                         {
                             'activationkey-id': result['activationkey-id'],
@@ -1066,11 +1121,64 @@ class CLIFactory:
                 )
             repos_info.append(repo_info)
         if synchronize:
-            # Synchronize the repositories
-            for repo_info in repos_info:
-                self._satellite.cli.Repository.synchronize({'id': repo_info['id']}, timeout=4800000)
+            self.synchronize_repositories([repo_info['id'] for repo_info in repos_info])
         return custom_product, repos_info
 
+    def synchronize_repositories(self, repo_ids, timeout=4800, max_concurrent=None):
+        """Synchronize the repositories and wait until every sync finished
+
+        Unless ``performance.async_repository_sync`` is disabled, the syncs run at the same
+        time: at most ``max_concurrent`` syncs are started with ``--async`` and their tasks
+        are waited for with ``Satellite.task_watcher``, the next sync starting as soon as one
+        finishes. The first failed sync raises without waiting for the others.
+
+        :param list repo_ids: ids of the repositories to synchronize
+        :param int timeout: maximum number of seconds a single sync may take
+        :param int max_concurrent: maximum number of syncs running at the same time,
+            defaults to ``performance.repository_sync_concurrency``
+        :return: dict mapping every repository id to its sync duration in seconds
+        :raises CLIFactoryError: if a sync failed or timed out
+        """
+        durations = {}
+        if not settings.performance.async_repository_sync:
+            for repo_id in repo_ids:
+                start = time.monotonic()
+                self._satellite.cli.Repository.synchronize({'id': repo_id}, timeout=timeout * 1000)
+                durations[repo_id] = time.monotonic() - start
+            return durations
+        if max_concurrent is None:
+            max_concurrent = settings.performance.repository_sync_concurrency
+        pending = list(repo_ids)
+        running = {}
+        try:
+            while pending or running:
+                while pending and len(running) < max_concurrent:
+                    repo_id = pending.pop(0)
+                    output = self._satellite.cli.Repository.synchronize(
+                        {'id': repo_id, 'async': True}
+                    )
+                    match = _uuid_regex.search(str(output))
+                    if match is None:
+                        raise CLIFactoryError(
+                            f'No sync task id in the output for repository {repo_id}: {output}'
+                        )
+                    future = self._satellite.task_watcher.watch(match.group(), timeout=timeout)
+                    running[future] = (repo_id, time.monotonic())
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    repo_id, start = running.pop(future)
+                    durations[repo_id] = time.monotonic() - start
+                    logger.info(f'Repository {repo_id} synced in {durations[repo_id]:.1f} s')
+                    if future.exception() is not None:
+                        raise CLIFactoryError(
+                            f'Failed to synchronize repository {repo_id}: {future.exception()}'
+                        )
+        finally:
+            # stop watching the tasks of the other syncs after a failure
+            for future in running:
+                self._satellite.task_watcher.unwatch(future)
+        return durations
+
     def setup_cdn_and_custom_repos_content(
         self,
         org_id,
@@ -1119,15 +1227,22 @@ class CLIFactory:
         else:
             # Create a content view
             content_view = self.make_content_view({'organization-id': org_id})
-            # Add repositories to content view
-            for repo_info in repos_info:
-                self._satellite.cli.ContentView.add_repository(
-                    {
-                        'id': content_view['id'],
-                        'organization-id': org_id,
-                        'repository-id': repo_info['id'],
-                    }
-                )
+            # Add repositories to content view, in a single ssh round trip
+            cv_cli = self._satellite.cli.ContentView
+            cv_cli.execute_many(
+                [
+                    cv_cli._construct_command(
+                        {
+                            'id': content_view['id'],
+                            'organization-id': org_id,
+                            'repository-id': repo_info['id'],
+                        },
+                        command_sub='add-repository',
+                    )
+                    for repo_info in repos_info
+                ],
+                output_format='csv',
+            )
             # Publish the content view
             self._satellite.cli.ContentView.publish({'id': content_view['id']})
             # Get the latest content view version id
@@ -1150,33 +1265,23 @@ class CLIFactory:
                     'content-view-id': content_view['id'],
                 }
             )
-        # Get organization subscriptions
-        subscriptions = self._satellite.cli.Subscription.list(
-            {'organization-id': org_id}, per_page=False
-        )
         # Add subscriptions to activation-key
         needed_subscription_names = list(rh_subscriptions)
         if custom_product:
             needed_subscription_names.append(custom_product['name'])
-        added_subscription_names = []
-        for subscription in subscriptions:
-            if (
-                subscription['name'] in needed_subscription_names
-                and subscription['name'] not in added_subscription_names
-            ):
-                self._satellite.cli.ActivationKey.add_subscription(
-                    {
-                        'id': activation_key['id'],
-                        'subscription-id': subscription['id'],
-                        'quantity': 1,
-                    }
-                )
-                added_subscription_names.append(subscription['name'])
-                if len(added_subscription_names) == len(needed_subscription_names):
-                    break
-        missing_subscription_names = set(needed_subscription_names).difference(
-            set(added_subscription_names)
-        )
+        missing_subscription_names = set()
+        for subscription_name in dict.fromkeys(needed_subscription_names):
+            subscription = self._satellite.subscription_index.find(org_id, subscription_name)
+            if subscription is None:
+                missing_subscription_names.add(subscription_name)
+                continue
+            self._satellite.cli.ActivationKey.add_subscription(
+                {
+                    'id': activation_key['id'],
+                    'subscription-id': subscription['id'],
+                    'quantity': 1,
+                }
+            )
         if missing_subscription_names:
             raise CLIFactoryError(f'Missing subscriptions: {missing_subscription_names}')
         data = dict(
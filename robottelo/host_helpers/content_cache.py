@@ -0,0 +1,84 @@
+"""Share content setup stacks between modules and xdist workers.
+
+Building an organization with synced repositories, a published content view and an
+activation key takes minutes. When ``shared_function.content_cache`` is enabled, the
+first caller builds the stack and stores its entities in the ``func_shared`` storage, file
+or redis, every later caller with the same repositories gets the stored entities instead.
+
+The stored stack is keyed by the repositories, their content types, the download policy
+and the Satellite machine id, so a re-provisioned Satellite never reuses the entities of
+its predecessor. Stacks expire after ``shared_function.content_cache_timeout`` seconds.
+The entities of a shared stack are read-only, a test modifying them has to build its own.
+"""
+import hashlib
+import json
+import threading
+
+from robottelo.config import settings
+from robottelo.logging import logger
+from robottelo.utils.decorators.func_shared.shared import (
+    call_shared,
+    clear_shared,
+    shared_key,
+)
+
+# Satellite hostname -> identity, read once per session
+_identities = {}
+_identities_lock = threading.Lock()
+
+
+def satellite_identity(satellite):
+    """Return a string identifying one provisioning of ``satellite``
+
+    The machine id is read once per hostname and process.
+    """
+    with _identities_lock:
+        if satellite.hostname not in _identities:
+            machine_id = satellite.execute('cat /etc/machine-id').stdout.strip()
+            _identities[satellite.hostname] = f'{satellite.hostname}:{machine_id}'
+        return _identities[satellite.hostname]
+
+
+def stack_key(kind, description, satellite_id):
+    """Return the storage key of a content stack
+
+    :param str kind: the stack kind, e.g. the name of the method building it
+    :param description: json compatible description of the stack, e.g. the repositories
+        data and download policy
+    :param str satellite_id: the :func:`satellite_identity` of the Satellite
+    """
+    text = json.dumps([description, satellite_id], sort_keys=True, default=str)
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    return shared_key(f'content_stack.{kind}.{digest}', scope_context='content_cache')
+
+
+def shared_content_stack(satellite, kind, description, build, is_valid=None):
+    """Return the content stack built by ``build``, built once for every caller
+
+    :param satellite: the Satellite the stack is built on
+    :param str kind: the stack kind, see :func:`stack_key`
+    :param description: json compatible description of the stack, see :func:`stack_key`
+    :param build: callable building the stack and returning its json compatible entities
+    :param is_valid: callable returning whether stored entities still exist on the
+        Satellite, a stack failing the check is built again
+    """
+    if not settings.shared_function.content_cache:
+        return build()
+    key = stack_key(kind, description, satellite_identity(satellite))
+    result = _call(key, build)
+    if is_valid is None or is_valid(result):
+        return result
+    logger.info(f'Shared content stack {key} is no longer valid, building it again')
+    clear_shared(key, result=result)
+    return _call(key, build)
+
+
+def _call(key, build):
+    try:
+        return call_shared(
+            key, build, retries=1, timeout=settings.shared_function.content_cache_timeout
+        )
+    except Exception:
+        # a failed build is not cached, the next caller tries again
+        clear_shared(key)
+        raise
@@ -0,0 +1,58 @@
+"""Run the same setup step on several hosts at the same time.
+
+Registering a host, installing its katello-ca or enabling its repositories mostly waits
+for remote commands, :func:`fan_out` runs the step for every host in a thread pool and
+collects the result or the error of each host instead of stopping at the first failure.
+"""
+from collections import namedtuple
+from concurrent import futures
+
+from robottelo.config import settings
+from robottelo.exceptions import HostsFanOutError
+
+HostResult = namedtuple('HostResult', 'host result error')
+
+
+class HostResults(list):
+    """The :class:`HostResult` of every host, in the order of the hosts"""
+
+    @property
+    def results(self):
+        return [host_result.result for host_result in self]
+
+    @property
+    def errors(self):
+        """The results of the hosts whose step raised an exception"""
+        return [host_result for host_result in self if host_result.error is not None]
+
+    def raise_for_errors(self):
+        """Raise :class:`robottelo.exceptions.HostsFanOutError` if a step failed"""
+        if self.errors:
+            raise HostsFanOutError(self)
+        return self
+
+
+def fan_out(hosts, func, max_workers=None):
+    """Call ``func(host)`` for every host concurrently
+
+    :param list hosts: the hosts
+    :param func: callable taking a host
+    :param int max_workers: maximum number of hosts processed at the same time, defaults to
+        ``performance.host_fan_out_concurrency``
+    :return: :class:`HostResults` of the hosts
+    """
+    hosts = list(hosts)
+    if not hosts:
+        return HostResults()
+    max_workers = min(max_workers or settings.performance.host_fan_out_concurrency, len(hosts))
+    with futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='fan_out'
+    ) as executor:
+        pending = [executor.submit(func, host) for host in hosts]
+    results = HostResults()
+    for host, future in zip(hosts, pending, strict=True):
+        if future.exception() is not None:
+            results.append(HostResult(host, None, future.exception()))
+        else:
+            results.append(HostResult(host, future.result(), None))
+    return results
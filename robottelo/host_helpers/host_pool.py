@@ -0,0 +1,158 @@
+"""Warm pool of content hosts provisioned ahead of the tests using them.
+
+Provisioning a content host with Broker takes from seconds for a container to minutes for
+a VM. Once the tests are collected, the pool knows how many hosts of each deploy
+configuration the session will use and checks out up to ``content_host.warm_pool_size``
+of each in background threads. The content host fixtures take their host from the pool,
+which checks out a replacement while hosts are still needed, and the hosts left over are
+checked in at the end of the session.
+"""
+from collections import deque
+from concurrent import futures
+import json
+import threading
+import time
+
+from broker import Broker
+
+from robottelo.logging import logger
+
+
+def conf_key(conf):
+    """Return a hashable key of a Broker deploy configuration"""
+    return json.dumps(conf, sort_keys=True, default=str)
+
+
+def provision(conf, host_class):
+    """Check out and set up a host as ``with Broker(...)`` does"""
+    host = Broker(**conf, host_class=host_class).checkout()
+    try:
+        host.setup()
+    except Exception:
+        Broker(hosts=[host]).checkin()
+        raise
+    return host
+
+
+class PoolStats:
+    """Counters of the hosts handed out by one or more pools"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0.0
+        self.waited = 0.0
+
+    def as_dict(self):
+        return dict(hits=self.hits, misses=self.misses, saved=self.saved, waited=self.waited)
+
+    def merge(self, data):
+        """Add the counters of another pool, e.g. of a pytest-xdist worker"""
+        self.hits += data.get('hits', 0)
+        self.misses += data.get('misses', 0)
+        self.saved += data.get('saved', 0.0)
+        self.waited += data.get('waited', 0.0)
+
+    def summary(self):
+        return (
+            f'{self.hits} hosts taken from the warm pool, {self.misses} provisioned on demand, '
+            f'{self.saved:.1f} s of provisioning saved, {self.waited:.1f} s waited for the pool'
+        )
+
+
+class HostPool:
+    """Hosts checked out in advance, per deploy configuration
+
+    :param int size: maximum number of hosts checked out in advance per configuration
+    :param host_class: the class of the checked out hosts
+    :param provision: callable checking out a host of a configuration, see :func:`provision`
+    """
+
+    def __init__(self, size, host_class, provision=provision):
+        self.size = size
+        self.host_class = host_class
+        self._provision = provision
+        self._demand = {}
+        self._ready = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self.stats = PoolStats()
+
+    def _timed_provision(self, conf):
+        start = time.monotonic()
+        host = self._provision(conf, self.host_class)
+        return host, time.monotonic() - start
+
+    def _refill(self, key, conf):
+        """Check out hosts of ``key`` until the pool holds what the remaining tests need"""
+        ready = self._ready.setdefault(key, deque())
+        while len(ready) < min(self.size, self._demand.get(key, 0)):
+            ready.append(self._executor.submit(self._timed_provision, conf))
+
+    def plan(self, demand):
+        """Start checking out hosts for the collected tests
+
+        :param dict demand: maps the :func:`conf_key` of each configuration to a tuple of
+            the configuration and the number of tests using it
+        """
+        if self.size < 1 or not demand:
+            return
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=self.size * len(demand), thread_name_prefix='host_pool'
+        )
+        with self._lock:
+            for key, (conf, count) in demand.items():
+                self._demand[key] = count
+                self._refill(key, conf)
+        logger.info(
+            f'Content host pool prefetching {sum(map(len, self._ready.values()))} hosts '
+            f'for {sum(count for _, count in demand.values())} tests'
+        )
+
+    def checkout(self, conf):
+        """Return a host of ``conf``, from the pool when it holds one"""
+        key = conf_key(conf)
+        with self._lock:
+            future = None
+            if self._executor is not None and key in self._demand:
+                self._demand[key] = max(self._demand[key] - 1, 0)
+                if self._ready[key]:
+                    future = self._ready[key].popleft()
+                self._refill(key, conf)
+        if future is not None:
+            start = time.monotonic()
+            try:
+                host, duration = future.result()
+            except Exception as err:
+                logger.warning(f'Content host pool checkout failed, retrying on demand: {err}')
+            else:
+                waited = time.monotonic() - start
+                with self._lock:
+                    self.stats.hits += 1
+                    self.stats.waited += waited
+                    self.stats.saved += max(duration - waited, 0)
+                return host
+        with self._lock:
+            self.stats.misses += 1
+        return self._provision(conf, self.host_class)
+
+    def close(self):
+        """Check in the hosts nobody took, waiting for the running checkouts"""
+        with self._lock:
+            self._demand.clear()
+            ready = [future for queue in self._ready.values() for future in queue]
+            self._ready.clear()
+        for future in ready:
+            if future.cancel():
+                continue
+            try:
+                host, _ = future.result()
+            except Exception:
+                continue
+            try:
+                Broker(hosts=[host]).checkin()
+            except Exception as err:
+                logger.warning(f'Failed to check in unused pooled host {host}: {err}')
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,155 @@
+"""Lazy entity namespaces behind ``Satellite.api``, ``Satellite.cli`` and ``Capsule.cli``.
+
+A namespace creates the class bound to its Satellite, e.g. ``sat.cli.Repository``, the
+first time the attribute is accessed, rather than wrapping every nailgun entity or hammer
+cli class up front. Namespaces are shared by every host object targeting the same
+Satellite, so the classes are created once per process.
+"""
+import functools
+import importlib
+from pathlib import Path
+import re
+import threading
+
+from robottelo.cli.base import Base
+
+CLI_DIR = Path(__file__).parent.parent / 'cli'
+_class_regex = re.compile(r'^class (\w+)\b', re.MULTILINE)
+
+
+class LazyNamespace:
+    """Namespace resolving its public attributes with ``factory`` on first access
+
+    :param str name: the namespace name, used in error messages
+    :param factory: callable returning the value of an attribute name, or ``None`` if the
+        namespace has no such attribute
+    :param names: the attribute names the namespace can resolve, used by ``dir()``
+    """
+
+    def __init__(self, name, factory, names=()):
+        self._name = name
+        self._factory = factory
+        self._names = frozenset(names)
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # only called when the attribute was not resolved yet
+        if name.startswith('_'):
+            raise AttributeError(name)
+        with self._lock:
+            if name not in self.__dict__:
+                value = self._factory(name)
+                if value is None:
+                    raise AttributeError(f'{self._name} has no attribute {name!r}')
+                self.__dict__[name] = value
+        return self.__dict__[name]
+
+    def __dir__(self):
+        return sorted(self._names | {name for name in self.__dict__ if not name.startswith('_')})
+
+    def __repr__(self):
+        return f'<{self._name} namespace>'
+
+
+@functools.cache
+def cli_index():
+    """Map every class defined in ``robottelo/cli`` to the name of its module
+
+    The sources are scanned rather than imported, a module is only imported when one of
+    its classes is used.
+    """
+    index = {}
+    for path in sorted(CLI_DIR.glob('*.py')):
+        if path.name.startswith('_'):
+            continue
+        for name in _class_regex.findall(path.read_text()):
+            index[name] = f'robottelo.cli.{path.stem}'
+    return index
+
+
+def _cli_factory(attributes, maintain_only=False):
+    """Return a factory subclassing cli classes with the given class attributes"""
+
+    def factory(name):
+        module = cli_index().get(name)
+        if module is None or (maintain_only and not module.startswith('robottelo.cli.sm_')):
+            return None
+        cls = getattr(importlib.import_module(module), name, None)
+        if not (isinstance(cls, type) and issubclass(cls, Base)):
+            return None
+        return type(name, (cls,), {'__module__': cls.__module__, **attributes})
+
+    return factory
+
+
+def _api_factory(server_config):
+    """Return a factory subclassing nailgun entities to use ``server_config``"""
+
+    def factory(name):
+        from nailgun import entities  # nailgun may be swapped at runtime
+        from nailgun.entity_mixins import Entity
+
+        cls = getattr(entities, name, None)
+        if not (isinstance(cls, type) and issubclass(cls, Entity)):
+            return None
+        init = functools.partialmethod(cls.__init__, server_config=server_config)
+        return type(name, (cls,), {'__module__': cls.__module__, '__init__': init})
+
+    return factory
+
+
+_namespaces = {}
+_namespaces_lock = threading.Lock()
+
+
+def _shared(key, create):
+    with _namespaces_lock:
+        if key not in _namespaces:
+            _namespaces[key] = create()
+        return _namespaces[key]
+
+
+def cli_namespace(hostname, omitting_credentials=False, maintain_only=False):
+    """Return the hammer cli namespace of a Satellite
+
+    :param str hostname: the Satellite the cli classes run their commands on
+    :param bool omitting_credentials: whether the commands run without ``-u`` and ``-p``
+    :param bool maintain_only: only expose the ``satellite-maintain`` classes of the
+        ``robottelo/cli/sm_*.py`` modules, as a Capsule has no hammer
+    """
+
+    def create():
+        attributes = {'hostname': hostname}
+        if not maintain_only:
+            attributes['omitting_credentials'] = omitting_credentials
+        names = [
+            name
+            for name, module in cli_index().items()
+            if not maintain_only or module.startswith('robottelo.cli.sm_')
+        ]
+        return LazyNamespace('cli', _cli_factory(attributes, maintain_only), names)
+
+    return _shared(('cli', hostname, omitting_credentials, maintain_only), create)
+
+
+def api_namespace(server_config):
+    """Return the nailgun entity namespace of a Satellite
+
+    The namespace is shared by every ``server_config`` with the same url and
+    credentials, its ``server_config`` attribute is the first of them.
+    """
+    key = ('api', server_config.url, tuple(server_config.auth or ()), server_config.verify)
+
+    def create():
+        namespace = LazyNamespace('api', _api_factory(server_config))
+        namespace.server_config = server_config
+        return namespace
+
+    return _shared(key, create)
+
+
+def clear_namespaces(kind=None):
+    """Forget the shared namespaces, e.g. ``api`` ones after swapping nailgun"""
+    with _namespaces_lock:
+        for key in [key for key in _namespaces if kind in (None, key[0])]:
+            del _namespaces[key]
@@ -0,0 +1,104 @@
+"""Reuse global registration commands between content hosts registered the same way.
+
+``ContentHost.register`` generates its registration command with ``hammer
+host-registration generate-command``, which starts hammer and issues a new JSON web
+token. The command only depends on the registration target and options, so the generated
+commands are kept per Satellite, target and options until their token is about to expire:
+the ``exp`` claim of the token in the command, capped at
+``performance.registration_command_ttl`` seconds.
+"""
+import base64
+import json
+import re
+import threading
+import time
+
+from robottelo.config import settings
+
+# tokens expiring sooner than this are not reused, a registration must not outlive them
+EXPIRY_MARGIN = 300
+_jwt_regex = re.compile(r'Bearer ([\w-]+)\.([\w-]+)\.([\w-]+)')
+
+
+def token_expiry(command):
+    """Return the expiry timestamp of the token in a registration command, or None"""
+    match = _jwt_regex.search(command)
+    if match is None:
+        return None
+    payload = match.group(2)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    return claims.get('exp')
+
+
+class RegistrationCommandCache:
+    """Generated registration commands, keyed by Satellite, target and options
+
+    :param int ttl: maximum number of seconds a command is reused, 0 disables the reuse
+    """
+
+    def __init__(self, ttl=3600):
+        self.ttl = ttl
+        self._commands = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(satellite_hostname, target_hostname, options):
+        """Return the cache key of a registration, options values are compared as strings"""
+        return (
+            satellite_hostname,
+            target_hostname,
+            tuple(sorted((name, str(value)) for name, value in options.items())),
+        )
+
+    def get(self, key, generate):
+        """Return the command of ``key``, generated by ``generate()`` once per token
+
+        Threads asking for the same key wait for the one generating it.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            now = time.time()
+            with self._lock:
+                command, expires = self._commands.get(key, (None, 0))
+                if command is not None and expires > now:
+                    self.hits += 1
+                    return command
+                self.misses += 1
+            command = generate()
+            expires = now + self.ttl
+            if (token_expires := token_expiry(command)) is not None:
+                expires = min(expires, token_expires - EXPIRY_MARGIN)
+            with self._lock:
+                self._commands[key] = (command, expires)
+            return command
+
+    def invalidate(self, satellite_hostname=None):
+        """Drop the commands of a Satellite, or every command, e.g. after revoking tokens"""
+        with self._lock:
+            for key in list(self._commands):
+                if satellite_hostname is None or key[0] == satellite_hostname:
+                    del self._commands[key]
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'commands': len(self._commands)}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Return the registration command cache of this process"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = RegistrationCommandCache(ttl=settings.performance.registration_command_ttl)
+        return _cache
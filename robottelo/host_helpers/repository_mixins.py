@@ -8,6 +8,7 @@ import sys
 from robottelo import constants
 from robottelo.config import settings
 from robottelo.exceptions import (
+    CLIReturnCodeError,
     DistroNotSupportedError,
     OnlyOneOSRepositoryAllowed,
     ReposContentSetupWasNotPerformed,
@@ -15,6 +16,8 @@ from robottelo.exceptions import (
     RepositoryAlreadyDefinedError,
     RepositoryDataNotFound,
 )
+from robottelo.host_helpers import content_cache, fan_out
+from robottelo.utils.step_graph import StepGraph
 
 
 def initiate_repo_helpers(satellite):
@@ -435,7 +438,12 @@ class GenericRHRepository(BaseRepository):
             if synchronize:
                 self.synchronize()
         else:
-            repo_info = super().create(organization_id, product_id, download_policy=download_policy)
+            repo_info = super().create(
+                organization_id,
+                product_id,
+                download_policy=download_policy,
+                synchronize=synchronize,
+            )
         return repo_info
 
 
@@ -634,9 +642,13 @@ class RepositoryCollection:
                 org_id,
                 custom_product_id,
                 download_policy=download_policy,
-                synchronize=synchronize,
+                synchronize=False,
             )
             repos_info.append(repo_info)
+        if synchronize:
+            self.satellite.cli_factory.synchronize_repositories(
+                [repo_info['id'] for repo_info in repos_info]
+            )
         self._custom_product_info = custom_product
         self._repos_info = repos_info
         return custom_product, repos_info
@@ -645,13 +657,24 @@ class RepositoryCollection:
         """Setup organization content view by adding all the repositories, publishing and promoting
         to lce if needed.
         """
+        lce = self._lifecycle_environment(org_id, lce_id)
+        content_view = self.satellite.cli_factory.make_content_view({'organization-id': org_id})
+        return self._publish_content_view(org_id, content_view, lce), lce
+
+    def _lifecycle_environment(self, org_id, lce_id=None):
+        """Return the lifecycle environment info, create a new one if ``lce_id`` is None"""
         if lce_id is None:
-            lce = self.satellite.cli_factory.make_lifecycle_environment({'organization-id': org_id})
-        else:
-            lce = self.satellite.cli.LifecycleEnvironment.info(
-                {'id': lce_id, 'organization-id': org_id}
+            return self.satellite.cli_factory.make_lifecycle_environment(
+                {'organization-id': org_id}
             )
-        content_view = self.satellite.cli_factory.make_content_view({'organization-id': org_id})
+        return self.satellite.cli.LifecycleEnvironment.info(
+            {'id': lce_id, 'organization-id': org_id}
+        )
+
+    def _publish_content_view(self, org_id, content_view, lce):
+        """Add all the repositories to the content view, publish it and promote it to lce if
+        needed, return the updated content view info
+        """
         # Add repositories to content view
         for repo in self:
             repo.add_to_content_view(org_id, content_view['id'])
@@ -670,8 +693,7 @@ class RepositoryCollection:
                     'to-lifecycle-environment-id': lce['id'],
                 }
             )
-        content_view = self.satellite.cli.ContentView.info({'id': content_view['id']})
-        return content_view, lce
+        return self.satellite.cli.ContentView.info({'id': content_view['id']})
 
     def setup_activation_key(
         self, org_id, content_view_id, lce_id, subscription_names=None, override=None
@@ -698,32 +720,22 @@ class RepositoryCollection:
                         'value': int(override),
                     }
                 )
-        if self.satellite.is_sca_mode_enabled(org_id):
+        if self.satellite.subscription_index.sca_enabled(org_id):
             return activation_key
         # Add subscriptions to activation-key
-        # Get organization subscriptions
-        subscriptions = self.satellite.cli.Subscription.list(
-            {'organization-id': org_id}, per_page=False
-        )
-        added_subscription_names = []
-        for subscription in subscriptions:
-            if (
-                subscription['name'] in subscription_names
-                and subscription['name'] not in added_subscription_names
-            ):
-                self.satellite.cli.ActivationKey.add_subscription(
-                    {
-                        'id': activation_key['id'],
-                        'subscription-id': subscription['id'],
-                        'quantity': 1,
-                    }
-                )
-                added_subscription_names.append(subscription['name'])
-                if len(added_subscription_names) == len(subscription_names):
-                    break
-        missing_subscription_names = set(subscription_names).difference(
-            set(added_subscription_names)
-        )
+        missing_subscription_names = set()
+        for subscription_name in dict.fromkeys(subscription_names):
+            subscription = self.satellite.subscription_index.find(org_id, subscription_name)
+            if subscription is None:
+                missing_subscription_names.add(subscription_name)
+                continue
+            self.satellite.cli.ActivationKey.add_subscription(
+                {
+                    'id': activation_key['id'],
+                    'subscription-id': subscription['id'],
+                    'quantity': 1,
+                }
+            )
         if missing_subscription_names:
             raise ValueError(f'Missing subscriptions: {missing_subscription_names}')
         return activation_key
@@ -732,10 +744,7 @@ class RepositoryCollection:
         """Check if an organization has a manifest, an organization has manifest if one of it's
         subscriptions have the account defined.
         """
-        subscriptions = self.satellite.cli.Subscription.list(
-            {'organization-id': organization_id}, per_page=False
-        )
-        return any(bool(sub['account']) for sub in subscriptions)
+        return self.satellite.subscription_index.has_manifest(organization_id)
 
     def setup_content(
         self,
@@ -761,39 +770,130 @@ class RepositoryCollection:
             raise RepositoryAlreadyCreated('Repositories already created can not setup content')
         if rh_subscriptions is None:
             rh_subscriptions = []
-        if self.need_subscription:
+        if self.need_subscription and not rh_subscriptions:
+            # add the default subscription if no subscription provided
+            rh_subscriptions = [constants.DEFAULT_SUBSCRIPTION_NAME]
+        # repositories sync while the lifecycle environment and content view are created
+        graph = StepGraph('setup_content')
+
+        def manifest():
             # upload manifest only when needed
-            if upload_manifest and not self.organization_has_manifest(org_id):
+            if (
+                self.need_subscription
+                and upload_manifest
+                and not self.organization_has_manifest(org_id)
+            ):
                 self.satellite.upload_manifest(org_id, interface='API')
-            if not rh_subscriptions:
-                # add the default subscription if no subscription provided
-                rh_subscriptions = [constants.DEFAULT_SUBSCRIPTION_NAME]
-        custom_product, repos_info = self.setup(org_id=org_id, download_policy=download_policy)
-        content_view, lce = self.setup_content_view(org_id, lce_id)
-        custom_product_name = custom_product['name'] if custom_product else None
-        subscription_names = list(rh_subscriptions)
-        if custom_product_name:
-            subscription_names.append(custom_product_name)
-        if not self.satellite.is_sca_mode_enabled(org_id):
-            activation_key = self.setup_activation_key(
+
+        graph.add('manifest', manifest)
+        graph.add(
+            'repositories',
+            lambda: self.setup(org_id=org_id, download_policy=download_policy),
+            requires=['manifest'],
+        )
+        graph.add('lce', lambda: self._lifecycle_environment(org_id, lce_id))
+        graph.add(
+            'new_content_view',
+            lambda: self.satellite.cli_factory.make_content_view({'organization-id': org_id}),
+        )
+        graph.add(
+            'content_view',
+            lambda new_content_view, lce: self._publish_content_view(org_id, new_content_view, lce),
+            requires=['repositories'],
+        )
+        graph.add('sca_enabled', lambda: self.satellite.subscription_index.sca_enabled(org_id))
+
+        def activation_key(repositories, content_view, sca_enabled):
+            custom_product = repositories[0]
+            subscription_names = list(rh_subscriptions)
+            if custom_product:
+                subscription_names.append(custom_product['name'])
+            if sca_enabled:
+                return self.setup_activation_key(
+                    org_id, content_view['id'], lce_id, override=override
+                )
+            return self.setup_activation_key(
                 org_id,
                 content_view['id'],
                 lce_id,
                 subscription_names=subscription_names,
                 override=override,
             )
-        else:
-            activation_key = self.setup_activation_key(
-                org_id, content_view['id'], lce_id, override=override
-            )
+
+        graph.add('activation_key', activation_key)
+        graph.add('org', lambda: self.satellite.cli.Org.info({'id': org_id}))
+        results = graph.run()
+        custom_product, repos_info = results['repositories']
         setup_content_data = dict(
-            activation_key=activation_key,
-            content_view=content_view,
+            activation_key=results['activation_key'],
+            content_view=results['content_view'],
             product=custom_product,
             repos=repos_info,
-            lce=lce,
+            lce=results['lce'],
         )
-        self._org = self.satellite.cli.Org.info({'id': org_id})
+        self._org = results['org']
+        self._setup_content_data = setup_content_data
+        return setup_content_data
+
+    def setup_shared_content(
+        self,
+        upload_manifest=False,
+        download_policy='on_demand',
+        rh_subscriptions=None,
+        override=None,
+    ):
+        """Setup content like :meth:`setup_content` in a new organization and lifecycle
+        environment, shared with every collection of the same repositories and options,
+        see :mod:`robottelo.host_helpers.content_cache`. The shared entities must not be
+        modified.
+        """
+        if self._repos_info:
+            raise RepositoryAlreadyCreated('Repositories already created can not setup content')
+        description = dict(
+            repos=self.repos_data,
+            distro=self.distro,
+            upload_manifest=upload_manifest,
+            download_policy=download_policy,
+            rh_subscriptions=rh_subscriptions,
+            override=override,
+        )
+
+        def build():
+            org = self.satellite.cli_factory.make_org()
+            lce = self.satellite.cli_factory.make_lifecycle_environment(
+                {'organization-id': org['id']}
+            )
+            setup_content_data = self.setup_content(
+                org['id'],
+                lce['id'],
+                upload_manifest=upload_manifest,
+                download_policy=download_policy,
+                rh_subscriptions=rh_subscriptions,
+                override=override,
+            )
+            return dict(org=self._org, setup_content_data=setup_content_data)
+
+        def is_valid(stack):
+            try:
+                self.satellite.cli.ActivationKey.info(
+                    {
+                        'id': stack['setup_content_data']['activation_key']['id'],
+                        'organization-id': stack['org']['id'],
+                    }
+                )
+            except CLIReturnCodeError:
+                return False
+            return True
+
+        stack = content_cache.shared_content_stack(
+            self.satellite, 'setup_content', description, build, is_valid=is_valid
+        )
+        setup_content_data = stack['setup_content_data']
+        for repo, repo_info in zip(self, setup_content_data['repos'], strict=True):
+            repo._repo_info = repo_info
+        self._repos_info = setup_content_data['repos']
+        self._custom_product_info = setup_content_data['product']
+        self._org = stack['org']
         self._setup_content_data = setup_content_data
         return setup_content_data
 
@@ -850,3 +950,14 @@ class RepositoryCollection:
                     f'Settings option "{rhel_repo_option_name}" is not set or does not exist'
                 )
             vm.create_custom_repos(**{rhel_repo_option_name: rhel_repo_url})
+
+    def setup_virtual_machines(self, vms, max_workers=None, **kwargs):
+        """Setup virtual machines concurrently, see :meth:`setup_virtual_machine`
+
+        :param list vms: the virtual machines to setup
+        :param int max_workers: maximum number of virtual machines set up at the same time
+        :return: :class:`robottelo.host_helpers.fan_out.HostResults` of the virtual machines
+        """
+        return fan_out.fan_out(
+            vms, lambda vm: self.setup_virtual_machine(vm, **kwargs), max_workers
+        )
@@ -20,6 +20,7 @@ from robottelo.host_helpers.api_factory import APIFactory
 from robottelo.host_helpers.cli_factory import CLIFactory
 from robottelo.host_helpers.ui_factory import UIFactory
 from robottelo.logging import logger
+from robottelo.utils import subscription_index
 from robottelo.utils.installer import InstallerCommand
 from robottelo.utils.manifest import clone
 
@@ -168,6 +169,7 @@ class ContentInfo:
             result = self.api.Subscription().upload(
                 data={'organization_id': org_id}, files={'content': manifest}
             )
+            self.subscription_index.invalidate(org_id)
         return result
 
     def is_sca_mode_enabled(self, org_id):
@@ -180,6 +182,13 @@ class ContentInfo:
         """
         return self.api.Organization(id=org_id).read().simple_content_access
 
+    @property
+    def subscription_index(self):
+        """Subscriptions of the organizations of this satellite, indexed by name, see
+        :class:`robottelo.utils.subscription_index.SubscriptionIndex`
+        """
+        return subscription_index.get_index(self)
+
     def publish_content_view(self, org, repo_list):
         """This method publishes the content view for a given organization and repository list.
 
@@ -0,0 +1,265 @@
+"""Wait for many foreman tasks at once.
+
+:class:`TaskWatcher` refreshes every watched task of a Satellite with one task search per
+tick from a single background thread, instead of one ``ForemanTask.poll()`` loop per task.
+The tick interval starts at ``min_interval`` and backs off, with jitter, up to
+``max_interval`` while none of the tasks changes.
+"""
+from concurrent.futures import Future, InvalidStateError, wait
+import random
+import threading
+import time
+
+from robottelo.logging import logger
+
+FINISHED_STATES = ('paused', 'stopped')
+
+
+class _Watch:
+    __slots__ = ('task_id', 'future', 'deadline', 'must_succeed', 'poll_rate', 'info')
+
+    def __init__(self, task_id, future, deadline, must_succeed, poll_rate):
+        self.task_id = task_id
+        self.future = future
+        self.deadline = deadline
+        self.must_succeed = must_succeed
+        self.poll_rate = poll_rate
+        self.info = None
+
+
+class TaskWatcher:
+    """Track foreman tasks of one Satellite and resolve a future when each one finishes
+
+    :param search: callable taking a task search query and returning the matching tasks as
+        a list of dicts, as ``ForemanTask().search_json(query=...)['results']`` does
+    :param float min_interval: seconds between the first ticks and after a task changed
+    :param float max_interval: upper bound of the backed off interval
+    :param float backoff: factor the interval grows by on every tick without any change
+    :param float jitter: relative random variation of every interval, so watchers of
+        several workers do not search in lockstep
+    :param int batch_size: maximum number of task ids in one search query
+    """
+
+    def __init__(
+        self, search, min_interval=1, max_interval=15, backoff=1.5, jitter=0.1, batch_size=100
+    ):
+        self._search = search
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.batch_size = batch_size
+        self._watches = {}
+        self._cond = threading.Condition()
+        self._thread = None
+        self._interval = min_interval
+
+    def watch(self, task_id, timeout=None, must_succeed=True, poll_rate=None):
+        """Start watching a task
+
+        :param str task_id: the foreman task id
+        :param float timeout: seconds after which the future fails with
+            ``TaskTimedOutError``, defaults to ``nailgun.entity_mixins.TASK_TIMEOUT``
+        :param bool must_succeed: fail the future with ``TaskFailedError`` if the task
+            finishes with any result other than ``success``
+        :param float poll_rate: the task is refreshed at least this often, regardless of
+            the backoff
+        :return: a ``concurrent.futures.Future`` resolving to the task information, as
+            returned by ``ForemanTask.poll()``
+        """
+        if timeout is None:
+            from nailgun.entity_mixins import TASK_TIMEOUT
+
+            timeout = TASK_TIMEOUT
+        future = Future()
+        watch = _Watch(str(task_id), future, time.monotonic() + timeout, must_succeed, poll_rate)
+        with self._cond:
+            self._watches.setdefault(watch.task_id, []).append(watch)
+            # a new task is refreshed soon, whatever the previous ones backed off to
+            self._interval = self.min_interval
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='foreman-task-watcher', daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def unwatch(self, future):
+        """Stop watching the task of a future returned by :meth:`watch` and cancel it
+
+        Use this rather than ``future.cancel()``, the watch is removed under the watcher
+        condition so the watcher thread does not resolve the future at the same time.
+
+        :return: whether the future was still watched
+        """
+        with self._cond:
+            for task_id, watches in self._watches.items():
+                watch = next((watch for watch in watches if watch.future is future), None)
+                if watch is not None:
+                    watches.remove(watch)
+                    if not watches:
+                        del self._watches[task_id]
+                    future.cancel()
+                    return True
+        return False
+
+    def wait(self, task_ids, timeout=None, must_succeed=True, poll_rate=None):
+        """Watch the tasks and wait until all of them finished
+
+        Takes the same parameters as :meth:`watch`. Once every task finished, raises the
+        error of the first failed one in ``task_ids`` order.
+
+        :return: list of the task information, in the order of ``task_ids``
+        """
+        # the condition is reentrant, holding it makes the first search include every task
+        with self._cond:
+            futures = [
+                self.watch(task_id, timeout=timeout, must_succeed=must_succeed, poll_rate=poll_rate)
+                for task_id in task_ids
+            ]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def _next_interval(self):
+        """Return the sleep before the next tick, called with the condition held"""
+        ceiling = min(
+            [self.max_interval]
+            + [
+                watch.poll_rate
+                for watches in self._watches.values()
+                for watch in watches
+                if watch.poll_rate is not None
+            ]
+        )
+        interval = min(self._interval, ceiling)
+        self._interval = min(self._interval * self.backoff, ceiling)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _run(self):
+        try:
+            self._loop()
+        except Exception as err:
+            # fail the waiters rather than leaving them blocked, deadlines are checked here only
+            logger.exception('Foreman task watcher stopped')
+            with self._cond:
+                watches = [watch for watches in self._watches.values() for watch in watches]
+                self._watches.clear()
+                self._thread = None
+            for watch in watches:
+                self._complete(watch.future.set_exception, err)
+        finally:
+            with self._cond:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                for task_id in [
+                    task_id
+                    for task_id, watches in self._watches.items()
+                    if all(watch.future.cancelled() for watch in watches)
+                ]:
+                    del self._watches[task_id]
+                if not self._watches:
+                    self._thread = None
+                    return
+                task_ids = list(self._watches)
+            changed = self._tick(task_ids)
+            with self._cond:
+                if changed:
+                    self._interval = self.min_interval
+                if self._watches:
+                    self._cond.wait(self._next_interval())
+
+    def _tick(self, task_ids):
+        """Refresh the tasks with one search per batch, return whether any of them changed"""
+        found = {}
+        for start in range(0, len(task_ids), self.batch_size):
+            batch = task_ids[start : start + self.batch_size]
+            query = {'search': f'id ^ ({",".join(batch)})', 'per_page': len(batch)}
+            try:
+                found.update((str(task['id']), task) for task in self._search(query))
+            except Exception as err:
+                logger.warning(f'Failed to refresh foreman tasks {batch}: {err}')
+        changed = False
+        now = time.monotonic()
+        with self._cond:
+            for task_id in task_ids:
+                info = found.get(task_id)
+                for watch in list(self._watches.get(task_id, ())):
+                    if info is not None:
+                        changed |= self._changed(watch.info, info)
+                        watch.info = info
+                    if self._resolve(watch, now):
+                        self._watches[task_id].remove(watch)
+                if not self._watches.get(task_id, True):
+                    del self._watches[task_id]
+        return changed
+
+    @staticmethod
+    def _changed(old, new):
+        keys = ('state', 'result', 'progress')
+        return old is None or any(old.get(key) != new.get(key) for key in keys)
+
+    @staticmethod
+    def _complete(method, value):
+        """Call ``set_result`` or ``set_exception`` of a future, return whether it was set
+
+        ``Future.cancel()`` does not take the condition, a future may be cancelled by another
+        thread after it was checked.
+        """
+        try:
+            method(value)
+        except InvalidStateError:
+            return False
+        return True
+
+    @classmethod
+    def _resolve(cls, watch, now):
+        """Complete the future of a finished or timed out task, return whether it was"""
+        from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+
+        info = watch.info
+        if watch.future.cancelled():
+            return True
+        if info is not None and info.get('state') in FINISHED_STATES:
+            if watch.must_succeed and info.get('result') != 'success':
+                cls._complete(
+                    watch.future.set_exception,
+                    TaskFailedError(
+                        f'Task {watch.task_id} did not succeed. Task information: {info}'
+                    ),
+                )
+            else:
+                cls._complete(watch.future.set_result, info)
+            return True
+        if now >= watch.deadline:
+            cls._complete(
+                watch.future.set_exception,
+                TaskTimedOutError(
+                    f'Timed out polling task {watch.task_id}. Task information: {info}'
+                ),
+            )
+            return True
+        return False
+
+
+_watchers = {}
+_watchers_lock = threading.Lock()
+
+
+def task_watcher(satellite):
+    """Return the task watcher shared by every host object of ``satellite``"""
+    from robottelo.config import settings
+
+    with _watchers_lock:
+        if satellite.url not in _watchers:
+            _watchers[satellite.url] = TaskWatcher(
+                # satellite.api is looked up on every search, nailgun may be swapped at runtime
+                lambda query: satellite.api.ForemanTask().search_json(query=query)['results'],
+                min_interval=settings.performance.task_poll_min_interval,
+                max_interval=settings.performance.task_poll_max_interval,
+            )
+        return _watchers[satellite.url]
@@ -3,7 +3,6 @@ import contextlib
 from contextlib import contextmanager
 from datetime import datetime
 from functools import cached_property, lru_cache
-import importlib
 import io
 import json
 from pathlib import Path, PurePath
@@ -17,19 +16,16 @@ import warnings
 from box import Box
 from broker import Broker
 from broker.hosts import Host
-from dynaconf.vendor.box.exceptions import BoxKeyError
 from fauxfactory import gen_alpha, gen_string
 from manifester import Manifester
 from nailgun import entities
 from packaging.version import Version
 import requests
-from ssh2.exceptions import AuthenticationError
 from wait_for import TimedOutError, wait_for
 from wrapanapi.entities.vm import VmState
 import yaml
 
 from robottelo import constants
-from robottelo.cli.base import Base
 from robottelo.config import (
     configure_airgun,
     configure_nailgun,
@@ -53,9 +49,17 @@ from robottelo.constants import (
     SATELLITE_VERSION,
 )
 from robottelo.exceptions import CLIFactoryError, DownloadFileError, HostPingFailed
-from robottelo.host_helpers import CapsuleMixins, ContentHostMixins, SatelliteMixins
+from robottelo.host_helpers import (
+    CapsuleMixins,
+    ContentHostMixins,
+    SatelliteMixins,
+    fan_out,
+    namespaces,
+    registration_cache,
+    task_watcher,
+)
 from robottelo.logging import logger
-from robottelo.utils import validate_ssh_pub_key
+from robottelo.utils import api_session, satellite_versions, validate_ssh_pub_key
 from robottelo.utils.datafactory import valid_emails_list
 from robottelo.utils.installer import InstallerCommand
 
@@ -80,14 +84,21 @@ def lru_sat_ready_rhel(rhel_ver):
     return sat_ready_rhel
 
 
-def get_sat_version():
-    """Try to read sat_version from envvar SATELLITE_VERSION
-    if not available fallback to ssh connection to get it."""
+def _probe_sat_versions(hostname):
+    """Read the Satellite and RHEL versions of a Satellite host over ssh"""
+    sat = Satellite(hostname)
+    return {'version': sat.version, 'rhel_version': str(sat.os_version)}
 
-    try:
-        sat_version = Satellite().version
-    except (AuthenticationError, ContentHostError, BoxKeyError):
-        if sat_version := str(settings.server.version.get('release')) == 'stream':
+
+def get_sat_version():
+    """Try to read sat_version from the Satellite host, probed once per hostname,
+    if not available fallback to the configuration."""
+    versions = satellite_versions.get(settings.server.hostname, _probe_sat_versions)
+    if versions and versions['version']:
+        sat_version = versions['version']
+    else:
+        sat_version = None
+        if str(settings.server.version.get('release')) == 'stream':
             sat_version = str(settings.robottelo.get('satellite_version'))
         if not sat_version:
             sat_version = SATELLITE_VERSION
@@ -95,16 +106,15 @@ def get_sat_version():
 
 
 def get_sat_rhel_version():
-    """Try to read rhel_version from Satellite host
+    """Try to read rhel_version from the Satellite host, probed once per hostname,
     if not available fallback to robottelo configuration."""
-
-    try:
-        return Satellite().os_version
-    except (AuthenticationError, ContentHostError, BoxKeyError):
-        if hasattr(settings.server.version, 'rhel_version'):
-            rhel_version = str(settings.server.version.rhel_version)
-        elif hasattr(settings.robottelo, 'rhel_version'):
-            rhel_version = settings.robottelo.rhel_version
+    versions = satellite_versions.get(settings.server.hostname, _probe_sat_versions)
+    if versions and versions['rhel_version']:
+        return Version(versions['rhel_version'])
+    if hasattr(settings.server.version, 'rhel_version'):
+        rhel_version = str(settings.server.version.rhel_version)
+    elif hasattr(settings.robottelo, 'rhel_version'):
+        rhel_version = settings.robottelo.rhel_version
     return Version(rhel_version)
 
 
@@ -787,9 +797,25 @@ class ContentHost(Host, ContentHostMixins):
         if force:
             options['force'] = str(force).lower()
 
-        cmd = target.satellite.cli.HostRegistration.generate_command(options)
+        satellite = target.satellite
+        commands = registration_cache.get_cache()
+        cmd = commands.get(
+            commands.key(satellite.hostname, target.hostname, options),
+            lambda: satellite.cli.HostRegistration.generate_command(options),
+        )
         return self.execute(cmd.strip('\n'))
 
+    @classmethod
+    def register_many(cls, hosts, *args, max_workers=None, **kwargs):
+        """Register content hosts concurrently, see :meth:`register` for the arguments
+
+        :param list hosts: the content hosts to register
+        :param int max_workers: maximum number of hosts registered at the same time
+        :return: :class:`robottelo.host_helpers.fan_out.HostResults` holding the
+            registration result or exception of every host
+        """
+        return fan_out.fan_out(hosts, lambda host: host.register(*args, **kwargs), max_workers)
+
     def register_contenthost(
         self,
         org='Default_Organization',
@@ -1224,6 +1250,18 @@ class ContentHost(Host, ContentHostMixins):
                         f'Failed to enable custom repository {repo_label!s}\n{result.stderr}'
                     )
 
+    @classmethod
+    def contenthost_setup_many(cls, hosts, *args, max_workers=None, **kwargs):
+        """Set up content hosts concurrently, see :meth:`contenthost_setup` for the arguments
+
+        :param list hosts: the content hosts to set up
+        :param int max_workers: maximum number of hosts set up at the same time
+        :return: :class:`robottelo.host_helpers.fan_out.HostResults` of the hosts
+        """
+        return fan_out.fan_out(
+            hosts, lambda host: host.contenthost_setup(*args, **kwargs), max_workers
+        )
+
     def virt_who_hypervisor_config(
         self,
         satellite,
@@ -1388,9 +1426,7 @@ class ContentHost(Host, ContentHostMixins):
         virt_who_hypervisor_host = org_hosts[0]
         subscription_id = None
         if hypervisor_hostname and subscription_name:
-            subscriptions = satellite.cli.Subscription.list(
-                {'organization-id': org_id}, per_page=False
-            )
+            subscriptions = satellite.cli.Subscription.iter_list({'organization-id': org_id})
             for subscription in subscriptions:
                 if subscription['name'] == subscription_name:
                     subscription_id = subscription['id']
@@ -1706,29 +1742,10 @@ class Capsule(ContentHost, CapsuleMixins):
 
     @property
     def cli(self):
-        """Import only satellite-maintain robottelo cli entities and wrap them under self.cli"""
-        self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if (
-                file.suffix == '.py'
-                and not file.name.startswith('_')
-                and file.name.startswith('sm_')
-            ):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(name, (obj,), {'hostname': self.hostname})
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
-        return self._cli
+        """satellite-maintain robottelo cli entities bound to this capsule, see
+        :func:`robottelo.host_helpers.namespaces.cli_namespace`
+        """
+        return namespaces.cli_namespace(self.hostname, maintain_only=True)
 
 
 class Satellite(Capsule, SatelliteMixins):
@@ -1740,9 +1757,8 @@ class Satellite(Capsule, SatelliteMixins):
         self.omitting_credentials = False
         self.port = kwargs.get('port', settings.server.port)
         super().__init__(hostname=hostname, **kwargs)
-        # create dummy classes for later population
-        self._api = type('api', (), {'_configured': False})
-        self._cli = type('cli', (), {'_configured': False})
+        # populated on first access
+        self._api = None
         self.record_property = None
 
     def _swap_nailgun(self, new_version):
@@ -1753,78 +1769,53 @@ class Satellite(Capsule, SatelliteMixins):
 
         pip_main(['uninstall', '-y', 'nailgun'])
         pip_main(['install', f'https://github.com/SatelliteQE/nailgun/archive/{new_version}.zip'])
-        self._api = type('api', (), {'_configured': False})
+        self._api = None
+        namespaces.clear_namespaces('api')
         to_clear = [k for k in sys.modules.keys() if 'nailgun' in k]
         [sys.modules.pop(k) for k in to_clear]
 
     @property
     def api(self):
-        """Import all nailgun entities and wrap them under self.api"""
-        if not self._api:
-            self._api = type('api', (), {'_configured': False})
-        if self._api._configured:
-            return self._api
-        from nailgun import entities as _entities  # use a private import
-        from nailgun.config import ServerConfig
-        from nailgun.entity_mixins import Entity
-
-        def inject_config(cls, server_config):
-            """inject a nailgun server config into the init of nailgun entity classes"""
-            import functools
-
-            class DecClass(cls):
-                __init__ = functools.partialmethod(cls.__init__, server_config=server_config)
-
-            return DecClass
-
-        # set the server configuration to point to this satellite
-        self.nailgun_cfg = ServerConfig(
-            auth=(settings.server.admin_username, settings.server.admin_password),
-            url=f'{self.url}',
-            verify=settings.server.verify_ca,
-        )
-        # add each nailgun entity to self.api, injecting our server config
-        for name, obj in _entities.__dict__.items():
-            try:
-                if Entity in obj.mro():
-                    #  create a copy of the class and inject our server config into the __init__
-                    new_cls = type(name, (obj,), {})
-                    setattr(self._api, name, inject_config(new_cls, self.nailgun_cfg))
-            except AttributeError:
-                # not everything has an mro method, we don't care about them
-                pass
-        self._api._configured = True
+        """Nailgun entities bound to this satellite, see
+        :func:`robottelo.host_helpers.namespaces.api_namespace`
+        """
+        if self._api is None:
+            from nailgun.config import ServerConfig
+
+            # set the server configuration to point to this satellite
+            self._api = namespaces.api_namespace(
+                ServerConfig(
+                    auth=(settings.server.admin_username, settings.server.admin_password),
+                    url=f'{self.url}',
+                    verify=settings.server.verify_ca,
+                )
+            )
+            self.nailgun_cfg = self._api.server_config
+            # entities of every ServerConfig share the keep-alive connections to this satellite
+            api_session.get_session(self.url)
+            api_session.install()
         return self._api
 
+    @property
+    def api_metrics(self):
+        """Request, reused connection and byte counters of the nailgun requests to this
+        satellite, see :meth:`robottelo.utils.api_session.SatelliteSession.metrics`
+        """
+        return api_session.get_session(self.url).metrics()
+
+    @property
+    def task_watcher(self):
+        """Foreman task watcher shared by every host object of this satellite, see
+        :class:`robottelo.host_helpers.task_watcher.TaskWatcher`
+        """
+        return task_watcher.task_watcher(self)
+
     @property
     def cli(self):
-        """Import all robottelo cli entities and wrap them under self.cli"""
-        if not self._cli:
-            self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if file.suffix == '.py' and not file.name.startswith('_'):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(
-                                name,
-                                (obj,),
-                                {
-                                    'hostname': self.hostname,
-                                    'omitting_credentials': self.omitting_credentials,
-                                },
-                            )
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
-        return self._cli
+        """Robottelo cli entities bound to this satellite, see
+        :func:`robottelo.host_helpers.namespaces.cli_namespace`
+        """
+        return namespaces.cli_namespace(self.hostname, self.omitting_credentials)
 
     @contextmanager
     def omit_credentials(self):
@@ -2067,13 +2058,8 @@ class Satellite(Capsule, SatelliteMixins):
             ).create()
             task = repo.sync(synchronous=False)
             tasks.append(task)
-        for task in tasks:
-            self.wait_for_tasks(
-                search_query=(f'id = {task["id"]}'),
-                poll_timeout=1500,
-            )
-            task_status = self.api.ForemanTask(id=task['id']).poll()
-            assert task_status['result'] == 'success'
+        task_statuses = self.task_watcher.wait([task['id'] for task in tasks], timeout=1500)
+        assert all(task_status['result'] == 'success' for task_status in task_statuses)
 
         # register contenthost
         rhel_contenthost.install_katello_ca(self)
@@ -2092,7 +2078,7 @@ class Satellite(Capsule, SatelliteMixins):
         rhel_contenthost._satellite = self
 
         # Attach product subscriptions to contenthost, only if SCA mode is disabled
-        if self.is_sca_mode_enabled(module_org.id) is False:
+        if self.subscription_index.sca_enabled(module_org.id) is False:
             subs = self.api.Subscription(organization=module_org, name=prod.name).search()
             assert len(subs), f'Subscription for sat client product: {prod.name} was not found.'
             subscription = subs[0]
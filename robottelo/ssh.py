@@ -1,5 +1,11 @@
 """Utility module to handle the shared ssh connection."""
+from collections import defaultdict
+from contextlib import contextmanager
+import threading
+import time
+
 from robottelo.cli import hammer
+from robottelo.logging import logger
 
 
 def get_client(
@@ -25,6 +31,146 @@ def get_client(
     return client
 
 
+class SSHConnectionPool:
+    """Process-wide pool of live ssh clients keyed by hostname and credentials.
+
+    A client is handed out to a single caller at a time, as an ssh2 session must not be
+    used by several threads at once. Clients that were idle for longer than
+    ``health_check_interval`` seconds are probed before reuse and reconnected when the
+    probe fails. At most ``max_per_host`` clients are opened for the same key, further
+    callers wait until one is released.
+
+    :param int max_per_host: maximum number of open clients per hostname/credentials key
+    :param int health_check_interval: idle time in seconds after which a client is probed
+    :param int checkout_timeout: time in seconds to wait for a free client
+    """
+
+    def __init__(self, max_per_host=8, health_check_interval=60, checkout_timeout=600):
+        self.max_per_host = max_per_host
+        self.health_check_interval = health_check_interval
+        self.checkout_timeout = checkout_timeout
+        self._cond = threading.Condition()
+        self._idle = defaultdict(list)  # key -> [(client, last release time)]
+        self._open = defaultdict(int)  # key -> number of clients idle or in use
+        self._stats = {'hits': 0, 'misses': 0, 'reconnects': 0, 'discarded': 0}
+
+    def _is_alive(self, client):
+        """Run a no-op command to make sure the ssh session is still usable"""
+        try:
+            return client.session.run('true', timeout=10000).status == 0
+        except Exception as err:
+            logger.debug(f'ssh health check for {client.hostname} failed: {err}')
+            return False
+
+    def _acquire(self, key):
+        """Return an idle client for ``key`` or ``None`` if a new one may be opened"""
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._cond:
+            while True:
+                if self._idle[key]:
+                    self._stats['hits'] += 1
+                    return self._idle[key].pop()
+                if self._open[key] < self.max_per_host:
+                    self._open[key] += 1
+                    self._stats['misses'] += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f'No ssh connection to {key[0]} released within '
+                        f'{self.checkout_timeout} seconds'
+                    )
+                self._cond.wait(remaining)
+
+    def _release(self, key, client):
+        with self._cond:
+            self._idle[key].append((client, time.monotonic()))
+            self._cond.notify()
+
+    def _discard(self, key, client):
+        with self._cond:
+            self._open[key] -= 1
+            self._stats['discarded'] += 1
+            self._cond.notify()
+        if client is not None:
+            try:
+                client.close()
+            except Exception as err:
+                logger.debug(f'Failed to close ssh connection to {client.hostname}: {err}')
+
+    @contextmanager
+    def connection(self, hostname=None, username=None, password=None, port=22):
+        """Check out a live client for the given host and credentials.
+
+        The client is returned to the pool when the block exits normally and dropped when
+        it raises, so a broken session is never handed out twice.
+        """
+        from robottelo.config import settings
+
+        hostname = hostname or settings.server.hostname
+        username = username or settings.server.ssh_username
+        password = password or settings.server.ssh_password
+        port = port or settings.server.ssh_client.port
+        key = (hostname, username, password, port)
+        entry = self._acquire(key)
+        client = None
+        try:
+            if entry is None:
+                client = get_client(
+                    hostname=hostname, username=username, password=password, port=port
+                )
+            else:
+                client, last_used = entry
+                idle_time = time.monotonic() - last_used
+                if idle_time > self.health_check_interval and not self._is_alive(client):
+                    logger.debug(f'Reconnecting stale ssh session to {client.hostname}')
+                    client.connect()
+                    with self._cond:
+                        self._stats['reconnects'] += 1
+            yield client
+        except BaseException:
+            self._discard(key, client)
+            raise
+        self._release(key, client)
+
+    def stats(self):
+        """Return a copy of the pool counters along with the number of open clients"""
+        with self._cond:
+            return {**self._stats, 'open': sum(self._open.values())}
+
+    def close_all(self):
+        """Close every idle client and forget about them"""
+        with self._cond:
+            idle = [client for clients in self._idle.values() for client, _ in clients]
+            for key, clients in self._idle.items():
+                self._open[key] -= len(clients)
+            self._idle.clear()
+        for client in idle:
+            try:
+                client.close()
+            except Exception as err:
+                logger.debug(f'Failed to close ssh connection to {client.hostname}: {err}')
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide :class:`SSHConnectionPool`, creating it on first use"""
+    global _pool
+    if _pool is None:
+        from robottelo.config import settings
+
+        with _pool_lock:
+            if _pool is None:
+                _pool = SSHConnectionPool(
+                    max_per_host=settings.server.ssh_client.pool_size,
+                    health_check_interval=settings.server.ssh_client.pool_health_check_interval,
+                )
+    return _pool
+
+
 def command(
     cmd,
     hostname=None,
@@ -36,21 +182,30 @@ def command(
 ):
     """Executes SSH command(s) on remote hostname.
 
-    kwargs are passed through to get_connection
+    The ssh connection is borrowed from the process-wide pool, see :func:`get_pool`.
 
     :param str cmd: The command to run
     :param str output_format: json, csv or None
     :param int timeout: Time to wait for the ssh command to finish.
     :param connection_timeout: Time to wait for establishing the connection.
     """
-    client = get_client(
+    with get_pool().connection(
         hostname=hostname,
         username=username,
         password=password,
         port=port,
-    )
-    result = client.execute(cmd, timeout=timeout)
+    ) as client:
+        result = client.execute(cmd, timeout=timeout)
+    return parse_output(result, output_format)
+
 
+def parse_output(result, output_format=None):
+    """Parse the stdout of a successful hammer command result in place
+
+    :param result: a result object with ``stdout`` and ``status`` attributes
+    :param str output_format: json, csv or None
+    :return: the same result object
+    """
     if output_format and result.status == 0:
         if output_format == 'csv':
             result.stdout = hammer.parse_csv(result.stdout) if result.stdout else {}
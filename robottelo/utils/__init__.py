@@ -1,6 +1,9 @@
 # General utility functions which does not fit into other util modules OR
 # Independent utility functions that doesnt need separate module
 import base64
+import json
+import os
+from pathlib import Path
 import re
 
 from cryptography.hazmat.backends import default_backend as crypto_default_backend
@@ -55,3 +58,18 @@ def slugify_component(string, keep_hyphens=True):
     if not keep_hyphens:
         string = string.replace('-', '_')
     return re.sub("[^-_a-zA-Z0-9]", "", string.lower())
+
+
+def write_json_atomic(path, data):
+    """Write ``data`` as json to ``path``, replacing the file atomically
+
+    Several processes, e.g. pytest-xdist workers, may write the same file at the same time,
+    readers get either the old or the new content, never a partial one.
+
+    :raises OSError: if the file can not be written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}')
+    tmp_path.write_text(json.dumps(data))
+    os.replace(tmp_path, path)
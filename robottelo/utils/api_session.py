@@ -0,0 +1,160 @@
+"""Keep-alive HTTP sessions shared by the nailgun entities of each Satellite.
+
+nailgun sends every request with the module level functions of ``requests``, which open
+a new connection, and TLS session, per call. :func:`install` replaces the ``requests``
+module seen by ``nailgun.client`` with a router sending the requests to a Satellite with a
+:func:`get_session` session through that session, so they reuse pooled connections.
+Requests to any other host are sent as before.
+"""
+import atexit
+from http.cookiejar import DefaultCookiePolicy
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from robottelo.logging import logger
+
+
+class SatelliteSession(requests.Session):
+    """A ``requests.Session`` with a connection pool for a single Satellite
+
+    Cookies are never stored, as entities of the same Satellite authenticate as different
+    users and a Foreman session cookie would take precedence over their credentials. This
+    also leaves the session without shared mutable state, so it can be used from several
+    threads at once.
+
+    :param str url: the Satellite url, e.g. ``https://satellite.example.com``
+    :param int pool_size: the maximum number of connections kept open
+    """
+
+    def __init__(self, url, pool_size=10):
+        super().__init__()
+        self.url = url
+        self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.mount('https://', self._adapter)
+        self.mount('http://', self._adapter)
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'bytes_sent': 0, 'bytes_received': 0}
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        body = request.body
+        sent = len(body) if isinstance(body, bytes | str) else 0
+        if 'Content-Length' in response.headers:
+            received = int(response.headers['Content-Length'])
+        else:
+            received = 0 if kwargs.get('stream') else len(response.content)
+        with self._lock:
+            self._stats['requests'] += 1
+            self._stats['bytes_sent'] += sent
+            self._stats['bytes_received'] += received
+        return response
+
+    def metrics(self):
+        """Return the request and connection counters of the session
+
+        ``connections`` is the number of connections opened, every other request
+        reused a pooled connection and is counted in ``reused``.
+        """
+        pools = self._adapter.poolmanager.pools
+        connections = pool_requests = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                pool_requests += pool.num_requests
+        with self._lock:
+            return {
+                **self._stats,
+                'connections': connections,
+                'reused': max(pool_requests - connections, 0),
+            }
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _key(url):
+    parts = urlsplit(url)
+    return parts.scheme, parts.netloc
+
+
+def get_session(url, pool_size=None):
+    """Return the session used for every request to the Satellite at ``url``
+
+    :param str url: the Satellite url, only its scheme and host are used
+    :param int pool_size: the connection pool size of a new session, defaults to
+        ``settings.server.api_pool_size``
+    """
+    key = _key(url)
+    with _sessions_lock:
+        if key not in _sessions:
+            if pool_size is None:
+                from robottelo.config import settings
+
+                pool_size = settings.server.api_pool_size
+            _sessions[key] = SatelliteSession(f'{key[0]}://{key[1]}', pool_size=pool_size)
+        return _sessions[key]
+
+
+def find_session(url):
+    """Return the session for the host of ``url`` or ``None`` if there is none"""
+    return _sessions.get(_key(url))
+
+
+@atexit.register
+def close_sessions():
+    """Close the pooled connections of every session"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            try:
+                session.close()
+            except Exception as err:
+                logger.debug(f'Failed to close the api session of {session.url}: {err}')
+        _sessions.clear()
+
+
+class SessionRouter:
+    """Stand-in for the ``requests`` module sending requests through Satellite sessions"""
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    def request(self, method, url, **kwargs):
+        session = find_session(url)
+        if session is None:
+            return requests.request(method, url, **kwargs)
+        return session.request(method, url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def get(self, url, params=None, **kwargs):
+        return self.request('GET', url, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url, data=data, **kwargs)
+
+    def patch(self, url, data=None, **kwargs):
+        return self.request('PATCH', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+
+router = SessionRouter()
+
+
+def install():
+    """Route the requests of ``nailgun.client`` through the Satellite sessions"""
+    from nailgun import client
+
+    client.requests = router
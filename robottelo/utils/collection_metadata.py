@@ -0,0 +1,228 @@
+"""Testimony tokens and issue usages of test files, parsed once per file version.
+
+The ``metadata_markers`` and ``issue_handlers`` plugins read the ``:CaseComponent:``,
+``:CaseImportance:``, ``:Team:`` and ``:BZ:`` tokens of the docstrings of every collected
+test, and the ``is_open`` usages in its source. :func:`item_metadata` parses a test file
+with a single AST pass and keeps the result in memory and in
+``<robottelo.tmp_dir>/collection_metadata.json``, keyed by the file path, modification
+time and size, so xdist workers and later sessions reuse it while the file is unchanged.
+"""
+import ast
+import inspect
+import json
+import os
+from pathlib import Path
+import re
+import threading
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.logging import collection_logger as logger
+from robottelo.utils import write_json_atomic
+
+# bump when the parsed data changes, e.g. a new token or a changed regex
+CACHE_VERSION = 1
+CACHE_FILE = 'collection_metadata.json'
+
+COMPONENT = re.compile(
+    # To match :CaseComponent: FooBar
+    r'\s*:CaseComponent:\s*(?P<component>\S*)',
+    re.IGNORECASE,
+)
+
+IMPORTANCE = re.compile(
+    # To match :CaseImportance: Critical
+    r'\s*:CaseImportance:\s*(?P<importance>\S*)',
+    re.IGNORECASE,
+)
+
+TEAM = re.compile(
+    # To match :Team: Rocket
+    r'\s*:Team:\s*(?P<team>\S*)',
+    re.IGNORECASE,
+)
+
+BZ = re.compile(
+    # To match :BZ: 123456, 456789
+    r'\s*:BZ:\s*(?P<bz>.*\S*)',
+    re.IGNORECASE,
+)
+
+IS_OPEN = re.compile(
+    # To match `if is_open('BZ:123456'):`
+    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+NOT_IS_OPEN = re.compile(
+    # To match `if not is_open('BZ:123456'):`
+    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+
+def docstring_tokens(docstring):
+    """Return the testimony tokens of a docstring, None when there is no docstring
+
+    ``component``, ``importance`` and ``team`` hold the first token value, ``bz`` the BZ
+    numbers of the last ``:BZ:`` token.
+    """
+    if docstring is None:
+        return None
+    tokens = {}
+    for name, regex in [('component', COMPONENT), ('importance', IMPORTANCE), ('team', TEAM)]:
+        matches = regex.findall(docstring)
+        tokens[name] = matches[0] if matches else None
+    bz_matches = BZ.findall(docstring)
+    tokens['bz'] = [bz.strip() for bz in bz_matches[-1].split(',')] if bz_matches else []
+    return tokens
+
+
+def source_usages(source):
+    """Return the ``is_open`` and ``not is_open`` issue usages of a source code"""
+    if 'is_open(' not in source:
+        return {'is_open': [], 'not_is_open': []}
+    return {
+        'is_open': [list(match) for match in IS_OPEN.findall(source)],
+        'not_is_open': [list(match) for match in NOT_IS_OPEN.findall(source)],
+    }
+
+
+def parse_source(source):
+    """Parse the metadata of a test file source
+
+    :return: dict with the ``module`` docstring tokens and source usages, and the
+        ``classes`` and ``functions`` docstring tokens and usages keyed by qualified name
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    module_component = COMPONENT.findall(source)
+    metadata = {
+        'module': {
+            'doc': docstring_tokens(ast.get_docstring(tree)),
+            'component': module_component[0] if module_component else None,
+            **source_usages(source),
+        },
+        'classes': {},
+        'functions': {},
+    }
+
+    def visit(nodes, prefix):
+        for node in nodes:
+            if isinstance(node, ast.ClassDef):
+                name = f'{prefix}{node.name}'
+                metadata['classes'][name] = {'doc': docstring_tokens(ast.get_docstring(node))}
+                visit(node.body, f'{name}.')
+            elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+                first = min([node.lineno] + [d.lineno for d in node.decorator_list])
+                function_source = ''.join(lines[first - 1 : node.end_lineno])
+                metadata['functions'][f'{prefix}{node.name}'] = {
+                    'doc': docstring_tokens(ast.get_docstring(node)),
+                    **source_usages(function_source),
+                }
+
+    visit(tree.body, '')
+    return metadata
+
+
+class CollectionMetadataCache:
+    """Parsed test files, kept in memory and in a json file
+
+    :param path: the json cache file, None keeps the parsed files in memory only
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self._files = None
+        self._changed = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        self._files = {}
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as err:
+            logger.warning(f'Ignoring unreadable collection metadata cache {self.path}: {err}')
+            return
+        if data.get('version') == CACHE_VERSION:
+            self._files = data.get('files', {})
+
+    def get(self, filename):
+        """Return the metadata of a test file, parsing it if it changed since cached"""
+        filename = str(filename)
+        stat = os.stat(filename)
+        key = [stat.st_mtime_ns, stat.st_size]
+        with self._lock:
+            if self._files is None:
+                self._load()
+            cached = self._files.get(filename)
+            if cached is not None and cached['key'] == key:
+                self.hits += 1
+                return cached['metadata']
+            self.misses += 1
+            metadata = parse_source(Path(filename).read_text())
+            self._files[filename] = {'key': key, 'metadata': metadata}
+            self._changed = True
+            return metadata
+
+    def save(self):
+        """Write the cache file if a test file was parsed"""
+        with self._lock:
+            if self.path is None or not self._changed:
+                return
+            write_json_atomic(self.path, {'version': CACHE_VERSION, 'files': self._files})
+            self._changed = False
+
+
+cache = CollectionMetadataCache(robottelo_tmp_dir / CACHE_FILE)
+
+
+def _qualname(obj):
+    return getattr(inspect.unwrap(obj), '__qualname__', '')
+
+
+def item_metadata(item):
+    """Return the docstring tokens and ``is_open`` usages of a collected test item
+
+    :return: dict with the ``function``, ``class`` and ``module`` metadata, the class one
+        is None for a test function outside of a class. The metadata is parsed from the
+        source file of the module, items whose function or class is not defined there,
+        e.g. a test imported from another module, are inspected instead.
+    """
+    module, cls, function = item.module, getattr(item, 'cls', None), item.function
+    if inspect.unwrap(function).__module__ != module.__name__:
+        return _inspect_item(module, cls, function)
+    try:
+        metadata = cache.get(module.__file__)
+        function_data = metadata['functions'][_qualname(function)]
+        class_data = metadata['classes'][_qualname(cls)] if cls is not None else None
+    except (KeyError, OSError, SyntaxError, TypeError):
+        return _inspect_item(module, cls, function)
+    # inspect.getdoc takes the docstring of a base class when there is none
+    if function_data['doc'] is None and (doc := inspect.getdoc(function)) is not None:
+        function_data = {**function_data, 'doc': docstring_tokens(doc)}
+    if class_data is not None and class_data['doc'] is None:
+        class_data = {'doc': docstring_tokens(inspect.getdoc(cls))}
+    return {'function': function_data, 'class': class_data, 'module': metadata['module']}
+
+
+def _inspect_item(module, cls, function):
+    try:
+        function_source = inspect.getsource(function)
+    except (OSError, TypeError):
+        function_source = ''
+    module_source = inspect.getsource(module)
+    module_component = COMPONENT.findall(module_source)
+    return {
+        'function': {
+            'doc': docstring_tokens(inspect.getdoc(function)),
+            **source_usages(function_source),
+        },
+        'class': {'doc': docstring_tokens(inspect.getdoc(cls))} if cls is not None else None,
+        'module': {
+            'doc': docstring_tokens(inspect.getdoc(module)),
+            'component': module_component[0] if module_component else None,
+            **source_usages(module_source),
+        },
+    }
@@ -0,0 +1,97 @@
+"""Ordered stages modifying the collected tests in a single walk over the items.
+
+The robottelo collection plugins used to implement ``pytest_collection_modifyitems`` each,
+every one of them walking all the collected items again. They now provide a
+:class:`CollectionStage` each, and ``pytest_plugins/collection_pipeline.py`` runs the
+stages in order: every stage processes an item before the walk moves to the next item, and
+an item deselected by a stage is not passed to the later stages. Stages needing the final
+selection, e.g. after the ``-m`` and ``-k`` filters, implement :meth:`CollectionStage.finish`.
+The time spent in each stage is logged and shown in the terminal summary with ``-v``.
+"""
+import time
+
+
+class CollectionStage:
+    """A step of the collection pipeline, see :class:`CollectionPipeline`"""
+
+    name = None
+
+    def start(self, session, config, items):
+        """Called once before the items are walked, e.g. to read the options"""
+
+    def process(self, item):
+        """Mark or inspect a collected item, return False to deselect it"""
+        return True
+
+    def finish(self, items):
+        """Called with the items left once every collection plugin ran
+
+        :return: iterable of the items to deselect
+        """
+        return ()
+
+
+class CollectionPipeline:
+    """Run collection stages over the collected items
+
+    :param stages: the :class:`CollectionStage` instances, in the order they process an item
+    """
+
+    def __init__(self, stages):
+        self.stages = stages
+        self.timings = {stage.name: 0.0 for stage in stages}
+        self.deselected = {stage.name: 0 for stage in stages}
+
+    def _timed(self, stage, method, *args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self.timings[stage.name] += time.perf_counter() - start
+
+    def run(self, session, config, items):
+        """Walk ``items`` once through every stage, keep the selected ones in place
+
+        :return: list of the deselected items
+        """
+        for stage in self.stages:
+            self._timed(stage, stage.start, session, config, items)
+        perf_counter = time.perf_counter
+        timings = self.timings
+        selected = []
+        deselected = []
+        for item in items:
+            for stage in self.stages:
+                start = perf_counter()
+                keep = stage.process(item)
+                timings[stage.name] += perf_counter() - start
+                if not keep:
+                    self.deselected[stage.name] += 1
+                    deselected.append(item)
+                    break
+            else:
+                selected.append(item)
+        items[:] = selected
+        return deselected
+
+    def finish(self, items):
+        """Call :meth:`CollectionStage.finish` of every stage, keep the selected items in place
+
+        :return: list of the deselected items
+        """
+        deselected = []
+        for stage in self.stages:
+            dropped = set(self._timed(stage, stage.finish, items) or ())
+            if not dropped:
+                continue
+            self.deselected[stage.name] += len(dropped)
+            deselected.extend(item for item in items if item in dropped)
+            items[:] = [item for item in items if item not in dropped]
+        return deselected
+
+    def summary(self):
+        """Return a line per stage with its duration and number of deselected items"""
+        return [
+            f'{name:<30} {self.timings[name]:>8.3f} s {self.deselected[name]:>7} deselected'
+            for name in self.timings
+        ]
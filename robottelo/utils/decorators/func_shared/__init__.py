@@ -1,3 +1,6 @@
+from robottelo.utils.decorators.func_shared.shared import call_shared  # noqa
+from robottelo.utils.decorators.func_shared.shared import clear_shared  # noqa
 from robottelo.utils.decorators.func_shared.shared import shared  # noqa
+from robottelo.utils.decorators.func_shared.shared import shared_key  # noqa
 from robottelo.utils.decorators.func_shared.shared import SharedFunctionError  # noqa
 from robottelo.utils.decorators.func_shared.shared import SharedFunctionException  # noqa
@@ -567,3 +567,52 @@ def shared(
         return main_wrapper(function_)
     else:
         return wait_function
+
+
+def shared_key(name, scope=_get_default_scope, scope_kwargs=None, scope_context=None):
+    """Return the storage key of a result shared with :func:`call_shared`
+
+    :param str name: the name of the shared result, unique in ``scope_context``
+    :param scope: see :func:`shared`
+    :param scope_kwargs: see :func:`shared`
+    :param scope_context: see :func:`shared`
+    """
+    return _get_function_name_key(
+        name, scope=scope, scope_kwargs=scope_kwargs, scope_context=scope_context
+    )
+
+
+def call_shared(key, function, timeout=None, retries=DEFAULT_CALL_RETRIES):
+    """Call ``function`` once for every caller of ``key``, in any process, and return
+    its stored result.
+
+    Unlike :func:`shared`, the result is shared even when the shared function setting is
+    disabled, the caller decides whether to share it.
+
+    :param str key: the storage key, see :func:`shared_key`
+    :param function: callable without arguments returning a json compatible result
+    :param timeout: the time in seconds the result is kept, the share timeout by default
+    :param retries: see :func:`shared`
+    """
+    _check_config()
+    return _SharedFunction(
+        key,
+        function,
+        retries=retries,
+        storage_handler=_get_default_storage_handler(),
+        timeout=SHARE_DEFAULT_TIMEOUT if timeout is None else timeout,
+    )()
+
+
+def clear_shared(key, result=None):
+    """Remove the stored result of ``key`` if its call failed or if it is ``result``
+
+    A result another process stored in the meantime is kept.
+    """
+    _check_config()
+    storage = _get_default_storage_handler()
+    with storage.lock(key) as data:
+        storage.when_lock_acquired(data)
+        value = storage.get(key)
+        if value and (value['state'] == _STATE_FAILED or value['result'] == result):
+            storage.set(key, None)
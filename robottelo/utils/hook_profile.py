@@ -0,0 +1,162 @@
+"""Wall time and allocations of the robottelo plugin imports and hook implementations.
+
+``pytest_plugins/hook_profile.py`` measures the import of every module listed in
+``conftest.pytest_plugins`` and every call of the hook implementations of the robottelo
+plugins and conftest files with :data:`profiler`, and writes a report ranked by wall time
+at the end of the session. The times are self times: the time of the imports and hook calls
+measured inside an import or a hook call is counted for them only.
+
+The allocations are the net number of memory blocks allocated by the interpreter, read with
+``sys.getallocatedblocks()``. That walks the whole heap, so it is read around every import
+but only around the first and every ``ALLOCATION_SAMPLING``-th call of each hook
+implementation, the allocations of a hook implementation are extrapolated from its samples.
+"""
+from functools import wraps
+import json
+from pathlib import Path
+import sys
+import threading
+import time
+
+ALLOCATION_SAMPLING = 50
+
+
+class Profiler:
+    """Calls, self time and allocated blocks per import and hook implementation"""
+
+    def __init__(self):
+        # (kind, name) -> [calls, seconds, sampled calls, sampled blocks]
+        self.entries = {}
+        self._local = threading.local()
+
+    def _add(self, key, seconds, blocks=None):
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = [0, 0.0, 0, 0]
+        entry[0] += 1
+        entry[1] += seconds
+        if blocks is not None:
+            entry[2] += 1
+            entry[3] += blocks
+
+    def _sampled(self, key):
+        entry = self.entries.get(key)
+        return entry is None or entry[0] % ALLOCATION_SAMPLING == 0
+
+    def _measure(self, func, args, kwargs, count_blocks, totals):
+        """Call ``func``, add its self time and allocated blocks to ``totals``"""
+        # running measurements: [seconds, blocks] of the measurements they contain
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        blocks = sys.getallocatedblocks() if count_blocks else 0
+        stack.append([0.0, 0])
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            blocks = sys.getallocatedblocks() - blocks if count_blocks else 0
+            child_seconds, child_blocks = stack.pop()
+            if stack:
+                stack[-1][0] += seconds
+                stack[-1][1] += blocks
+            totals[0] += seconds - child_seconds
+            totals[1] += blocks - child_blocks
+
+    def measure_import(self, name, func, *args, **kwargs):
+        """Call ``func``, importing the module ``name``, and count it"""
+        totals = [0.0, 0]
+        try:
+            return self._measure(func, args, kwargs, True, totals)
+        finally:
+            self._add(('import', name), *totals)
+
+    def wrap_hook(self, name, function, generator=False):
+        """Return ``function``, a hook implementation, counting its calls as ``name``
+
+        :param bool generator: True for hook wrappers, only the time spent in the generator
+            is counted, not the time it is suspended while the other implementations run
+        """
+        key = ('hook', name)
+        if not generator:
+
+            @wraps(function)
+            def timed_hook(*args, **kwargs):
+                count_blocks = self._sampled(key)
+                totals = [0.0, 0]
+                try:
+                    return self._measure(function, args, kwargs, count_blocks, totals)
+                finally:
+                    self._add(key, totals[0], totals[1] if count_blocks else None)
+
+            return timed_hook
+
+        @wraps(function)
+        def timed_wrapper(*args, **kwargs):
+            count_blocks = self._sampled(key)
+            totals = [0.0, 0]
+            try:
+                gen = self._measure(function, args, kwargs, count_blocks, totals)
+                value = self._measure(next, (gen,), {}, count_blocks, totals)
+                while True:
+                    try:
+                        sent = yield value
+                    except BaseException as err:
+                        value = self._measure(gen.throw, (err,), {}, count_blocks, totals)
+                    else:
+                        value = self._measure(gen.send, (sent,), {}, count_blocks, totals)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self._add(key, totals[0], totals[1] if count_blocks else None)
+
+        return timed_wrapper
+
+    def merge(self, entries):
+        """Add the entries of another process, as returned by :meth:`as_list`"""
+        for row in entries:
+            entry = self.entries.setdefault((row['kind'], row['name']), [0, 0.0, 0, 0])
+            entry[0] += row['calls']
+            entry[1] += row['seconds']
+            entry[2] += row['sampled_calls']
+            entry[3] += row['sampled_blocks']
+
+    def as_list(self):
+        """Return the entries ranked by their self time"""
+        rows = []
+        for (kind, name), (calls, seconds, sampled, sampled_blocks) in self.entries.items():
+            rows.append(
+                {
+                    'kind': kind,
+                    'name': name,
+                    'calls': calls,
+                    'seconds': seconds,
+                    'sampled_calls': sampled,
+                    'sampled_blocks': sampled_blocks,
+                    'blocks': round(sampled_blocks / sampled * calls) if sampled else None,
+                }
+            )
+        return sorted(rows, key=lambda row: row['seconds'], reverse=True)
+
+    def report_lines(self, limit=None):
+        """Return the lines of the text report, the ``limit`` slowest entries only if set"""
+        rows = self.as_list()
+        lines = [f'{"kind":<6} {"name":<70} {"calls":>7} {"seconds":>9} {"blocks":>10}']
+        for row in rows[:limit]:
+            blocks = '' if row['blocks'] is None else row['blocks']
+            lines.append(
+                f'{row["kind"]:<6} {row["name"][-70:]:<70} {row["calls"]:>7} '
+                f'{row["seconds"]:>9.3f} {blocks:>10}'
+            )
+        return lines
+
+    def write_report(self, path):
+        """Write the report to ``<path>.json`` and ``<path>.txt``"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.with_name(f'{path.name}.json').write_text(json.dumps(self.as_list(), indent=2))
+        path.with_name(f'{path.name}.txt').write_text('\n'.join(self.report_lines()) + '\n')
+
+
+profiler = Profiler()
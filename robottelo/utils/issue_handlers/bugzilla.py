@@ -1,15 +1,21 @@
 from collections import defaultdict
+from concurrent import futures
+import copy
+import json
 import re
+import threading
+import time
 
 from packaging.version import Version
 import pytest
 import requests
 from tenacity import retry, stop_after_attempt, wait_fixed
 
-from robottelo.config import settings
+from robottelo.config import robottelo_tmp_dir, settings
 from robottelo.constants import CLOSED_STATUSES, OPEN_STATUSES, WONTFIX_RESOLUTIONS
 from robottelo.hosts import get_sat_version
 from robottelo.logging import logger
+from robottelo.utils import write_json_atomic
 
 # match any version as in `sat-6.2.x` or `sat-6.2.0` or `6.2.9`
 # The .version group being a `d.d` string that can be casted to Version()
@@ -117,6 +123,13 @@ def collect_data_bz(collected_data, cached_data):  # pragma: no cover
         collected_data {dict} -- dict with BZs collected by pytest
         cached_data {dict} -- Cached data previous loaded from API
     """
+    if not cached_data and settings.bugzilla.api_key:
+        # request the BZs, their duplicates and their clones in a few bulk queries
+        store = get_store()
+        store.fetch_closure(
+            [item.partition(':')[-1] for item in collected_data if item.startswith('BZ:')]
+        )
+        store.save()
     bz_data = (
         get_data_bz(
             [item.partition(':')[-1] for item in collected_data if item.startswith('BZ:')],
@@ -178,11 +191,174 @@ def collect_clones(bz, collected_data, cached_data=None):  # pragma: no cover
 # cannot use lru_cache in functions that has unhashable args
 CACHED_RESPONSES = defaultdict(dict)
 
+BZ_FIELDS = [
+    "id",
+    "summary",
+    "status",
+    "resolution",
+    "cf_last_closed",
+    "last_change_time",
+    "creation_time",
+    "flags",
+    "keywords",
+    "dupe_of",
+    "target_milestone",
+    "cf_clone_of",
+    "clone_ids",
+    "depends_on",
+]
+# Following fields are dynamically calculated/loaded
+for field in ('is_open', 'clones', 'version'):
+    assert field not in BZ_FIELDS
+
+# maximum number of BZs requested by a single query
+BATCH_SIZE = 100
+STORE_FILE = 'bugzilla_cache.json'
+
+
+class BugzillaStore:
+    """Bugzilla REST API data per BZ number, persisted in a json file
+
+    Every BZ is kept ``ttl`` seconds, BZs missing or older than that are requested again,
+    in queries of ``BATCH_SIZE`` BZs run concurrently on a pooled session.
+
+    :param str url: the Bugzilla url
+    :param str api_key: the Bugzilla api key
+    :param path: the json file, None keeps the data in memory only
+    :param int ttl: seconds a BZ is used before it is requested again, 0 always requests
+    :param int max_workers: maximum number of concurrent queries
+    """
+
+    def __init__(self, url, api_key, path=None, ttl=3600, max_workers=4):
+        self.url = url
+        self.api_key = api_key
+        self.path = path
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self._bugs = None
+        self._lock = threading.Lock()
+        self._session = None
+        self.requests = 0
+
+    def _load(self):
+        self._bugs = {}
+        if self.path and self.ttl:
+            try:
+                with open(self.path) as store_file:
+                    self._bugs = json.load(store_file)
+            except (OSError, ValueError):
+                pass
+
+    def save(self):
+        """Write the BZ data to the json file"""
+        if not self.path or not self.ttl or self._bugs is None:
+            return
+        with self._lock:
+            bugs = dict(self._bugs)
+        try:
+            write_json_atomic(self.path, bugs)
+        except OSError as err:
+            logger.warning(f'Failed to persist the Bugzilla data: {err}')
+
+    def _fresh(self, numbers):
+        """Return the stored data of the BZs of ``numbers`` that did not expire"""
+        now = time.time()
+        with self._lock:
+            if self._bugs is None:
+                self._load()
+            return {
+                number: self._bugs[number]['data']
+                for number in numbers
+                if number in self._bugs and now - self._bugs[number]['fetched'] < self.ttl
+            }
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+                self._session.mount('https://', adapter)
+                self._session.mount('http://', adapter)
+                self._session.headers['Authorization'] = f'Bearer {self.api_key}'
+            return self._session
+
+    @retry(
+        stop=stop_after_attempt(4),  # Retry 3 times before raising
+        wait=wait_fixed(20),  # Wait seconds between retries
+    )
+    def _request(self, numbers):
+        with self._lock:
+            self.requests += 1
+        response = self.session.get(
+            f'{self.url}/rest/bug',
+            params={'id': ','.join(numbers), 'include_fields': ','.join(BZ_FIELDS)},
+        )
+        response.raise_for_status()
+        return response.json().get('bugs')
+
+    def fetch(self, numbers):
+        """Return the data of the BZs of ``numbers``, requesting only the expired ones
+
+        :param numbers: BZ numbers, as strings
+        :return: dict mapping the BZ numbers to a copy of their data, a BZ the API did not
+            return, e.g. a private one, is missing
+        """
+        numbers = list(dict.fromkeys(str(number) for number in numbers))
+        bugs = self._fresh(numbers)
+        missing = [number for number in numbers if number not in bugs]
+        if missing:
+            logger.debug(f"Calling Bugzilla API for {set(missing)}")
+            batches = [missing[i : i + BATCH_SIZE] for i in range(0, len(missing), BATCH_SIZE)]
+            with futures.ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(batches))
+            ) as executor:
+                responses = list(executor.map(self._request, batches))
+            now = time.time()
+            with self._lock:
+                for bz in (bz for response in responses for bz in response or []):
+                    self._bugs[str(bz['id'])] = {'data': bz, 'fetched': now}
+                    bugs[str(bz['id'])] = bz
+        return {number: copy.deepcopy(bugs[number]) for number in numbers if number in bugs}
+
+    def fetch_closure(self, numbers):
+        """Fetch the BZs of ``numbers`` with their duplicates and clones, level by level
+
+        Each level of duplicates and clones is requested with bulk queries.
+        """
+        known = set()
+        pending = {str(number) for number in numbers}
+        while pending:
+            known |= pending
+            related = set()
+            for bz in self.fetch(pending).values():
+                if bz.get('resolution') == 'DUPLICATE' and bz.get('dupe_of'):
+                    related.add(str(bz['dupe_of']))
+                related.update(str(clone) for clone in bz.get('clone_ids') or [])
+                if bz.get('cf_clone_of'):
+                    related.add(str(bz['cf_clone_of']))
+            pending = related - known
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the Bugzilla store of this process"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = BugzillaStore(
+                settings.bugzilla.url,
+                settings.bugzilla.api_key,
+                path=robottelo_tmp_dir / STORE_FILE,
+                ttl=settings.bugzilla.cache_ttl,
+                max_workers=settings.bugzilla.max_workers,
+            )
+        return _store
+
 
-@retry(
-    stop=stop_after_attempt(4),  # Retry 3 times before raising
-    wait=wait_fixed(20),  # Wait seconds between retries
-)
 def get_data_bz(bz_numbers, cached_data=None):  # pragma: no cover
     """Get a list of marked BZ data and query Bugzilla REST API.
 
@@ -216,38 +392,8 @@ def get_data_bz(bz_numbers, cached_data=None):  # pragma: no cover
         # Provide default data for collected BZs
         return [get_default_bz(number) for number in bz_numbers]
 
-    # No cached data so Call Bugzilla API
-    logger.debug(f"Calling Bugzilla API for {set(bz_numbers)}")
-    bz_fields = [
-        "id",
-        "summary",
-        "status",
-        "resolution",
-        "cf_last_closed",
-        "last_change_time",
-        "creation_time",
-        "flags",
-        "keywords",
-        "dupe_of",
-        "target_milestone",
-        "cf_clone_of",
-        "clone_ids",
-        "depends_on",
-    ]
-    # Following fields are dynamically calculated/loaded
-    for field in ('is_open', 'clones', 'version'):
-        assert field not in bz_fields
-
-    response = requests.get(
-        f"{settings.bugzilla.url}/rest/bug",
-        params={
-            "id": ",".join(set(bz_numbers)),
-            "include_fields": ",".join(bz_fields),
-        },
-        headers={"Authorization": f"Bearer {settings.bugzilla.api_key}"},
-    )
-    response.raise_for_status()
-    data = response.json().get('bugs')
+    # No cached data so get it from the store, which calls Bugzilla API for expired BZs
+    data = list(get_store().fetch(bz_numbers).values())
     CACHED_RESPONSES['get_data'][str(sorted(bz_numbers))] = data
     return data
 
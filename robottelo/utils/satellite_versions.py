@@ -0,0 +1,126 @@
+"""Satellite and RHEL versions of Satellite hosts, probed once per hostname.
+
+``get_sat_version`` and ``get_sat_rhel_version`` used to open an ssh connection to the
+Satellite on every call, including during test collection on every pytest-xdist worker.
+:func:`get` probes a hostname once, in a background thread waited for at most
+``performance.version_probe_timeout`` seconds, and keeps the versions in memory for the
+session. The versions are also kept in ``<robottelo.tmp_dir>/satellite_versions.json`` for
+``performance.version_cache_ttl`` seconds, 0 by default as an upgraded or re-provisioned
+Satellite keeps its hostname. The pytest-xdist controller passes the versions it probed,
+or that the probe failed, to the workers, see ``pytest_plugins/satellite_versions.py``.
+Callers fall back to the configured versions when the Satellite can not be probed in time.
+"""
+import json
+import threading
+import time
+
+from robottelo.config import robottelo_tmp_dir, settings
+from robottelo.logging import logger
+from robottelo.utils import write_json_atomic
+
+CACHE_FILE = 'satellite_versions.json'
+
+
+class VersionCache:
+    """Probed versions per hostname
+
+    :param path: the json file the versions are persisted in, None keeps them in memory
+    :param int ttl: seconds the persisted versions are used, 0 disables the file
+    """
+
+    def __init__(self, path=None, ttl=0):
+        self.path = path
+        self.ttl = ttl
+        self._versions = {}
+        self._probes = {}
+        self._lock = threading.Lock()
+
+    def _read_file(self):
+        if not self.path or not self.ttl:
+            return {}
+        try:
+            with open(self.path) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_file(self, hostname, versions):
+        if not self.path or not self.ttl:
+            return
+        data = self._read_file()
+        data[hostname] = versions
+        try:
+            write_json_atomic(self.path, data)
+        except OSError as err:
+            logger.warning(f'Failed to persist the versions of {hostname}: {err}')
+
+    def snapshot(self):
+        """Return the probed versions, e.g. to pass them to pytest-xdist workers
+
+        A hostname whose probe failed or timed out maps to None, so the workers fall back
+        to the configured versions rather than probing it again.
+        """
+        with self._lock:
+            return {hostname: dict(v) if v else None for hostname, v in self._versions.items()}
+
+    def update(self, versions):
+        """Add versions probed by another process, None for a hostname not to probe"""
+        with self._lock:
+            self._versions.update(versions)
+
+    def get(self, hostname, probe, timeout):
+        """Return the versions of ``hostname``, None when they could not be probed in time
+
+        :param str hostname: the Satellite hostname
+        :param probe: callable returning a dict of the versions of ``hostname``, e.g.
+            ``{'version': '6.16.0', 'rhel_version': '9.4'}``
+        :param timeout: seconds to wait for the probe, the probe keeps running after that and
+            its result is used by later calls
+        """
+        with self._lock:
+            if hostname in self._versions:
+                return self._versions[hostname]
+            cached = self._read_file().get(hostname)
+            if cached and time.time() - cached.get('probed', 0) < self.ttl:
+                self._versions[hostname] = cached
+                return cached
+            thread = self._probes.get(hostname)
+            if thread is None:
+                thread = threading.Thread(
+                    target=self._probe,
+                    args=(hostname, probe),
+                    name=f'version_probe_{hostname}',
+                    daemon=True,
+                )
+                self._probes[hostname] = thread
+                thread.start()
+        thread.join(timeout)
+        with self._lock:
+            if hostname not in self._versions:
+                # later calls do not wait, the probe sets the versions once it finishes
+                logger.warning(f'Versions of {hostname} not probed in {timeout} s')
+                self._versions[hostname] = None
+            return self._versions[hostname]
+
+    def _probe(self, hostname, probe):
+        try:
+            versions = {**probe(hostname), 'probed': time.time()}
+        except Exception as err:
+            logger.warning(f'Failed to probe the versions of {hostname}: {err}')
+            versions = None
+        with self._lock:
+            # a failed probe is not retried in this process, nor persisted
+            self._versions[hostname] = versions
+            self._probes.pop(hostname, None)
+        if versions:
+            self._write_file(hostname, versions)
+
+
+cache = VersionCache(robottelo_tmp_dir / CACHE_FILE, ttl=settings.performance.version_cache_ttl)
+
+
+def get(hostname, probe):
+    """Return the versions of the Satellite ``hostname``, see :meth:`VersionCache.get`"""
+    if not hostname:
+        return None
+    return cache.get(hostname, probe, settings.performance.version_probe_timeout)
@@ -0,0 +1,128 @@
+"""Run the steps of a setup flow concurrently, in the order their dependencies allow.
+
+A step is a callable whose parameter names are the names of the steps it takes the result
+of, steps it only has to run after are listed in ``requires``::
+
+    graph = StepGraph('setup')
+    graph.add('org_id', lambda: make_org()['id'])
+    graph.add('env_id', lambda org_id: make_lce({'organization-id': org_id})['id'])
+    graph.add('cv_id', lambda org_id: make_cv({'organization-id': org_id})['id'])
+    graph.add('publish', lambda cv_id: publish(cv_id), requires=['env_id'])
+    results = graph.run()
+
+``env_id`` and ``cv_id`` only depend on ``org_id`` and run at the same time.
+"""
+from collections import namedtuple
+from concurrent import futures
+import inspect
+import threading
+import time
+
+from robottelo.logging import logger
+
+StepTiming = namedtuple('StepTiming', 'name start end thread')
+
+
+class StepGraph:
+    """Dependency graph of named steps
+
+    :param str name: the flow name, used in the logged timing trace
+    :param int max_workers: maximum number of steps running at the same time
+    """
+
+    def __init__(self, name, max_workers=4):
+        self.name = name
+        self.max_workers = max_workers
+        self._steps = {}
+        self.trace = []
+
+    def add(self, name, func, requires=()):
+        """Add a step
+
+        :param str name: the step name, its result is passed to the steps with a parameter
+            of that name
+        :param func: the callable run by the step
+        :param requires: names of the steps to run before, without taking their result
+        """
+        if name in self._steps:
+            raise ValueError(f'Step {name!r} already in {self.name}')
+        params = list(inspect.signature(func).parameters)
+        self._steps[name] = (func, params, set(params) | set(requires))
+
+    def value(self, name, value):
+        """Add a step with a known result, e.g. an entity id given by the caller"""
+        self.add(name, lambda: value)
+
+    def _check(self):
+        for name, (_, _, deps) in self._steps.items():
+            if unknown := deps - self._steps.keys():
+                raise ValueError(f'Step {name!r} of {self.name} requires unknown {unknown}')
+        done, remaining = set(), dict(self._steps)
+        while remaining:
+            ready = [name for name, (_, _, deps) in remaining.items() if deps <= done]
+            if not ready:
+                raise ValueError(f'Steps {sorted(remaining)} of {self.name} form a cycle')
+            done.update(ready)
+            for name in ready:
+                del remaining[name]
+
+    def run(self):
+        """Run every step, at most ``max_workers`` at a time
+
+        Once a step failed no other step is started, its exception is raised when the
+        running ones finished.
+
+        :return: dict mapping every step name to its result
+        """
+        self._check()
+        results = {}
+        self.trace = []
+        origin = time.monotonic()
+
+        def run_step(name):
+            func, params, _ = self._steps[name]
+            start = time.monotonic() - origin
+            try:
+                return func(**{param: results[param] for param in params})
+            finally:
+                self.trace.append(
+                    StepTiming(
+                        name, start, time.monotonic() - origin, threading.current_thread().name
+                    )
+                )
+
+        pending = dict(self._steps)
+        running = {}
+        error = None
+        with futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=self.name
+        ) as executor:
+            while True:
+                if error is None:
+                    for name in [
+                        name for name, (_, _, deps) in pending.items() if deps <= results.keys()
+                    ]:
+                        del pending[name]
+                        running[executor.submit(run_step, name)] = name
+                if not running:
+                    break
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                    else:
+                        results[name] = future.result()
+        self.trace.sort(key=lambda timing: timing.start)
+        logger.info(f'{self.name} steps:\n{self.format_trace()}')
+        if error is not None:
+            raise error
+        return results
+
+    def format_trace(self):
+        """Return the timing trace of the last run, one step per line"""
+        return '\n'.join(
+            f'{timing.start:8.2f}s {timing.end:8.2f}s {timing.end - timing.start:8.2f}s '
+            f'{timing.name} [{timing.thread}]'
+            for timing in self.trace
+        )
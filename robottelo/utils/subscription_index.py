@@ -0,0 +1,119 @@
+"""Per organization index of the subscription names of a Satellite.
+
+The activation key helpers look subscriptions up by name. The index lists the subscriptions
+of an organization once and answers these lookups from a dict, a name not found reloads
+the organization once, e.g. for the subscription of a just created product. Manifest
+changes made through robottelo (``Satellite.upload_manifest``, the hammer ``subscription``
+commands) drop the organization from the index, changes made otherwise require
+:func:`invalidate`.
+
+Only the names and ids are served from the index. Tests also change the manifests, the
+consumed quantities and the SCA mode directly with nailgun, e.g.
+``Organization.sca_disable``, so whether an organization has a manifest, the quantities
+and the SCA mode are read from the Satellite on every call.
+"""
+import threading
+
+
+class OrgSubscriptions:
+    """The subscriptions of an organization, indexed by name
+
+    :param list subscriptions: the subscriptions, as listed by hammer
+    """
+
+    def __init__(self, subscriptions):
+        self.subscriptions = list(subscriptions)
+        self._by_name = {}
+        for subscription in self.subscriptions:
+            self._by_name.setdefault(subscription['name'], subscription)
+
+    def __len__(self):
+        return len(self.subscriptions)
+
+    def __iter__(self):
+        return iter(self.subscriptions)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def get(self, name):
+        """Return the first subscription named ``name`` or None"""
+        return self._by_name.get(name)
+
+    @property
+    def has_manifest(self):
+        """Whether the organization has a manifest, i.e. a subscription with an account"""
+        return any(subscription.get('account') for subscription in self.subscriptions)
+
+
+class SubscriptionIndex:
+    """Subscriptions of the organizations of one Satellite, indexed by name
+
+    :param list_subscriptions: callable returning the subscriptions of an organization id
+    :param read_sca_mode: callable returning whether SCA is enabled for an organization id
+    """
+
+    def __init__(self, list_subscriptions, read_sca_mode):
+        self._list_subscriptions = list_subscriptions
+        self._read_sca_mode = read_sca_mode
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    def subscriptions(self, org_id, reload=False):
+        """Return the :class:`OrgSubscriptions` of an organization"""
+        key = str(org_id)
+        with self._lock:
+            if reload or key not in self._subscriptions:
+                self._subscriptions[key] = OrgSubscriptions(self._list_subscriptions(org_id))
+            return self._subscriptions[key]
+
+    def find(self, org_id, name, reload=False):
+        """Return the first subscription of the organization named ``name`` or None
+
+        :param bool reload: list the subscriptions again, e.g. for their current quantity
+        """
+        subscription = self.subscriptions(org_id, reload=reload).get(name)
+        if subscription is None and not reload:
+            subscription = self.subscriptions(org_id, reload=True).get(name)
+        return subscription
+
+    def has_manifest(self, org_id):
+        """Return whether the organization has a manifest, listing its subscriptions again"""
+        return self.subscriptions(org_id, reload=True).has_manifest
+
+    def sca_enabled(self, org_id):
+        """Return whether Simple Content Access is enabled for the organization, read on
+        every call"""
+        return self._read_sca_mode(org_id)
+
+    def invalidate(self, org_id=None):
+        """Drop an organization, or every organization if ``org_id`` is None"""
+        with self._lock:
+            if org_id is None:
+                self._subscriptions.clear()
+            else:
+                self._subscriptions.pop(str(org_id), None)
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(satellite):
+    """Return the subscription index shared by every host object of ``satellite``"""
+    with _indexes_lock:
+        if satellite.hostname not in _indexes:
+            _indexes[satellite.hostname] = SubscriptionIndex(
+                lambda org_id: satellite.cli.Subscription.list(
+                    {'organization-id': org_id}, per_page=False
+                ),
+                satellite.is_sca_mode_enabled,
+            )
+        return _indexes[satellite.hostname]
+
+
+def invalidate(hostname, org_id=None):
+    """Drop an organization of the Satellite ``hostname`` from its index, if any"""
+    index = _indexes.get(hostname)
+    if index is not None:
+        index.invalidate(org_id)
@@ -0,0 +1,63 @@
+"""Compare the lazy shared ``Satellite.cli`` namespaces with eagerly built ones.
+
+Usage::
+
+    python scripts/benchmark_entity_namespaces.py [--hosts N] [--objects N] [--classes N]
+
+Every host object accesses the first ``--classes`` cli classes. The eager namespace is
+built the way ``Satellite.cli`` was before :mod:`robottelo.host_helpers.namespaces`, once
+per host object. The benchmark runs in a fresh interpreter so the first namespace pays for
+importing the cli modules.
+"""
+import argparse
+import importlib
+import time
+
+from robottelo.cli.base import Base
+from robottelo.host_helpers import namespaces
+
+
+def eager_cli(hostname):
+    """Import every cli module and subclass all of its Base subclasses"""
+    cli = type('cli', (), {})
+    for path in sorted(namespaces.CLI_DIR.glob('*.py')):
+        if path.name.startswith('_'):
+            continue
+        module = importlib.import_module(f'robottelo.cli.{path.stem}')
+        for name, obj in module.__dict__.items():
+            if isinstance(obj, type) and issubclass(obj, Base):
+                setattr(cli, name, type(name, (obj,), {'hostname': hostname}))
+    return cli
+
+
+def lazy_cli(hostname):
+    return namespaces.cli_namespace(hostname)
+
+
+def run(build, hosts, objects, names):
+    start = time.perf_counter()
+    for index in range(objects):
+        cli = build(f'sat{index % hosts}.example.com')
+        for name in names:
+            getattr(cli, name)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hosts', type=int, default=4, help='distinct Satellite hostnames')
+    parser.add_argument('--objects', type=int, default=200, help='host objects created')
+    parser.add_argument('--classes', type=int, default=5, help='cli classes accessed')
+    args = parser.parse_args()
+    names = sorted(name for name in namespaces.cli_index() if name != 'Base')[: args.classes]
+    # lazy first, the eager build would import every module on its behalf
+    for label, build in (('lazy', lazy_cli), ('eager', eager_cli)):
+        seconds = run(build, args.hosts, args.objects, names)
+        print(
+            f'{label:<6} {seconds * 1000:9.1f} ms for {args.objects} host objects on '
+            f'{args.hosts} hostnames, {seconds / args.objects * 1e6:9.1f} us each'
+        )
+
+
+if __name__ == '__main__':
+    main()
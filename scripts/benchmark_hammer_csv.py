@@ -0,0 +1,87 @@
+"""Compare the streaming hammer CSV parser with the former sniffer based one.
+
+Usage::
+
+    python scripts/benchmark_hammer_csv.py [RECORDED_OUTPUT ...] [--rows N] [--repeat N]
+
+RECORDED_OUTPUT files hold the stdout of ``hammer --output=csv ... list`` commands. When
+none is given, a package list output with ``--rows`` rows is generated.
+"""
+import argparse
+import csv
+import gc
+from pathlib import Path
+import time
+import tracemalloc
+
+from robottelo.cli import hammer
+
+
+def sniffer_parse_csv(output):
+    """The parser used before :func:`robottelo.cli.hammer.iter_csv`"""
+    is_rex = 'Job invocation' in output
+    try:
+        csv.Sniffer().sniff(output)
+    except csv.Error:
+        if not is_rex:
+            return output
+    output = output.splitlines()[0:2] if is_rex else output.splitlines()
+    reader = csv.reader(output)
+    keys = [hammer._normalize(header) for header in next(reader)]
+    return [dict(zip(keys, values, strict=True)) for values in reader if len(values) > 0]
+
+
+def package_list_output(rows):
+    """Generate the output of ``hammer --output=csv package list`` with ``rows`` packages"""
+    lines = ['Id,Filename,Source RPM']
+    lines.extend(
+        f'{i},package-{i}-1.{i % 7}.{i % 13}-1.el8.x86_64.rpm,'
+        f'package-{i}-1.{i % 7}.{i % 13}-1.el8.src.rpm'
+        for i in range(rows)
+    )
+    return '\n'.join(lines) + '\n'
+
+
+PARSERS = {
+    'sniffer': sniffer_parse_csv,
+    'streaming': hammer.parse_csv,
+    'streaming compact': lambda output: hammer.parse_csv(output, compact=True),
+    'streaming lazy': lambda output: sum(1 for _ in hammer.iter_csv(output, compact=True)),
+}
+
+
+def measure(parser, output, repeat):
+    """Return the best wall time in seconds and the peak memory in bytes of ``parser``"""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        parser(output)
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    result = parser(output)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('outputs', nargs='*', type=Path, help='recorded hammer csv outputs')
+    parser.add_argument('--rows', type=int, default=100000, help='rows of generated output')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per parser')
+    args = parser.parse_args()
+    outputs = {path.name: path.read_text() for path in args.outputs} or {
+        f'package list ({args.rows} rows)': package_list_output(args.rows)
+    }
+    for name, output in outputs.items():
+        print(f'{name}: {len(output) / 2**20:.1f} MiB')
+        for parser_name, parse in PARSERS.items():
+            seconds, peak = measure(parse, output, args.repeat)
+            print(f'  {parser_name:<18} {seconds * 1000:9.1f} ms {peak / 2**20:9.1f} MiB peak')
+
+
+if __name__ == '__main__':
+    main()
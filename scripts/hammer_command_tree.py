@@ -1,26 +1,21 @@
 """Generate hammer command tree in json format by inspecting every command's
 help.
 
+The tree is also saved to the hammer schema cache of the Satellite version when
+``settings.performance.hammer_schema_dir`` is set, see :mod:`robottelo.cli.hammer_schema`.
+
 """
 import json
 
-from robottelo import ssh
-from robottelo.cli import hammer
+from robottelo.cli import hammer_schema
 from robottelo.config import settings
 
-
-def generate_command_tree(command):
-    """Recursively walk trhough the hammer commands and subcommands and fetch
-    their help. Return a dictionary with the contents.
-    """
-    output = ssh.command(f'{command} --help', hostname=settings.server.hostnames[0]).stdout
-    contents = hammer.parse_help(output)
-    if len(contents['subcommands']) > 0:
-        for subcommand in contents['subcommands']:
-            subcommand.update(generate_command_tree('{} {}'.format(command, subcommand['name'])))
-    return contents
-
+command_tree = hammer_schema.build_schema(hostname=settings.server.hostnames[0])
 
 # Generate the json file in the working directory
 with open('hammer_commands.json', 'w') as f:
-    f.write(json.dumps(generate_command_tree('hammer'), indent=2, sort_keys=True))
+    f.write(json.dumps(command_tree, indent=2, sort_keys=True))
+
+if settings.performance.hammer_schema_dir:
+    path = hammer_schema.save_schema(command_tree, settings.server.version.release)
+    print(f'Saved hammer schema to {path}')
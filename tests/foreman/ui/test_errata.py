@@ -1402,8 +1402,7 @@ def test_content_host_errata_search_commands(
     with Broker(
         nick=module_repos_collection_with_setup.distro, host_class=ContentHost, _count=2
     ) as clients:
-        for client in clients:
-            module_repos_collection_with_setup.setup_virtual_machine(client)
+        module_repos_collection_with_setup.setup_virtual_machines(clients).raise_for_errors()
         # Install pkg walrus-0.71-1.noarch to create need for RHSA on client 1
         assert clients[0].execute(f'yum install -y {FAKE_1_CUSTOM_PACKAGE}').status == 0
         # Install pkg kangaroo-0.1-1.noarch to create need for RHBA on client 2
@@ -68,8 +68,8 @@ def module_repos_collection(module_org_with_parameter, module_lce, module_target
 def vm_content_hosts(smart_proxy_location, module_repos_collection, module_target_sat):
     distro = module_repos_collection.distro
     with Broker(nick=distro, host_class=ContentHost, _count=2) as clients:
+        module_repos_collection.setup_virtual_machines(clients).raise_for_errors()
         for client in clients:
-            module_repos_collection.setup_virtual_machine(client)
             client.add_rex_key(satellite=module_target_sat)
             module_target_sat.api_factory.update_vm_host_location(client, smart_proxy_location.id)
         yield clients
@@ -80,8 +80,8 @@ def vm_content_hosts_module_stream(
     smart_proxy_location, module_repos_collection_with_manifest, module_target_sat
 ):
     with Broker(nick='rhel8', host_class=ContentHost, _count=2) as clients:
+        module_repos_collection_with_manifest.setup_virtual_machines(clients).raise_for_errors()
         for client in clients:
-            module_repos_collection_with_manifest.setup_virtual_machine(client)
             client.add_rex_key(satellite=module_target_sat)
             module_target_sat.api_factory.update_vm_host_location(client, smart_proxy_location.id)
         yield clients
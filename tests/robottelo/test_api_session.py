@@ -0,0 +1,92 @@
+"""Tests for module ``robottelo.utils.api_session``."""
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+
+from robottelo.utils import api_session
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{"path": "%s"}' % self.path.encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', '_session_id=abc; path=/')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    api_session.close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_reuses_connections(server_url):
+    session = api_session.get_session(f'{server_url}/api/v2', pool_size=4)
+    assert api_session.get_session(server_url) is session
+    for _ in range(5):
+        assert session.post(f'{server_url}/api/v2/hosts', data=b'{}').json() == {
+            'path': '/api/v2/hosts'
+        }
+    assert not session.cookies
+    metrics = session.metrics()
+    assert metrics['requests'] == 5
+    assert metrics['connections'] == 1
+    assert metrics['reused'] == 4
+    assert metrics['bytes_sent'] == 10
+    assert metrics['bytes_received'] == 5 * len(b'{"path": "/api/v2/hosts"}')
+
+
+def test_concurrent_requests_are_pooled(server_url):
+    session = api_session.get_session(server_url, pool_size=4)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        paths = list(
+            executor.map(
+                lambda index: api_session.router.get(f'{server_url}/{index}').json()['path'],
+                range(40),
+            )
+        )
+    assert paths == [f'/{index}' for index in range(40)]
+    metrics = session.metrics()
+    assert metrics['requests'] == 40
+    assert 1 <= metrics['connections'] <= 4
+    assert metrics['reused'] == 40 - metrics['connections']
+
+
+def test_router_falls_back_to_requests(server_url, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        api_session.requests, 'request', lambda method, url, **kwargs: calls.append(url)
+    )
+    api_session.router.get(f'{server_url}/a')
+    assert calls == [f'{server_url}/a']
+    api_session.get_session(server_url, pool_size=1)
+    api_session.router.get(f'{server_url}/b')
+    assert calls == [f'{server_url}/a']
+    assert api_session.router.codes is api_session.requests.codes
+
+
+def test_install(monkeypatch):
+    from nailgun import client
+
+    monkeypatch.setattr(client, 'requests', client.requests)
+    api_session.install()
+    assert client.requests is api_session.router
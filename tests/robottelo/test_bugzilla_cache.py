@@ -0,0 +1,143 @@
+"""Tests for the Bugzilla store of ``robottelo.utils.issue_handlers.bugzilla``."""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from tenacity import wait_none
+
+from robottelo.utils.issue_handlers import bugzilla
+from robottelo.utils.issue_handlers.bugzilla import BugzillaStore
+
+BUGS = {
+    1: {'id': 1, 'status': 'CLOSED', 'resolution': 'DUPLICATE', 'dupe_of': 2, 'clone_ids': []},
+    2: {'id': 2, 'status': 'NEW', 'resolution': '', 'clone_ids': [3], 'cf_clone_of': None},
+    3: {'id': 3, 'status': 'NEW', 'resolution': '', 'clone_ids': [], 'cf_clone_of': 4},
+    4: {'id': 4, 'status': 'VERIFIED', 'resolution': '', 'clone_ids': []},
+    **{
+        number: {'id': number, 'status': 'NEW', 'resolution': '', 'clone_ids': []}
+        for number in range(100, 350)
+    },
+}
+
+
+@pytest.fixture
+def server_errors():
+    """Statuses the Bugzilla server fails the next requests with"""
+    return []
+
+
+@pytest.fixture
+def bugzilla_server(server_errors):
+    """Local stand-in of the Bugzilla REST API, recording the requested BZ numbers"""
+    queries = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            numbers = parse_qs(url.query)['id'][0].split(',')
+            queries.append((numbers, self.headers['Authorization']))
+            if server_errors:
+                self.send_error(server_errors.pop(0))
+                return
+            body = json.dumps(
+                {'bugs': [BUGS[int(number)] for number in numbers if int(number) in BUGS]}
+            ).encode()
+            self.send_response(200 if url.path == '/rest/bug' else 404)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}', queries
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_batches_missing_bugs(bugzilla_server):
+    url, queries = bugzilla_server
+    store = BugzillaStore(url, 'key', max_workers=3)
+    bugs = store.fetch([str(number) for number in range(100, 350)] + ['999'])
+    assert len(bugs) == 250
+    assert '999' not in bugs
+    assert sorted(len(numbers) for numbers, _ in queries) == [51, 100, 100]
+    assert {auth for _, auth in queries} == {'Bearer key'}
+    # stored BZs are not requested again
+    assert store.fetch(['100', '101'])['101']['status'] == 'NEW'
+    assert store.requests == 3
+
+
+def test_fetch_returns_copies(bugzilla_server):
+    url, _ = bugzilla_server
+    store = BugzillaStore(url, 'key')
+    store.fetch(['2'])['2']['clone_ids'].append(5)
+    assert store.fetch(['2'])['2']['clone_ids'] == [3]
+
+
+def test_fetch_closure(bugzilla_server):
+    url, queries = bugzilla_server
+    store = BugzillaStore(url, 'key')
+    store.fetch_closure(['1'])
+    # one bulk query per level of duplicates and clones
+    assert [numbers for numbers, _ in queries] == [['1'], ['2'], ['3'], ['4']]
+    store.fetch(['1', '2', '3', '4'])
+    assert len(queries) == 4
+
+
+def test_expired_bugs_are_refreshed(bugzilla_server, tmp_path):
+    url, queries = bugzilla_server
+    path = tmp_path / 'bugzilla_cache.json'
+    store = BugzillaStore(url, 'key', path=path, ttl=3600)
+    store.fetch(['100', '101'])
+    store.save()
+    # a later session reads the persisted BZs and requests only the missing ones
+    other = BugzillaStore(url, 'key', path=path, ttl=3600)
+    other.fetch(['100', '101', '102'])
+    assert queries[-1][0] == ['102']
+    # only the expired BZs are requested again
+    data = json.loads(path.read_text())
+    data['100']['fetched'] = time.time() - 7200
+    path.write_text(json.dumps(data))
+    expired = BugzillaStore(url, 'key', path=path, ttl=3600)
+    assert set(expired.fetch(['100', '101'])) == {'100', '101'}
+    assert queries[-1][0] == ['100']
+    assert len(queries) == 3
+
+
+def test_zero_ttl_disables_the_file(bugzilla_server, tmp_path):
+    url, queries = bugzilla_server
+    path = tmp_path / 'bugzilla_cache.json'
+    store = BugzillaStore(url, 'key', path=path, ttl=0)
+    store.fetch(['100'])
+    store.fetch(['100'])
+    store.save()
+    assert not path.exists()
+    assert len(queries) == 2
+
+
+def test_failed_requests_are_retried(bugzilla_server, server_errors, monkeypatch):
+    url, queries = bugzilla_server
+    monkeypatch.setattr(BugzillaStore._request.retry, 'wait', wait_none())
+    server_errors.extend([503, 502])
+    store = BugzillaStore(url, 'key')
+    store.fetch_closure(['4'])
+    assert store.fetch(['4'])['4']['status'] == 'VERIFIED'
+    assert len(queries) == 3
+
+
+def test_get_data_bz_uses_the_store(bugzilla_server, monkeypatch):
+    url, queries = bugzilla_server
+    monkeypatch.setattr(bugzilla.settings.bugzilla, 'api_key', 'key', raising=False)
+    monkeypatch.setattr(bugzilla, '_store', BugzillaStore(url, 'key'))
+    monkeypatch.setattr(bugzilla, 'CACHED_RESPONSES', bugzilla.defaultdict(dict))
+    data = bugzilla.get_data_bz(['4', '3', '999'])
+    assert [bz['id'] for bz in data] == [4, 3]
+    assert queries[0][0] == ['4', '3', '999']
@@ -0,0 +1,77 @@
+"""Tests for module ``robottelo.host_helpers.checkin_queue``."""
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers import checkin_queue
+from robottelo.host_helpers.checkin_queue import CheckinQueue
+
+
+class FakeHost:
+    def __init__(self, hostname, teardown_error=None, delay=0.0):
+        self.hostname = hostname
+        self.teardown_error = teardown_error
+        self.delay = delay
+        self.torn_down = False
+
+    def teardown(self):
+        time.sleep(self.delay)
+        if self.teardown_error:
+            raise self.teardown_error
+        self.torn_down = True
+
+
+@pytest.fixture
+def broker():
+    with mock.patch.object(checkin_queue, 'Broker') as broker:
+        yield broker
+
+
+def checked_in(broker):
+    return [call.kwargs['hosts'][0].hostname for call in broker.call_args_list]
+
+
+def test_checkin_does_not_block(broker):
+    queue = CheckinQueue(workers=2, size=4)
+    hosts = [FakeHost(f'host{i}', delay=0.2) for i in range(2)]
+    start = time.monotonic()
+    for host in hosts:
+        queue.submit(host)
+    assert time.monotonic() - start < 0.1
+    assert queue.drain() == []
+    assert all(host.torn_down for host in hosts)
+    assert sorted(checked_in(broker)) == ['host0', 'host1']
+
+
+def test_queue_is_bounded(broker):
+    release = threading.Event()
+    broker.return_value.checkin.side_effect = lambda: release.wait(5)
+    queue = CheckinQueue(workers=1, size=2)
+    queue.submit(FakeHost('host0'))
+    queue.submit(FakeHost('host1'))
+    blocked = threading.Thread(target=queue.submit, args=(FakeHost('host2'),))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()
+    release.set()
+    blocked.join(5)
+    assert not blocked.is_alive()
+    queue.drain()
+    assert checked_in(broker) == ['host0', 'host1', 'host2']
+
+
+def test_failures_are_reported(broker):
+    queue = CheckinQueue(workers=1)
+    queue.submit(FakeHost('host0', teardown_error=RuntimeError('unregister failed')))
+    assert queue.drain() == [('host0', 'teardown', 'unregister failed')]
+    # the host is checked in despite the failed teardown
+    assert checked_in(broker) == ['host0']
+
+
+def test_synchronous_checkin(broker):
+    queue = CheckinQueue(workers=0)
+    with pytest.raises(RuntimeError):
+        queue.submit(FakeHost('host0', teardown_error=RuntimeError('unregister failed')))
+    assert checked_in(broker) == ['host0']
@@ -1,10 +1,12 @@
 from functools import partial
+import subprocess
 import unittest
 from unittest import mock
 
+from broker.helpers import Result
 import pytest
 
-from robottelo.cli.base import Base
+from robottelo.cli.base import Base, HammerBatch
 from robottelo.exceptions import (
     CLIBaseError,
     CLIDataBaseError,
@@ -144,12 +146,10 @@ class BaseCliTestCase(unittest.TestCase):
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_add_operating_system(self, construct, execute):
-        """Check command_sub edited when executing add_operating_system"""
+        """Check add_operating_system passes its subcommand to _construct_command"""
         options = {'foo': 'bar'}
-        assert 'add-operatingsystem' != Base.command_sub
         assert execute.return_value == Base.add_operating_system(options)
-        assert 'add-operatingsystem' == Base.command_sub
-        construct.assert_called_once_with(options)
+        construct.assert_called_once_with(options, command_sub='add-operatingsystem')
         execute.assert_called_once_with(construct.return_value)
 
     @mock.patch('robottelo.cli.base.Base.execute')
@@ -158,8 +158,7 @@ class BaseCliTestCase(unittest.TestCase):
         """Check command create when result is empty"""
         execute.return_value = []
         assert execute.return_value == Base.create()
-        assert 'create' == Base.command_sub
-        construct.assert_called_once_with({})
+        construct.assert_called_once_with({}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
 
     @mock.patch('robottelo.cli.base.Base.info')
@@ -169,8 +168,7 @@ class BaseCliTestCase(unittest.TestCase):
         """Check command create when result has dct but dct hasn't id key"""
         execute.return_value = [{'not_id': 'foo'}]
         assert execute.return_value == Base.create()
-        assert 'create' == Base.command_sub
-        construct.assert_called_once_with({})
+        construct.assert_called_once_with({}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         assert not info.called
 
@@ -184,8 +182,7 @@ class BaseCliTestCase(unittest.TestCase):
         execute.return_value = [{'id': 'foo', 'bar': 'bas'}]
         Base.command_requires_org = False
         assert execute.return_value == Base.create()
-        assert 'create' == Base.command_sub
-        construct.assert_called_once_with({})
+        construct.assert_called_once_with({}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         info.assert_called_once_with({'id': 'foo'})
 
@@ -199,8 +196,7 @@ class BaseCliTestCase(unittest.TestCase):
         execute.return_value = [{'id': 'foo', 'bar': 'bas'}]
         Base.command_requires_org = True
         assert execute.return_value == Base.create({'organization-id': 'org-id'})
-        assert 'create' == Base.command_sub
-        construct.assert_called_once_with({'organization-id': 'org-id'})
+        construct.assert_called_once_with({'organization-id': 'org-id'}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         info.assert_called_once_with({'id': 'foo', 'organization-id': 'org-id'})
 
@@ -214,8 +210,7 @@ class BaseCliTestCase(unittest.TestCase):
         Base.command_requires_org = True
         with pytest.raises(CLIError):
             Base.create()
-        assert 'create' == Base.command_sub
-        construct.assert_called_once_with({})
+        construct.assert_called_once_with({}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
 
     def assert_cmd_execution(
@@ -223,8 +218,7 @@ class BaseCliTestCase(unittest.TestCase):
     ):
         """Asssert Base class method successfully executed"""
         assert execute.return_value == base_method(**base_method_kwargs)
-        assert cmd_sub == Base.command_sub
-        construct.assert_called_once_with(base_method_kwargs.get('options'))
+        construct.assert_called_once_with(base_method_kwargs.get('options'), command_sub=cmd_sub)
         execute.assert_called_once_with(
             construct.return_value, ignore_stderr=ignore_stderr, timeout=None
         )
@@ -282,7 +276,9 @@ class BaseCliTestCase(unittest.TestCase):
             output_format='json',
             timeout=None,
         )
-        handle_resp.assert_called_once_with(command.return_value, ignore_stderr=None)
+        handle_resp.assert_called_once_with(
+            command.return_value, ignore_stderr=None, command='some_cmd'
+        )
         assert response is handle_resp.return_value
 
     @mock.patch('robottelo.cli.base.Base.list')
@@ -322,8 +318,7 @@ class BaseCliTestCase(unittest.TestCase):
     ):
         """Asssert Base class method successfully executed"""
         assert execute.return_value == base_method(**base_method_kwargs)
-        assert cmd_sub == Base.command_sub
-        construct.assert_called_once_with(base_method_kwargs.get('options'))
+        construct.assert_called_once_with(base_method_kwargs.get('options'), command_sub=cmd_sub)
         if command_kwarg:
             execute.assert_called_once_with(command=construct.return_value, **call_kwargs)
         else:
@@ -361,15 +356,79 @@ class BaseCliTestCase(unittest.TestCase):
         )
         parse.assert_called_once_with('some_response')
 
+    @mock.patch('robottelo.cli.base.hammer.parse_info')
+    @mock.patch('robottelo.cli.base.settings')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_info_json_output(self, construct, execute, settings, parse):
+        """Check info requests json output when hammer_json_output is set"""
+        settings.performance.hammer_json_output = True
+        self.assert_alt_cmd_execution(
+            construct,
+            execute,
+            Base.info,
+            'info',
+            call_kwargs={'output_format': 'json', 'return_raw_response': None},
+            options={'organization-id': 1},
+        )
+        parse.assert_not_called()
+
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.settings')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_create_json_output(self, construct, execute, settings, info):
+        """Check create skips the info call when the json output holds the whole object"""
+        settings.performance.hammer_json_output = True
+        Base.command_requires_org = False
+        execute.return_value = {'id': '1', 'name': 'foo', 'label': 'foo', 'message': 'Created.'}
+        assert Base.create() == execute.return_value
+        execute.assert_called_once_with(construct.return_value, output_format='json', timeout=None)
+        assert not info.called
+        # only the summary of the new object, it has to be fetched
+        execute.return_value = {'id': '1', 'name': 'foo', 'message': 'Created.'}
+        info.return_value = {'id': '1', 'name': 'foo', 'label': 'foo'}
+        assert Base.create() == info.return_value
+        info.assert_called_once_with({'id': '1'})
+
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_list_with_default_per_page(self, construct, execute):
         """Check list method set per_page as 1000 by default"""
         assert execute.return_value == Base.list(options={'organization-id': 1})
-        assert 'list' == Base.command_sub
-        construct.assert_called_once_with({'organization-id': 1, 'per-page': 10000})
+        construct.assert_called_once_with(
+            {'organization-id': 1, 'per-page': 10000}, command_sub='list'
+        )
         execute.assert_called_once_with(construct.return_value, output_format='csv')
 
+    @mock.patch('robottelo.cli.base.Base.list')
+    def test_iter_list_fetches_pages_on_demand(self, lst_method):
+        """Check iter_list requests the next page only when the current one is consumed"""
+        rows = [{'id': str(i)} for i in range(5)]
+        lst_method.side_effect = lambda options: rows[
+            (options['page'] - 1) * options['per-page'] : options['page'] * options['per-page']
+        ]
+        entities = Base.iter_list({'organization-id': 1, 'page': 3}, per_page=2)
+        assert next(entities) == {'id': '0'}
+        assert lst_method.call_count == 1
+        assert next(entities) == {'id': '1'}
+        entities.close()
+        assert lst_method.call_args_list == [
+            mock.call({'organization-id': 1, 'per-page': 2, 'page': 1})
+        ]
+        assert list(Base.iter_list(per_page=2)) == rows
+        assert lst_method.call_count == 4
+
+    @mock.patch('robottelo.cli.base.Base.list')
+    def test_iter_list_prefetch(self, lst_method):
+        """Check iter_list fetches the next page in background when prefetch is set"""
+        pages = {1: [{'id': '1'}, {'id': '2'}], 2: [{'id': '3'}, {'id': '4'}], 3: {}}
+        lst_method.side_effect = lambda options: pages[options['page']]
+        entities = Base.iter_list(per_page=2, prefetch=True)
+        assert next(entities) == {'id': '1'}
+        assert [entity['id'] for entity in entities] == ['2', '3', '4']
+        assert [c.args[0]['page'] for c in lst_method.call_args_list] == [1, 2, 3]
+
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_list_without_per_page(self, construct, execute):
@@ -453,6 +512,54 @@ class BaseCliTestCase(unittest.TestCase):
         )
 
 
+def run_locally(cmd, **kwargs):
+    """Run a ``ssh.command`` locally with bash"""
+    proc = subprocess.run(['bash', '-c', cmd.decode()], capture_output=True, text=True)
+    return Result(stdout=proc.stdout, stderr=proc.stderr, status=proc.returncode)
+
+
+@mock.patch('robottelo.cli.base.ssh.command', side_effect=run_locally)
+@mock.patch('robottelo.cli.base.Base._hammer_command', side_effect=lambda cmd, *args: cmd)
+class HammerBatchTestCase(unittest.TestCase):
+    """Tests for the HammerBatch class, running shell commands instead of hammer"""
+
+    def test_execute_many(self, hammer_command, command):
+        """Check results are returned in order with their stdout kept intact"""
+        results = Base.execute_many(
+            ['printf "first\\nline"', 'echo second; echo warning >&2', 'true'],
+            ignore_stderr=True,
+        )
+        assert results == ['first\nline', 'second\n', '']
+        command.assert_called_once()
+
+    def test_execute_many_csv(self, hammer_command, command):
+        """Check each result stdout is parsed according to its output format"""
+        with Base.batch() as batch:
+            batch.add('printf "Id,Name\\n1,foo\\n"', output_format='csv')
+            batch.add('printf "Id,Name\\n2,bar\\n"')
+        assert batch.results == [[{'id': '1', 'name': 'foo'}], 'Id,Name\n2,bar\n']
+
+    def test_stop_on_failure(self, hammer_command, command):
+        """Check commands following a failed one are not run"""
+        batch = HammerBatch(Base, return_raw_response=True)
+        batch.add('echo one')
+        batch.add('echo error >&2; (exit 3)')
+        batch.add('echo three')
+        results = batch.execute()
+        assert [result.status for result in results] == [0, 3]
+        assert results[1].stderr == 'error\n'
+        with pytest.raises(CLIReturnCodeError):
+            Base.execute_many(['echo one', '(exit 3)', 'echo three'])
+
+    def test_no_stop_on_failure(self, hammer_command, command):
+        """Check all commands are run when stop_on_failure is False"""
+        results = Base.execute_many(
+            ['echo one', '(exit 3)', 'echo three'], return_raw_response=True, stop_on_failure=False
+        )
+        assert [result.status for result in results] == [0, 3, 0]
+        assert results[2].stdout == 'three\n'
+
+
 class CLIErrorTests(unittest.TestCase):
     """Tests for the CLIError cli class"""
 
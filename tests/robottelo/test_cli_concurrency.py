@@ -0,0 +1,148 @@
+"""Concurrency tests for the hammer cli layer in ``robottelo.cli``.
+
+The cli classes are shared by every thread of a pytest-xdist worker, so building a command
+must not depend on state left on the class by another call.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import re
+import threading
+import time
+from unittest import mock
+
+from broker.helpers import Result
+import pytest
+
+from robottelo.cli.base import Base
+from robottelo.cli.contentview import ContentView
+from robottelo.cli.repository import Repository
+from robottelo.cli.sm_packages import Packages
+from robottelo.cli.template_sync import TemplateSync
+
+THREADS = 16
+ROUNDS = 50
+
+
+class FakeSSH:
+    """Stand-in for ``robottelo.ssh.command`` recording the hammer commands per thread"""
+
+    def __init__(self):
+        self.commands = {}
+        self._lock = threading.Lock()
+
+    def record(self, cmd):
+        # give the other threads a chance to interleave with this call
+        time.sleep(0)
+        with self._lock:
+            self.commands.setdefault(threading.get_ident(), []).append(' '.join(cmd.split()))
+        return Result(stdout='', stderr='', status=0)
+
+    def __call__(self, cmd, hostname=None, output_format=None, timeout=None, **kwargs):
+        # drop the ``LANG=.. hammer -v -u .. -p .. --output=..`` prefix
+        cmd = cmd.decode('utf-8').split(' -p password ', 1)[1]
+        return self.record(re.sub(r'^--output=\S+ ', '', cmd))
+
+    def sm_execute(self, command, hostname=None, timeout=None, **kwargs):
+        return self.record(command)
+
+
+@pytest.fixture
+def fake_ssh():
+    fake = FakeSSH()
+    with mock.patch('robottelo.cli.base.settings') as settings, mock.patch(
+        'robottelo.cli.base.ssh.command', fake
+    ), mock.patch.object(Packages, 'sm_execute', fake.sm_execute), mock.patch.multiple(
+        Base, command_sub=None, command_end=None, command_requires_org=False
+    ):
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.performance.hammer_transport = 'ssh'
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        settings.server.hostname = 'sat.example.com'
+        yield fake
+
+
+CALLS = [
+    (
+        lambda i: Repository.synchronize({'id': i}),
+        lambda i: f'repository synchronize --id="{i}"',
+    ),
+    (
+        lambda i: Repository.delete({'id': i}),
+        lambda i: f'repository delete --id="{i}"',
+    ),
+    (
+        lambda i: ContentView.publish({'id': i}),
+        lambda i: f'content-view publish --id="{i}"',
+    ),
+    (
+        lambda i: ContentView.info({'id': i, 'organization-id': 1}),
+        lambda i: f'content-view info --id="{i}" --organization-id="1"',
+    ),
+    (
+        lambda i: Packages.install(packages=f'pkg-{i}', options={'assumeyes': True}),
+        lambda i: f'packages install --assumeyes pkg-{i}',
+    ),
+    (
+        lambda i: TemplateSync.exports({'organization-id': i}),
+        lambda i: f'export-templates --organization-id="{i}"',
+    ),
+]
+
+
+def run_calls(index):
+    """Run every cli call in ``CALLS`` and return the commands they should have built"""
+    expected = []
+    for call, command in CALLS:
+        call(index)
+        expected.append(command(index))
+    return threading.get_ident(), expected
+
+
+def test_concurrent_calls_build_their_own_command(fake_ssh):
+    """Commands built from many threads never leak a subcommand into another call"""
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(run_calls, range(THREADS * ROUNDS)))
+    expected = {}
+    for thread, commands in results:
+        expected.setdefault(thread, []).extend(commands)
+    assert set(expected) == set(fake_ssh.commands)
+    for thread, commands in expected.items():
+        assert fake_ssh.commands[thread] == commands
+
+
+def test_concurrent_calls_leave_class_attributes_untouched(fake_ssh):
+    """Cli calls must not store per call state on the shared classes"""
+    before = {
+        cls: (cls.command_base, cls.command_sub, cls.command_end)
+        for cls in (Repository, ContentView, Packages, TemplateSync)
+    }
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(run_calls, range(THREADS)))
+    for cls, attributes in before.items():
+        assert (cls.command_base, cls.command_sub, cls.command_end) == attributes
+
+
+def test_concurrent_errors_name_their_command(fake_ssh):
+    """The error raised for a failed command names that command, not the last one built"""
+
+    def failing(cmd, **kwargs):
+        fake_ssh(cmd, **kwargs)
+        if b' delete ' in cmd:
+            return Result(stdout='', stderr='Error: not found', status=65)
+        return Result(stdout='', stderr='', status=0)
+
+    def delete(index):
+        try:
+            Repository.delete({'id': index})
+        except Exception as err:
+            return err.msg
+        raise AssertionError('delete did not fail')
+
+    with mock.patch('robottelo.cli.base.ssh.command', failing), ThreadPoolExecutor(
+        max_workers=THREADS
+    ) as executor:
+        publishes = [executor.submit(ContentView.publish, {'id': i}) for i in range(THREADS)]
+        messages = list(executor.map(delete, range(THREADS)))
+    assert all(future.result() == '' for future in publishes)
+    assert all(message.startswith('Command "repository delete"') for message in messages)
@@ -0,0 +1,128 @@
+"""Tests for module ``robottelo.utils.collection_metadata``."""
+import importlib.util
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from robottelo.utils import collection_metadata
+from robottelo.utils.collection_metadata import CollectionMetadataCache, parse_source
+
+SOURCE = '''"""Module docstring
+
+:CaseComponent: Repositories
+
+:Team: Phoenix
+
+:CaseImportance: High
+"""
+import functools
+
+
+def is_open(issue):
+    return False
+
+
+def setup():
+    if is_open('BZ:111'):
+        pass
+
+
+def decorated(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def test_function():
+    """Function docstring
+
+    :CaseImportance: Critical
+
+    :BZ: 123, 456
+    """
+    if not is_open('BZ:222'):
+        pass
+
+
+class TestClass:
+    """Class docstring
+
+    :Team: Rocket
+    """
+
+    @decorated
+    def test_method(self):
+        if is_open('BZ:333'):
+            pass
+'''
+
+
+@pytest.fixture
+def test_module(tmp_path, monkeypatch):
+    path = tmp_path / 'test_sample.py'
+    path.write_text(SOURCE)
+    spec = importlib.util.spec_from_file_location('test_sample', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(collection_metadata, 'cache', CollectionMetadataCache())
+    return module
+
+
+def test_parse_source():
+    metadata = parse_source(SOURCE)
+    assert metadata['module']['doc'] == {
+        'component': 'Repositories',
+        'importance': 'High',
+        'team': 'Phoenix',
+        'bz': [],
+    }
+    assert metadata['module']['component'] == 'Repositories'
+    assert metadata['module']['is_open'] == [['BZ', '111'], ['BZ', '333']]
+    assert metadata['module']['not_is_open'] == [['BZ', '222']]
+    function = metadata['functions']['test_function']
+    assert function['doc']['importance'] == 'Critical'
+    assert function['doc']['bz'] == ['123', '456']
+    assert function['not_is_open'] == [['BZ', '222']]
+    assert metadata['classes']['TestClass']['doc']['team'] == 'Rocket'
+    method = metadata['functions']['TestClass.test_method']
+    assert method['doc'] is None
+    assert method['is_open'] == [['BZ', '333']]
+
+
+def test_item_metadata_matches_inspect(test_module):
+    items = [
+        SimpleNamespace(module=test_module, function=test_module.test_function),
+        SimpleNamespace(
+            module=test_module,
+            cls=test_module.TestClass,
+            function=test_module.TestClass.test_method,
+        ),
+    ]
+    for item in items:
+        expected = collection_metadata._inspect_item(
+            item.module, getattr(item, 'cls', None), item.function
+        )
+        assert collection_metadata.item_metadata(item) == expected
+    assert collection_metadata.cache.misses == 1
+    assert collection_metadata.cache.hits == 1
+
+
+def test_cache_file(tmp_path):
+    test_file = tmp_path / 'test_sample.py'
+    test_file.write_text(SOURCE)
+    cache_file = tmp_path / 'cache' / 'metadata.json'
+    cache = CollectionMetadataCache(cache_file)
+    metadata = cache.get(test_file)
+    cache.save()
+    # another worker reads the parsed file
+    other = CollectionMetadataCache(cache_file)
+    assert other.get(test_file) == metadata
+    assert (other.hits, other.misses) == (1, 0)
+    # a modified file is parsed again
+    test_file.write_text(SOURCE.replace(':Team: Rocket', ':Team: Endeavour'))
+    os.utime(test_file, ns=(0, 0))
+    assert other.get(test_file)['classes']['TestClass']['doc']['team'] == 'Endeavour'
+    assert other.misses == 1
@@ -0,0 +1,108 @@
+"""Tests for module ``robottelo.utils.collection_pipeline``."""
+from types import SimpleNamespace
+
+from pytest_plugins import collection_pipeline, marker_deselection
+from robottelo.utils.collection_pipeline import CollectionPipeline, CollectionStage
+
+
+class Record(CollectionStage):
+    def __init__(self, name, deselect=(), finish_deselect=()):
+        self.name = name
+        self.deselect = set(deselect)
+        self.finish_deselect = set(finish_deselect)
+        self.processed = []
+        self.finished = None
+
+    def process(self, item):
+        self.processed.append(item)
+        return item not in self.deselect
+
+    def finish(self, items):
+        self.finished = list(items)
+        return self.finish_deselect
+
+
+def test_items_walked_once_in_stage_order():
+    first = Record('first', deselect=[2])
+    second = Record('second', deselect=[4])
+    pipeline = CollectionPipeline([first, second])
+    items = [1, 2, 3, 4, 5]
+    assert pipeline.run(None, None, items) == [2, 4]
+    assert items == [1, 3, 5]
+    assert first.processed == [1, 2, 3, 4, 5]
+    # items deselected by a stage are not passed to the later ones
+    assert second.processed == [1, 3, 4, 5]
+    assert pipeline.deselected == {'first': 1, 'second': 1}
+
+
+def test_finish_with_the_items_left():
+    first = Record('first', finish_deselect=[3])
+    second = Record('second', finish_deselect=[1, 7])
+    pipeline = CollectionPipeline([first, second])
+    items = [1, 3, 5]
+    assert pipeline.run(None, None, items) == []
+    # e.g. the -k filter of pytest
+    items.remove(5)
+    assert pipeline.finish(items) == [3, 1]
+    assert items == []
+    assert first.finished == [1, 3]
+    assert second.finished == [1]
+    assert pipeline.deselected == {'first': 1, 'second': 2}
+
+
+def test_summary():
+    class Noop(CollectionStage):
+        name = 'noop'
+
+    pipeline = CollectionPipeline([Record('first', deselect=[1]), Noop()])
+    pipeline.run(None, None, [1, 2])
+    lines = pipeline.summary()
+    assert lines[0].startswith('first')
+    assert lines[0].endswith('1 deselected')
+    assert lines[1].startswith('noop')
+    assert lines[1].endswith('0 deselected')
+    assert all(timing >= 0 for timing in pipeline.timings.values())
+
+
+def test_stages_looked_up_in_registered_plugins():
+    class Stage(CollectionStage):
+        name = 'stage'
+
+    plugins = {}
+    for plugin_name, stage_name in collection_pipeline.STAGES:
+        setattr(plugins.setdefault(plugin_name, SimpleNamespace()), stage_name, Stage)
+    # disabled with -p no:pytest_plugins.issue_handlers
+    del plugins['pytest_plugins.issue_handlers']
+    pluginmanager = SimpleNamespace(get_plugin=plugins.get)
+    stages = collection_pipeline.get_stages(pluginmanager)
+    assert len(stages) == len(collection_pipeline.STAGES) - 1
+    assert all(isinstance(stage, Stage) for stage in stages)
+
+
+class Item:
+    def __init__(self, name, *marks):
+        self.name = self.nodeid = name
+        self.marks = marks
+
+    def get_closest_marker(self, name):
+        return name if name in self.marks else None
+
+
+def test_infra_markers_fallback_uses_every_collected_test():
+    config = SimpleNamespace(getoption=lambda option, default: default, getvalue=lambda name: '')
+    auth, other = Item('auth', 'external_auth'), Item('other')
+    stage = marker_deselection.InfraMarkersStage()
+    pipeline = CollectionPipeline([stage])
+    items = [auth, other]
+    pipeline.run(None, config, items)
+    # -k external_auth
+    items.remove(other)
+    assert pipeline.finish(items) == [auth]
+    assert items == []
+    # every collected test needs the infra, none is deselected
+    stage = marker_deselection.InfraMarkersStage()
+    pipeline = CollectionPipeline([stage])
+    items = [auth]
+    pipeline.run(None, config, items)
+    assert pipeline.finish(items) == []
+    assert items == [auth]
@@ -0,0 +1,98 @@
+"""Tests for module ``robottelo.host_helpers.content_cache``."""
+from unittest import mock
+
+from broker.helpers import Result
+import pytest
+
+from robottelo.host_helpers import content_cache
+from robottelo.utils.decorators.func_shared.file_storage import FileStorageHandler
+from robottelo.utils.decorators.func_shared.shared import _set_configured
+
+
+class FakeSatellite:
+    hostname = 'sat.example.com'
+
+    def __init__(self, machine_id='1234'):
+        self.machine_id = machine_id
+        self.calls = 0
+
+    def execute(self, command):
+        assert command == 'cat /etc/machine-id'
+        self.calls += 1
+        return Result(stdout=f'{self.machine_id}\n', stderr='', status=0)
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    _set_configured(True)
+    monkeypatch.setattr(content_cache, '_identities', {})
+    with mock.patch(
+        'robottelo.utils.decorators.func_shared.shared._get_default_storage_handler',
+        return_value=FileStorageHandler(root_dir=tmp_path),
+    ), mock.patch.object(content_cache, 'settings') as settings:
+        settings.shared_function.content_cache = True
+        settings.shared_function.content_cache_timeout = 3600
+        yield settings
+
+
+def builder():
+    builds = []
+
+    def build():
+        builds.append(len(builds))
+        return {'org': {'id': len(builds)}}
+
+    return build, builds
+
+
+def test_stack_is_built_once(settings):
+    build, builds = builder()
+    repos = {'repos': [{'url': 'http://repo', 'content-type': 'yum'}]}
+    for _ in range(3):
+        stack = content_cache.shared_content_stack(FakeSatellite(), 'kind', repos, build)
+        assert stack == {'org': {'id': 1}}
+    assert len(builds) == 1
+    other_repos = {'repos': [{'url': 'http://other', 'content-type': 'yum'}]}
+    assert content_cache.shared_content_stack(FakeSatellite(), 'kind', other_repos, build) == {
+        'org': {'id': 2}
+    }
+    # a re-provisioned satellite has a new machine id
+    content_cache._identities.clear()
+    assert content_cache.shared_content_stack(FakeSatellite('5678'), 'kind', repos, build) == {
+        'org': {'id': 3}
+    }
+
+
+def test_disabled(settings):
+    settings.shared_function.content_cache = False
+    build, builds = builder()
+    content_cache.shared_content_stack(FakeSatellite(), 'kind', {}, build)
+    content_cache.shared_content_stack(FakeSatellite(), 'kind', {}, build)
+    assert len(builds) == 2
+
+
+def test_invalid_stack_is_rebuilt(settings):
+    build, builds = builder()
+    content_cache.shared_content_stack(FakeSatellite(), 'kind', {}, build)
+    stack = content_cache.shared_content_stack(
+        FakeSatellite(), 'kind', {}, build, is_valid=lambda stack: stack['org']['id'] != 1
+    )
+    assert stack == {'org': {'id': 2}}
+    assert content_cache.shared_content_stack(FakeSatellite(), 'kind', {}, build) == stack
+
+
+def test_failed_build_is_not_cached(settings):
+    build, builds = builder()
+    failing = mock.Mock(side_effect=RuntimeError('sync failed'))
+    with pytest.raises(RuntimeError, match='sync failed'):
+        content_cache.shared_content_stack(FakeSatellite(), 'kind', {}, failing)
+    assert content_cache.shared_content_stack(FakeSatellite(), 'kind', {}, build) == {
+        'org': {'id': 1}
+    }
+
+
+def test_satellite_identity_is_read_once(settings):
+    satellite = FakeSatellite()
+    assert content_cache.satellite_identity(satellite) == 'sat.example.com:1234'
+    assert content_cache.satellite_identity(satellite) == 'sat.example.com:1234'
+    assert satellite.calls == 1
@@ -0,0 +1,57 @@
+"""Tests for module ``robottelo.host_helpers.fan_out``."""
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo.exceptions import HostsFanOutError
+from robottelo.host_helpers.fan_out import fan_out
+
+
+class FakeHost:
+    def __init__(self, hostname):
+        self.hostname = hostname
+
+
+def test_hosts_run_concurrently():
+    hosts = [FakeHost(f'host{i}') for i in range(3)]
+    # every step blocks until all of them started
+    barrier = threading.Barrier(3, timeout=5)
+    results = fan_out(hosts, lambda host: barrier.wait() is not None and host.hostname, 3)
+    assert results.results == ['host0', 'host1', 'host2']
+    assert results.errors == []
+    assert results.raise_for_errors() is results
+
+
+def test_concurrency_is_bounded():
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def step(host):
+        with lock:
+            running.append(host)
+            peak.append(len(running))
+        threading.Event().wait(0.05)
+        with lock:
+            running.remove(host)
+
+    fan_out([FakeHost(f'host{i}') for i in range(6)], step, max_workers=2)
+    assert max(peak) == 2
+
+
+@mock.patch('robottelo.host_helpers.fan_out.settings')
+def test_errors_are_collected_per_host(settings):
+    settings.performance.host_fan_out_concurrency = 4
+    hosts = [FakeHost('good'), FakeHost('bad')]
+
+    def step(host):
+        if host.hostname == 'bad':
+            raise RuntimeError('registration failed')
+        return 0
+
+    results = fan_out(hosts, step)
+    assert results.results == [0, None]
+    assert [result.host.hostname for result in results.errors] == ['bad']
+    with pytest.raises(HostsFanOutError, match='1 of 2 hosts failed:\nbad: RuntimeError'):
+        results.raise_for_errors()
@@ -1,4 +1,6 @@
 """Tests for Robottelo's hammer helpers"""
+import pytest
+
 from robottelo.cli import hammer
 
 
@@ -22,6 +24,71 @@ class TestParseCSV:
             {'header': 'unicode', 'header-2': 'chårs'},
         ]
 
+    def test_parse_csv_compact(self):
+        output = 'Id,Content View\n1,cv1\n2,cv2\n'
+        rows = hammer.parse_csv(output, compact=True)
+        assert rows == [{'id': '1', 'content-view': 'cv1'}, {'id': '2', 'content-view': 'cv2'}]
+        assert rows[1]['content-view'] == 'cv2'
+        assert rows[0].get('name') is None
+        assert type(rows[0]) is type(rows[1])  # noqa: E721 - the record class is shared
+        assert not hasattr(rows[0], '__dict__')
+
+    def test_parse_csv_not_csv(self):
+        for output in ('\nTask 1 running\n', ',\n1,2\n'):
+            assert hammer.parse_csv(output) == output
+
+    def test_parse_csv_single_column(self):
+        assert hammer.parse_csv('Repository created.\n') == []
+        assert hammer.parse_csv('Id\n1\n2\n') == [{'id': '1'}, {'id': '2'}]
+        output = 'Message\nHost deleted.\n'
+        assert hammer.parse_csv(output)[0]['message'] == 'Host deleted.'
+
+    def test_parse_csv_mismatched_row(self):
+        for output in ('Id,Name\n1,foo,bar\n', 'Repository synchronized, 3 packages\nDone\n'):
+            assert hammer.parse_csv(output) == output
+            assert hammer.parse_csv(output, compact=True) == output
+
+    def test_parse_csv_message(self):
+        output = 'Warning: Option --foo is deprecated\nId,Name\n1,a\n'
+        assert hammer.parse_csv(output) == output
+        output = (
+            'database:         \n'
+            '    Status:          ok\n'
+            '    Server Response: Duration: 0ms\n'
+            'candlepin:        \n'
+            '    Status:          ok\n'
+        )
+        assert hammer.parse_csv(output) == output
+
+    def test_parse_csv_puppet_deprecation_warning(self):
+        output = f'{hammer.PUPPET_DEPRECATION_WARNING}Id,Name\n1,foo\n'
+        assert hammer.parse_csv(output) == [{'id': '1', 'name': 'foo'}]
+
+    def test_parse_csv_job_invocation(self):
+        output = 'Message\nJob invocation 12 created\n\n[  ] 0% Running\n'
+        assert hammer.parse_csv(output) == [{'message': 'Job invocation 12 created'}]
+
+    def test_iter_csv_is_lazy(self):
+        rows = hammer.iter_csv('Id,Name\n1,foo\n1,foo,bar\n')
+        assert next(rows) == {'id': '1', 'name': 'foo'}
+        with pytest.raises(ValueError, match='zip'):
+            next(rows)
+        with pytest.raises(ValueError, match='not hammer CSV'):
+            hammer.iter_csv('\nRepository created.')
+
+
+class TestParseTimeP:
+    """Tests for splitting the ``time -p`` trailer from stderr"""
+
+    def test_parse_time_p(self):
+        stderr = 'Warning: foo\nreal 1.50\nuser 0.30\nsys 0.10\n'
+        assert hammer.parse_time_p(stderr) == (
+            'Warning: foo\n',
+            {'real': 1.5, 'user': 0.3, 'sys': 0.1},
+        )
+        assert hammer.parse_time_p('real 1.50\nuser 0.30\nsys 0.10\n')[0] == ''
+        assert hammer.parse_time_p('Warning: foo\n') == ('Warning: foo\n', None)
+
 
 class TestParseJSON:
     """Tests for parsing JSON hammer output"""
@@ -81,6 +148,13 @@ class TestParseJSON:
             'name': 'Default Organization View',
         }
 
+    def test_parse_json_nested(self):
+        output = '{"Content View": [1, {"Is Default": true, "Lifecycle Environments": [2]}]}'
+        assert hammer.parse_json(output) == {
+            'content-view': ['1', {'is-default': True, 'lifecycle-environments': ['2']}]
+        }
+        assert list(hammer.parse_json('{"B": 1, "A": 2}')) == ['b', 'a']
+
     def test_parsed_json_match_parsed_csv(self):
         """Output generated by:
         JSON:
@@ -172,54 +246,63 @@ class TestParseHelp:
             'options': [
                 {
                     'name': 'autocomplete',
+                    'aliases': [],
                     'shortname': None,
                     'value': 'LINE',
                     'help': 'Get list of possible endings',
                 },
                 {
                     'name': 'name',
+                    'aliases': ['deprecation-name'],
                     'shortname': None,
                     'value': None,
                     'help': 'An option with a deprecation name',
                 },
                 {
                     'name': 'csv',
+                    'aliases': [],
                     'shortname': None,
                     'value': None,
                     'help': 'Output as CSV (same as --output=csv)',
                 },
                 {
                     'name': 'csv-separator',
+                    'aliases': [],
                     'shortname': None,
                     'value': 'SEPARATOR',
                     'help': 'Character to separate the values',
                 },
                 {
                     'name': 'output',
+                    'aliases': [],
                     'shortname': None,
                     'value': 'ADAPTER',
                     'help': ('Set output format. One of [base, table, silent, csv, yaml, json]'),
                 },
                 {
                     'name': 'password',
+                    'aliases': [],
                     'shortname': 'p',
                     'value': 'PASSWORD',
                     'help': 'password to access the remote system',
                 },
                 {
                     'name': 'reload-cache',
+                    'aliases': [],
                     'shortname': 'r',
                     'value': None,
                     'help': 'force reload of Apipie cache',
                 },
                 {
                     'name': 'verbose',
+                    'aliases': [],
                     'shortname': 'v',
                     'value': None,
                     'help': 'Be verbose (or not). True by default',
                 },
                 {
                     'name': 'location',
+                    'aliases': [],
                     'shortname': None,
                     'value': None,
                     'help': (
@@ -229,6 +312,7 @@ class TestParseHelp:
                 },
                 {
                     'name': 'location-id',
+                    'aliases': [],
                     'shortname': None,
                     'value': None,
                     'help': (
@@ -238,6 +322,7 @@ class TestParseHelp:
                 },
                 {
                     'name': 'location-title',
+                    'aliases': [],
                     'shortname': None,
                     'value': None,
                     'help': (
@@ -247,6 +332,7 @@ class TestParseHelp:
                 },
                 {
                     'name': 'locations',
+                    'aliases': [],
                     'shortname': None,
                     'value': None,
                     'help': (
@@ -256,6 +342,7 @@ class TestParseHelp:
                 },
                 {
                     'name': 'location-ids',
+                    'aliases': [],
                     'shortname': None,
                     'value': None,
                     'help': (
@@ -265,6 +352,7 @@ class TestParseHelp:
                 },
                 {
                     'name': 'location-titles',
+                    'aliases': [],
                     'shortname': None,
                     'value': None,
                     'help': (
@@ -274,6 +362,7 @@ class TestParseHelp:
                 },
                 {
                     'name': 'lifecycle-environment',
+                    'aliases': [],
                     'shortname': None,
                     'value': None,
                     'help': (
@@ -283,6 +372,7 @@ class TestParseHelp:
                 },
                 {
                     'name': 'lifecycle-environment-id',
+                    'aliases': [],
                     'shortname': None,
                     'value': None,
                     'help': (
@@ -0,0 +1,108 @@
+"""Tests for module ``robottelo.cli.hammer_schema``."""
+import json
+from pathlib import Path
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.cli import hammer_schema
+from robottelo.cli.base import Base
+from robottelo.exceptions import CLIReturnCodeError, CLIUnknownOptionError
+
+HAMMER_COMMANDS_JSON = Path(__file__).parents[1] / 'foreman' / 'data' / 'hammer_commands.json'
+
+HELP = {
+    '': 'Usage:\n    hammer [OPTIONS] SUBCOMMAND [ARG] ...\n\nSubcommands:\n'
+    ' organization                  Manipulate organizations\n'
+    ' repository                    Manipulate repositories\n',
+    'organization': 'Subcommands:\n list                          List all organizations\n',
+    'organization list': 'Options:\n --search VALUE                Filter results\n',
+    'repository': 'Subcommands:\n synchronize                   Sync a repository\n',
+    'repository synchronize': 'Options:\n --id VALUE                    Repository ID\n'
+    ' --organization-id VALUE       Organization ID\n',
+}
+
+
+def test_build_schema_concurrently():
+    running, peak = set(), []
+    lock = threading.Lock()
+
+    def run_help(path):
+        with lock:
+            running.add(path)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.discard(path)
+        return HELP[path]
+
+    tree = hammer_schema.build_schema(run_help=run_help)
+    assert [sub['name'] for sub in tree['subcommands']] == ['organization', 'repository']
+    assert max(peak) == 2
+    schema = hammer_schema._flatten(tree)
+    assert schema['repository synchronize'] == {'id', 'organization-id'}
+    assert schema['organization list'] == {'search'}
+
+
+def test_save_and_load_schema(tmp_path):
+    tree = hammer_schema.build_schema(run_help=HELP.get)
+    assert hammer_schema.load_schema('6.99', tmp_path) is None
+    path = hammer_schema.save_schema(tree, '6.99', tmp_path)
+    assert path == tmp_path / 'hammer-6.99.json'
+    schema = hammer_schema.load_schema('6.99', tmp_path)
+    assert schema['repository synchronize'] == {'id', 'organization-id'}
+    assert hammer_schema.load_schema('6.99', tmp_path) is schema
+
+
+def test_flatten_recorded_tree():
+    schema = hammer_schema._flatten(json.loads(HAMMER_COMMANDS_JSON.read_text()))
+    assert 'organization-id' in schema['repository synchronize']
+    assert 'id' in schema['content-view filter rule info']
+
+
+def test_check_options():
+    schema = hammer_schema._flatten(hammer_schema.build_schema(run_help=HELP.get))
+    hammer_schema.check_options('repository  synchronize', ['id'], schema=schema)
+    # commands not in the schema are not checked
+    hammer_schema.check_options('packages install', ['assumeyes'], schema=schema)
+    with pytest.raises(CLIUnknownOptionError) as error:
+        hammer_schema.check_options('repository synchronize', ['id', 'sync'], schema=schema)
+    assert isinstance(error.value, CLIReturnCodeError)
+    assert error.value.status == hammer_schema.EX_USAGE
+    assert "Unrecognised option '--sync'" in error.value.stderr
+
+
+def test_check_options_aliases():
+    help_output = {
+        '': 'Subcommands:\n repository                    Manipulate repositories\n',
+        'repository': 'Subcommands:\n list                          List repositories\n',
+        'repository list': 'Options:\n'
+        ' --lifecycle-environment-id, --environment-id NUMBER  Environment id\n'
+        ' --organization[-id], --org[-id] VALUE                Organization\n',
+    }
+    schema = hammer_schema._flatten(hammer_schema.build_schema(run_help=help_output.get))
+    assert schema['repository list'] == {
+        'lifecycle-environment-id',
+        'environment-id',
+        'organization',
+        'organization-id',
+        'org',
+        'org-id',
+    }
+    hammer_schema.check_options('repository list', ['environment-id', 'org-id'], schema=schema)
+    with pytest.raises(CLIUnknownOptionError):
+        hammer_schema.check_options('repository list', ['environment'], schema=schema)
+
+
+def test_construct_command_rejects_unknown_options():
+    schema = hammer_schema._flatten(hammer_schema.build_schema(run_help=HELP.get))
+    with mock.patch.object(hammer_schema, 'load_schema', return_value=schema):
+        assert Base._construct_command(
+            {'id': 1, 'sync': None}, command_base='repository', command_sub='synchronize'
+        ).startswith('repository synchronize --id="1"')
+        with pytest.raises(CLIUnknownOptionError):
+            Base._construct_command(
+                {'id': 1, 'sync': True}, command_base='repository', command_sub='synchronize'
+            )
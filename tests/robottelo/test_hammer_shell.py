@@ -0,0 +1,141 @@
+"""Tests for module ``robottelo.cli.hammer_shell``."""
+import re
+
+import pytest
+
+from robottelo.cli import hammer_shell
+
+
+class FakeChannel:
+    """A non-blocking ssh2 channel running a scripted ``hammer shell``.
+
+    ``responses`` maps a command line to a tuple of ``(stdout, stderr, status)``, unknown
+    lines get the hammer "unknown sub-command" error. A response of ``None`` never answers.
+    The exit status is reported on stderr as ``SHELL_SCRIPT`` does, unless ``report_status``
+    is False.
+    """
+
+    def __init__(self, responses, report_status=True):
+        self.responses = responses
+        self.report_status = report_status
+        self.stdout = b'hammer> '
+        self.stderr = b''
+        self.written = []
+        self.closed = False
+        self.hung = False
+
+    def write(self, data):
+        for line in data.decode().splitlines():
+            self.written.append(line)
+            if self.hung:
+                continue
+            if line not in self.responses:
+                self.stderr += f"Error: No such sub-command '{line}'.\n\n".encode()
+                self.stderr += b"See: 'hammer --help'.\n"
+                status = 64
+            elif self.responses[line] is None:
+                self.hung = True
+                continue
+            else:
+                stdout, stderr, status = self.responses[line]
+                self.stdout += stdout.encode()
+                self.stderr += stderr.encode()
+            if self.report_status:
+                self.stderr += f'{hammer_shell.STATUS_PREFIX}{status}\n'.encode()
+            self.stdout += b'hammer> '
+        return 0, len(data)
+
+    def _read(self, stream):
+        data = getattr(self, stream)
+        if not data:
+            return hammer_shell.LIBSSH2_ERROR_EAGAIN, b''
+        setattr(self, stream, b'')
+        return len(data), data
+
+    def read(self):
+        return self._read('stdout')
+
+    def read_stderr(self):
+        return self._read('stderr')
+
+    def eof(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def shell(monkeypatch):
+    """A ``HammerShell`` which opens ``FakeChannel`` objects"""
+    responses = {
+        '--output=csv organization list': ('Id,Name\n1,Default Organization\n', '', 0),
+        'organization info --id=0': ('', 'Could not find organization\n', 70),
+        'repository synchronize --id=1': ('', 'Warning: the repository is empty\n', 0),
+        'task progress': None,
+    }
+    shell = hammer_shell.HammerShell('sat.example.com', user='admin', password='changeme')
+    shell.poll_interval = 0
+    shell.channels = []
+    shell.report_status = True
+
+    def open_channel():
+        shell.channels.append(FakeChannel(responses, report_status=shell.report_status))
+        return shell.channels[-1]
+
+    monkeypatch.setattr(shell, '_open_channel', open_channel)
+    return shell
+
+
+def test_execute_frames_output(shell):
+    result = shell.execute('--output=csv organization list', output_format='csv')
+    assert result.status == 0
+    assert result.stderr == ''
+    assert result.stdout == [{'id': '1', 'name': 'Default Organization'}]
+    result = shell.execute('--output=csv organization list')
+    assert result.stdout == 'Id,Name\n1,Default Organization\n'
+    assert len(shell.channels) == 1
+    assert re.match(hammer_shell.SENTINEL_PREFIX, shell.channels[0].written[-1])
+
+
+def test_execute_error(shell):
+    result = shell.execute('organization info --id=0')
+    assert result.status == 70
+    assert result.stderr == 'Could not find organization\n'
+    assert shell.execute('--output=csv organization list').status == 0
+
+
+def test_execute_success_with_stderr(shell):
+    result = shell.execute('repository synchronize --id=1')
+    assert result.status == 0
+    assert result.stderr == 'Warning: the repository is empty\n'
+
+
+def test_execute_without_status(shell):
+    shell.report_status = False
+    assert shell.execute('organization info --id=0').status == 1
+    assert shell.execute('--output=csv organization list').status == 0
+
+
+def test_execute_timeout_restarts_shell(shell):
+    result = shell.execute('task progress', timeout='1s')
+    assert result.status == -1
+    assert 'timed out' in result.stderr
+    assert shell.restarts == 1
+    assert shell.channels[0].closed
+    assert shell.execute('--output=csv organization list').status == 0
+    assert len(shell.channels) == 2
+
+
+def test_execute_restarts_dead_shell(shell):
+    shell.execute('--output=csv organization list')
+    shell.channels[0].close()
+    assert shell.execute('--output=csv organization list').status == 0
+    assert shell.restarts == 1
+
+
+def test_get_shell_per_credentials():
+    first = hammer_shell.get_shell('sat.example.com', 'admin', 'changeme')
+    assert hammer_shell.get_shell('sat.example.com', 'admin', 'changeme') is first
+    assert hammer_shell.get_shell('sat.example.com', 'viewer', 'changeme') is not first
+    hammer_shell.close_shells()
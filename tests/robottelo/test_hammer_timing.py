@@ -0,0 +1,75 @@
+"""Tests for module ``robottelo.cli.hammer_timing`` and its pytest plugin."""
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+from broker.helpers import Result
+import pytest
+
+from pytest_plugins import hammer_timing as plugin
+from robottelo.cli import hammer_timing
+from robottelo.cli.base import Base
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    collector = hammer_timing.HammerTimings()
+    monkeypatch.setattr(hammer_timing, 'collector', collector)
+    monkeypatch.setattr(plugin, 'collector', collector)
+    return collector
+
+
+def test_summary(collector):
+    for real in range(1, 101):
+        collector.record('repository synchronize', real=float(real), user=1.0, sys=0.5)
+    collector.record('organization list', real=0.5, user=0.25, sys=0.0)
+    summary = collector.summary()
+    assert list(summary) == ['repository synchronize', 'organization list']
+    assert summary['repository synchronize'] == {
+        'count': 100,
+        'total': 5050.0,
+        'p50': 50.0,
+        'p95': 95.0,
+        'max': 100.0,
+        'user': 100.0,
+        'sys': 50.0,
+    }
+    assert summary['organization list']['p95'] == 0.5
+
+
+@mock.patch('robottelo.cli.base.ssh.command')
+@mock.patch('robottelo.cli.base.settings')
+def test_execute_records_timing(settings, command, collector):
+    settings.performance.time_hammer = True
+    settings.performance.hammer_transport = 'ssh'
+    command.return_value = Result(
+        stdout='Repository synchronized\n',
+        stderr='Warning: foo\nreal 12.50\nuser 1.20\nsys 0.30\n',
+        status=0,
+    )
+    Base.execute('repository synchronize --id="1"', ignore_stderr=True)
+    assert command.return_value.stderr == 'Warning: foo\n'
+    assert collector.samples == {'repository synchronize': [[12.5, 1.2, 0.3]]}
+
+
+def test_xdist_merge(collector, tmp_path):
+    """Workers hand their samples to the controller, which writes the merged report"""
+    report = tmp_path / 'hammer_timings.json'
+    worker_config = SimpleNamespace(workeroutput={})
+    collector.record('host list', real=1.0, user=0.5, sys=0.1)
+    plugin.pytest_sessionfinish(SimpleNamespace(config=worker_config))
+    assert worker_config.workeroutput['hammer_timings'] == {'host list': [[1.0, 0.5, 0.1]]}
+
+    collector.clear()
+    collector.record('host list', real=3.0, user=0.5, sys=0.1)
+    plugin.pytest_testnodedown(SimpleNamespace(workeroutput=worker_config.workeroutput), None)
+    plugin.pytest_testnodedown(SimpleNamespace(workeroutput={}), None)
+    controller_config = mock.Mock(spec=['getoption'])
+    controller_config.getoption.return_value = str(report)
+    plugin.pytest_sessionfinish(SimpleNamespace(config=controller_config))
+    assert json.loads(report.read_text())['host list']['count'] == 2
+
+    reporter = mock.Mock()
+    plugin.pytest_terminal_summary(reporter, controller_config)
+    lines = [call.args[0] for call in reporter.line.call_args_list]
+    assert any(line.startswith('host list') for line in lines)
@@ -1,7 +1,9 @@
 """Tests for module ``robottelo.helpers``."""
+import json
+
 import pytest
 
-from robottelo.utils import slugify_component, validate_ssh_pub_key
+from robottelo.utils import slugify_component, validate_ssh_pub_key, write_json_atomic
 
 
 class FakeSSHResult:
@@ -68,3 +70,12 @@ def test_slugify_component():
     assert slugify_component('File-Management', False) == 'file_management'
     assert slugify_component('File&Management') == 'filemanagement'
     assert slugify_component('File and Management') == 'filemanagement'
+
+
+def test_write_json_atomic(tmp_path):
+    """Assert write_json_atomic replaces the file without leaving a temporary one"""
+    path = tmp_path / 'cache' / 'data.json'
+    write_json_atomic(path, {'a': 1})
+    write_json_atomic(str(path), {'b': [2]})
+    assert json.loads(path.read_text()) == {'b': [2]}
+    assert [child.name for child in path.parent.iterdir()] == ['data.json']
@@ -0,0 +1,136 @@
+"""Tests for module ``robottelo.utils.hook_profile``."""
+import json
+import time
+
+import pluggy
+import pytest
+
+from robottelo.utils import hook_profile
+from robottelo.utils.hook_profile import Profiler
+
+hookspec = pluggy.HookspecMarker('sample')
+hookimpl = pluggy.HookimplMarker('sample')
+
+
+class Spec:
+    @hookspec
+    def sample_hook(self, value):
+        pass
+
+
+class Slow:
+    @hookimpl
+    def sample_hook(self, value):
+        time.sleep(0.05)
+        return value
+
+
+class Wrapper:
+    @hookimpl(hookwrapper=True)
+    def sample_hook(self, value):
+        time.sleep(0.02)
+        outcome = yield
+        outcome.force_result([*outcome.get_result(), 'wrapped'])
+
+
+class NewWrapper:
+    @hookimpl(wrapper=True)
+    def sample_hook(self, value):
+        result = yield
+        return [*result, 'new']
+
+
+def profiled_manager(profiler, *plugins):
+    manager = pluggy.PluginManager('sample')
+    manager.add_hookspecs(Spec)
+    for plugin in plugins:
+        manager.register(plugin)
+    for hook_impl in manager.hook.sample_hook.get_hookimpls():
+        hook_impl.function = profiler.wrap_hook(
+            type(hook_impl.plugin).__name__,
+            hook_impl.function,
+            generator=hook_impl.hookwrapper or hook_impl.wrapper,
+        )
+    return manager
+
+
+def test_hook_self_time():
+    profiler = Profiler()
+    manager = profiled_manager(profiler, Slow(), Wrapper(), NewWrapper())
+    assert manager.hook.sample_hook(value=1) == [1, 'wrapped', 'new']
+    assert manager.hook.sample_hook(value=2) == [2, 'wrapped', 'new']
+    rows = {row['name']: row for row in profiler.as_list()}
+    assert {name: row['calls'] for name, row in rows.items()} == {
+        'Slow': 2,
+        'Wrapper': 2,
+        'NewWrapper': 2,
+    }
+    assert rows['Slow']['seconds'] >= 0.1
+    # the wrapper is not counted while the other implementations run
+    assert 0.04 <= rows['Wrapper']['seconds'] < 0.1
+    assert rows['NewWrapper']['seconds'] < 0.04
+    assert list(rows) == ['Slow', 'Wrapper', 'NewWrapper']
+
+
+def test_hook_errors_propagate():
+    class Failing:
+        @hookimpl
+        def sample_hook(self, value):
+            raise ValueError(value)
+
+    profiler = Profiler()
+    manager = profiled_manager(profiler, Failing(), NewWrapper())
+    # the error is thrown in the wrapper
+    with pytest.raises(ValueError, match='3'):
+        manager.hook.sample_hook(value=3)
+    assert {row['name']: row['calls'] for row in profiler.as_list()} == {
+        'Failing': 1,
+        'NewWrapper': 1,
+    }
+
+
+def test_nested_imports_self_time():
+    profiler = Profiler()
+
+    def outer():
+        time.sleep(0.02)
+        profiler.measure_import('inner', time.sleep, 0.05)
+        return 'module'
+
+    assert profiler.measure_import('outer', outer) == 'module'
+    rows = {row['name']: row for row in profiler.as_list()}
+    assert rows['inner']['seconds'] >= 0.05
+    assert 0.02 <= rows['outer']['seconds'] < 0.05
+    assert rows['outer']['sampled_calls'] == 1
+
+
+def test_allocations_sampled(monkeypatch):
+    monkeypatch.setattr(hook_profile, 'ALLOCATION_SAMPLING', 10)
+    profiler = Profiler()
+    timed = profiler.wrap_hook('allocating', lambda: [object() for _ in range(1000)])
+    kept = [timed() for _ in range(25)]
+    row = profiler.as_list()[0]
+    assert row['calls'] == 25
+    # the first, 11th and 21st calls
+    assert row['sampled_calls'] == 3
+    assert row['blocks'] >= 25 * 1000
+    assert len(kept) == 25
+
+
+def test_merge_and_report(tmp_path):
+    profiler = Profiler()
+    profiler.measure_import('pytest_plugins.sample', lambda: None)
+    worker = Profiler()
+    worker.measure_import('pytest_plugins.sample', time.sleep, 0.01)
+    worker.wrap_hook('conftest.py::pytest_configure', lambda: None)()
+    profiler.merge(worker.as_list())
+    rows = profiler.as_list()
+    assert [(row['name'], row['calls']) for row in rows] == [
+        ('pytest_plugins.sample', 2),
+        ('conftest.py::pytest_configure', 1),
+    ]
+    profiler.write_report(tmp_path / 'profile')
+    assert json.loads((tmp_path / 'profile.json').read_text()) == rows
+    lines = (tmp_path / 'profile.txt').read_text().splitlines()
+    assert lines[1].startswith('import pytest_plugins.sample')
+    assert len(lines) == 3
@@ -0,0 +1,94 @@
+"""Tests for module ``robottelo.host_helpers.host_pool``."""
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers import host_pool
+from robottelo.host_helpers.host_pool import HostPool, conf_key
+
+RHEL8 = {'workflow': 'deploy-rhel', 'deploy_rhel_version': '8'}
+RHEL9 = {'workflow': 'deploy-rhel', 'deploy_rhel_version': '9'}
+
+
+class FakeProvisioner:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.hosts = []
+        self.lock = threading.Lock()
+
+    def __call__(self, conf, host_class):
+        time.sleep(self.delay)
+        version = conf['deploy_rhel_version']
+        with self.lock:
+            host = f'{version}-{sum(host.startswith(version) for host in self.hosts)}'
+            self.hosts.append(host)
+        return host
+
+
+@pytest.fixture
+def broker():
+    with mock.patch.object(host_pool, 'Broker') as broker:
+        yield broker
+
+
+def test_hosts_are_prefetched_and_refilled(broker):
+    provisioner = FakeProvisioner(delay=0.1)
+    pool = HostPool(1, object, provision=provisioner)
+    pool.plan({conf_key(RHEL8): (RHEL8, 3), conf_key(RHEL9): (RHEL9, 1)})
+    time.sleep(0.3)
+    assert sorted(provisioner.hosts) == ['8-0', '9-0']
+    assert pool.checkout(RHEL9) == '9-0'
+    assert sorted(pool.checkout(RHEL8) for _ in range(3)) == ['8-0', '8-1', '8-2']
+    # demand is satisfied, nothing more is prefetched
+    pool.close()
+    assert len(provisioner.hosts) == 4
+    assert pool.stats.hits == 4
+    assert pool.stats.misses == 0
+    assert pool.stats.saved > 0.1
+    broker.assert_not_called()
+
+
+def test_unplanned_configuration_is_provisioned_on_demand(broker):
+    provisioner = FakeProvisioner()
+    pool = HostPool(2, object, provision=provisioner)
+    pool.plan({conf_key(RHEL8): (RHEL8, 1)})
+    assert pool.checkout(RHEL9) == '9-0'
+    assert pool.stats.misses == 1
+    pool.close()
+
+
+def test_unused_hosts_are_checked_in(broker):
+    provisioner = FakeProvisioner()
+    pool = HostPool(2, object, provision=provisioner)
+    pool.plan({conf_key(RHEL8): (RHEL8, 5)})
+    pool.close()
+    checked_in = [call.kwargs['hosts'][0] for call in broker.call_args_list]
+    assert sorted(checked_in) == sorted(provisioner.hosts)
+    assert len(checked_in) == 2
+
+
+def test_failed_prefetch_falls_back_to_on_demand(broker):
+    calls = []
+
+    def provision(conf, host_class):
+        calls.append(conf)
+        if len(calls) == 1:
+            raise RuntimeError('no capacity')
+        return 'host'
+
+    pool = HostPool(1, object, provision=provision)
+    pool.plan({conf_key(RHEL8): (RHEL8, 1)})
+    assert pool.checkout(RHEL8) == 'host'
+    assert pool.stats.misses == 1
+    pool.close()
+
+
+def test_disabled_pool_provisions_on_demand(broker):
+    provisioner = FakeProvisioner()
+    pool = HostPool(0, object, provision=provisioner)
+    pool.plan({conf_key(RHEL8): (RHEL8, 5)})
+    assert provisioner.hosts == []
+    assert pool.checkout(RHEL8) == '8-0'
+    pool.close()
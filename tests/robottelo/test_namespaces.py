@@ -0,0 +1,94 @@
+"""Tests for module ``robottelo.host_helpers.namespaces``."""
+import sys
+import types
+
+import pytest
+
+from robottelo.cli.base import Base
+from robottelo.cli.repository import Repository
+from robottelo.cli.sm_packages import Packages
+from robottelo.host_helpers import namespaces
+
+
+@pytest.fixture(autouse=True)
+def _clear_namespaces():
+    namespaces.clear_namespaces()
+    yield
+    namespaces.clear_namespaces()
+
+
+def test_cli_index():
+    index = namespaces.cli_index()
+    assert index['Repository'] == 'robottelo.cli.repository'
+    assert index['Packages'] == 'robottelo.cli.sm_packages'
+    assert index['Base'] == 'robottelo.cli.base'
+
+
+def test_cli_namespace_is_lazy():
+    cli = namespaces.cli_namespace('sat.example.com')
+    assert 'Repository' in dir(cli)
+    assert 'Repository' not in vars(cli)
+    repository = cli.Repository
+    assert issubclass(repository, Repository)
+    assert repository.hostname == 'sat.example.com'
+    assert repository.omitting_credentials is False
+    assert cli.Repository is repository
+    assert [name for name in vars(cli) if not name.startswith('_')] == ['Repository']
+    with pytest.raises(AttributeError):
+        cli.HammerBatch  # noqa: B018 - not a Base subclass
+    with pytest.raises(AttributeError):
+        cli.Nonexistent  # noqa: B018
+
+
+def test_cli_namespace_is_shared():
+    cli = namespaces.cli_namespace('sat.example.com')
+    assert namespaces.cli_namespace('sat.example.com') is cli
+    assert namespaces.cli_namespace('other.example.com') is not cli
+    omitting = namespaces.cli_namespace('sat.example.com', omitting_credentials=True)
+    assert omitting is not cli
+    assert omitting.Repository.omitting_credentials is True
+
+
+def test_maintain_only_cli_namespace():
+    cli = namespaces.cli_namespace('capsule.example.com', maintain_only=True)
+    assert issubclass(cli.Packages, Packages)
+    assert cli.Packages.hostname == 'capsule.example.com'
+    assert cli.Packages.omitting_credentials is Base.omitting_credentials
+    with pytest.raises(AttributeError):
+        cli.Repository  # noqa: B018
+    assert 'Repository' not in dir(cli)
+
+
+def test_api_namespace(monkeypatch):
+    class Entity:
+        def __init__(self, server_config=None, **kwargs):
+            self.server_config = server_config
+            self.kwargs = kwargs
+
+    class Organization(Entity):
+        pass
+
+    entity_mixins = types.ModuleType('nailgun.entity_mixins')
+    entity_mixins.Entity = Entity
+    entities = types.ModuleType('nailgun.entities')
+    entities.Organization = Organization
+    entities.helper = len
+    nailgun = types.ModuleType('nailgun')
+    nailgun.entities = entities
+    monkeypatch.setitem(sys.modules, 'nailgun', nailgun)
+    monkeypatch.setitem(sys.modules, 'nailgun.entities', entities)
+    monkeypatch.setitem(sys.modules, 'nailgun.entity_mixins', entity_mixins)
+
+    config = types.SimpleNamespace(url='https://sat', auth=('admin', 'changeme'), verify=False)
+    api = namespaces.api_namespace(config)
+    same = types.SimpleNamespace(url='https://sat', auth=('admin', 'changeme'), verify=False)
+    assert namespaces.api_namespace(same) is api
+    assert api.server_config is config
+    org = api.Organization(name='org')
+    assert isinstance(org, Organization)
+    assert org.server_config is config
+    assert org.kwargs == {'name': 'org'}
+    with pytest.raises(AttributeError):
+        api.helper  # noqa: B018
+    namespaces.clear_namespaces('api')
+    assert namespaces.api_namespace(same) is not api
@@ -0,0 +1,69 @@
+"""Tests for module ``robottelo.host_helpers.registration_cache``."""
+import base64
+import json
+import threading
+import time
+from unittest import mock
+
+from robottelo.host_helpers.registration_cache import (
+    EXPIRY_MARGIN,
+    RegistrationCommandCache,
+    token_expiry,
+)
+
+
+def command(exp=None):
+    payload = base64.urlsafe_b64encode(json.dumps({'user_id': 4, 'exp': exp}).encode())
+    token = f'eyJhbGciOiJIUzI1NiJ9.{payload.decode().rstrip("=")}.c2lnbmF0dXJl'
+    return f"curl -sS 'https://sat/register' -H 'Authorization: Bearer {token}' | bash\n"
+
+
+def test_token_expiry():
+    assert token_expiry(command(exp=1700000000)) == 1700000000
+    assert token_expiry('curl https://sat/register | bash') is None
+
+
+def test_commands_are_reused_per_options():
+    cache = RegistrationCommandCache()
+    generate = mock.Mock(side_effect=lambda: command(exp=time.time() + 3600))
+    key = cache.key('sat', 'sat', {'activation-keys': 'ak', 'organization-id': 1})
+    same_key = cache.key('sat', 'sat', {'organization-id': '1', 'activation-keys': 'ak'})
+    first = cache.get(key, generate)
+    assert cache.get(same_key, generate) == first
+    cache.get(cache.key('sat', 'capsule', {'activation-keys': 'ak'}), generate)
+    assert generate.call_count == 2
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'commands': 2}
+    cache.invalidate('sat')
+    cache.get(key, generate)
+    assert generate.call_count == 3
+
+
+def test_expiring_tokens_are_not_reused():
+    cache = RegistrationCommandCache(ttl=3600)
+    generate = mock.Mock(side_effect=lambda: command(exp=time.time() + EXPIRY_MARGIN))
+    cache.get('key', generate)
+    cache.get('key', generate)
+    assert generate.call_count == 2
+    disabled = RegistrationCommandCache(ttl=0)
+    generate = mock.Mock(return_value='register')
+    disabled.get('key', generate)
+    disabled.get('key', generate)
+    assert generate.call_count == 2
+
+
+def test_concurrent_registrations_generate_once():
+    cache = RegistrationCommandCache()
+    calls = []
+
+    def generate():
+        calls.append(1)
+        time.sleep(0.1)
+        return 'register'
+
+    threads = [threading.Thread(target=cache.get, args=('key', generate)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 3
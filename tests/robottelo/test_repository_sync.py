@@ -0,0 +1,110 @@
+"""Tests for ``CLIFactory.synchronize_repositories``."""
+import threading
+import time
+from unittest import mock
+import uuid
+
+import pytest
+
+from robottelo.exceptions import CLIFactoryError
+from robottelo.host_helpers.cli_factory import CLIFactory
+from robottelo.host_helpers.task_watcher import TaskWatcher
+
+
+class FakeSatellite:
+    """Satellite syncing repository ``N`` in ``N / 10`` seconds, ``fail`` never succeeds"""
+
+    def __init__(self):
+        self.tasks = {}
+        self.lock = threading.Lock()
+        self.cli = mock.Mock()
+        self.cli.Repository.synchronize.side_effect = self.synchronize
+        self.task_watcher = TaskWatcher(self.search, min_interval=0.01, max_interval=0.01)
+
+    def synchronize(self, options, timeout=None):
+        task_id = str(uuid.uuid4())
+        with self.lock:
+            self.tasks[task_id] = (options['id'], time.monotonic())
+        if not options.get('async'):
+            self.task_watcher.wait([task_id])
+        return f'Repository is being synchronized in task {task_id}.'
+
+    def running(self):
+        now = time.monotonic()
+        with self.lock:
+            return [
+                repo_id
+                for repo_id, start in self.tasks.values()
+                if repo_id == 'fail' or now - start < repo_id / 10
+            ]
+
+    def search(self, query):
+        now = time.monotonic()
+        tasks = []
+        for task_id in query['search'][6:-1].split(','):
+            repo_id, start = self.tasks[task_id]
+            if repo_id == 'fail':
+                tasks.append({'id': task_id, 'state': 'stopped', 'result': 'error'})
+            elif now - start >= repo_id / 10:
+                tasks.append({'id': task_id, 'state': 'stopped', 'result': 'success'})
+            else:
+                tasks.append({'id': task_id, 'state': 'running', 'result': 'pending'})
+        return tasks
+
+
+@pytest.fixture
+def settings():
+    with mock.patch('robottelo.host_helpers.cli_factory.settings') as settings:
+        settings.performance.async_repository_sync = True
+        settings.performance.repository_sync_concurrency = 2
+        yield settings
+
+
+def test_syncs_run_concurrently(settings):
+    satellite = FakeSatellite()
+    start = time.monotonic()
+    durations = CLIFactory(satellite).synchronize_repositories([3, 1, 2])
+    # repository 2 starts once 1 finished and ends with 3, one after another takes 0.6 s
+    assert time.monotonic() - start < 0.45
+    assert list(durations) == [1, 3, 2] or list(durations) == [1, 2, 3]
+    assert 0.25 <= durations[3] < 0.4
+    calls = satellite.cli.Repository.synchronize.call_args_list
+    assert [call.args[0] for call in calls] == [
+        {'id': repo_id, 'async': True} for repo_id in (3, 1, 2)
+    ]
+
+
+def test_concurrency_cap(settings):
+    satellite = FakeSatellite()
+    peak = []
+    watch = satellite.task_watcher.watch
+
+    def watch_and_count(*args, **kwargs):
+        peak.append(len(satellite.running()))
+        return watch(*args, **kwargs)
+
+    satellite.task_watcher.watch = watch_and_count
+    CLIFactory(satellite).synchronize_repositories([1, 2, 3, 4, 5], max_concurrent=3)
+    assert max(peak) == 3
+
+
+def test_first_failure_raises(settings):
+    satellite = FakeSatellite()
+    start = time.monotonic()
+    with pytest.raises(CLIFactoryError, match='Failed to synchronize repository fail'):
+        CLIFactory(satellite).synchronize_repositories([50, 'fail'])
+    assert time.monotonic() - start < 1
+    # the watcher stopped waiting for the other sync
+    assert satellite.task_watcher._watches == {}
+
+
+def test_sequential_sync(settings):
+    settings.performance.async_repository_sync = False
+    satellite = FakeSatellite()
+    durations = CLIFactory(satellite).synchronize_repositories([2, 1])
+    assert list(durations) == [2, 1]
+    assert durations[2] >= 0.15
+    assert [call.args[0] for call in satellite.cli.Repository.synchronize.call_args_list] == [
+        {'id': 2},
+        {'id': 1},
+    ]
@@ -0,0 +1,84 @@
+"""Tests for module ``robottelo.utils.satellite_versions``."""
+import threading
+import time
+from unittest import mock
+
+from robottelo.utils.satellite_versions import VersionCache
+
+VERSIONS = {'version': '6.16.0', 'rhel_version': '9.4'}
+
+
+def test_probed_once_per_hostname(tmp_path):
+    probe = mock.Mock(return_value=VERSIONS)
+    cache = VersionCache(tmp_path / 'versions.json', ttl=3600)
+    assert cache.get('sat', probe, timeout=5)['version'] == '6.16.0'
+    assert cache.get('sat', probe, timeout=5)['rhel_version'] == '9.4'
+    probe.assert_called_once_with('sat')
+    # a later session reads the persisted versions
+    other = VersionCache(tmp_path / 'versions.json', ttl=3600)
+    assert other.get('sat', probe, timeout=5)['version'] == '6.16.0'
+    assert probe.call_count == 1
+    # expired versions are probed again
+    expired = VersionCache(tmp_path / 'versions.json', ttl=0.1)
+    time.sleep(0.2)
+    expired.get('sat', probe, timeout=5)
+    assert probe.call_count == 2
+
+
+def test_not_persisted_by_default(tmp_path):
+    probe = mock.Mock(return_value=VERSIONS)
+    VersionCache(tmp_path / 'versions.json').get('sat', probe, timeout=5)
+    assert not (tmp_path / 'versions.json').exists()
+    # an upgraded satellite is probed again by the next session
+    VersionCache(tmp_path / 'versions.json').get('sat', probe, timeout=5)
+    assert probe.call_count == 2
+
+
+def test_slow_probe_does_not_block():
+    release = threading.Event()
+
+    def probe(hostname):
+        release.wait(5)
+        return VERSIONS
+
+    cache = VersionCache()
+    start = time.monotonic()
+    assert cache.get('sat', probe, timeout=0.1) is None
+    assert cache.get('sat', probe, timeout=0.1) is None
+    assert time.monotonic() - start < 0.5
+    release.set()
+    for _ in range(50):
+        if cache.get('sat', probe, timeout=0.1):
+            break
+        time.sleep(0.05)
+    assert cache.get('sat', probe, timeout=0.1)['version'] == '6.16.0'
+
+
+def test_failed_probe_is_not_retried(tmp_path):
+    probe = mock.Mock(side_effect=ConnectionError('no route to host'))
+    cache = VersionCache(tmp_path / 'versions.json', ttl=3600)
+    assert cache.get('sat', probe, timeout=5) is None
+    assert cache.get('sat', probe, timeout=5) is None
+    assert probe.call_count == 1
+    assert not (tmp_path / 'versions.json').exists()
+
+
+def test_versions_passed_to_workers():
+    controller = VersionCache()
+    controller.get('sat', lambda hostname: VERSIONS, timeout=5)
+    worker = VersionCache()
+    worker.update(controller.snapshot())
+    probe = mock.Mock()
+    assert worker.get('sat', probe, timeout=5)['version'] == '6.16.0'
+    probe.assert_not_called()
+
+
+def test_failed_probe_passed_to_workers():
+    controller = VersionCache()
+    controller.get('sat', mock.Mock(side_effect=ConnectionError), timeout=5)
+    assert controller.snapshot() == {'sat': None}
+    worker = VersionCache()
+    worker.update(controller.snapshot())
+    probe = mock.Mock()
+    assert worker.get('sat', probe, timeout=5) is None
+    probe.assert_not_called()
@@ -1,6 +1,8 @@
 """Tests for module ``robottelo.utils.ssh``."""
 from unittest import mock
 
+import pytest
+
 from robottelo import ssh
 
 
@@ -46,6 +48,8 @@ class MockSSHClient:
         self.pkey = None
         self.password = None
         self.ret_code = 0
+        self.session = mock.Mock()
+        self.session.run.return_value.status = 0
 
     def set_missing_host_key_policy(self, policy):
         """A no-op stub method."""
@@ -99,5 +103,67 @@ class TestSSH:
         settings.server.ssh_client.command_timeout = 300000
         settings.server.ssh_client.connection_timeout = 10000
 
+        ssh._pool = ssh.SSHConnectionPool()
         ret = ssh.command('ls -la')
         assert ret[1].cmd == 'ls -la'
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """A fresh connection pool handing out ``MockSSHClient`` objects"""
+    monkeypatch.setattr(ssh, 'get_client', MockSSHClient)
+    settings = mock.Mock()
+    settings.server.ssh_client.port = 22
+    monkeypatch.setattr('robottelo.config.settings', settings)
+    return ssh.SSHConnectionPool(max_per_host=2, health_check_interval=60, checkout_timeout=0.1)
+
+
+class TestSSHConnectionPool:
+    """Tests for ``robottelo.ssh.SSHConnectionPool``."""
+
+    def test_reuse_connection(self, pool):
+        with pool.connection('example.com', 'root', 'pass') as first:
+            pass
+        with pool.connection('example.com', 'root', 'pass') as second:
+            pass
+        assert first is second
+        assert pool.stats() == {'hits': 1, 'misses': 1, 'reconnects': 0, 'discarded': 0, 'open': 1}
+
+    def test_connections_keyed_by_credentials(self, pool):
+        with pool.connection('example.com', 'root', 'pass') as first:
+            pass
+        with pool.connection('example.com', 'admin', 'pass') as second:
+            pass
+        assert first is not second
+        assert pool.stats()['misses'] == 2
+
+    def test_discard_on_error(self, pool):
+        with pytest.raises(RuntimeError), pool.connection('example.com', 'root', 'pass') as first:
+            raise RuntimeError
+        with pool.connection('example.com', 'root', 'pass') as second:
+            pass
+        assert first is not second
+        assert first.close_ == 1
+        assert pool.stats()['discarded'] == 1
+        assert pool.stats()['open'] == 1
+
+    def test_max_per_host(self, pool):
+        with (
+            pool.connection('example.com', 'root', 'pass'),
+            pool.connection('example.com', 'root', 'pass'),
+        ):
+            with pytest.raises(TimeoutError):
+                with pool.connection('example.com', 'root', 'pass'):
+                    pass
+        assert pool.stats()['open'] == 2
+
+    def test_reconnect_stale_connection(self, pool):
+        pool.health_check_interval = -1
+        with pool.connection('example.com', 'root', 'pass') as client:
+            client.session.run.return_value.status = 1
+            client.connect = mock.Mock()
+        with pool.connection('example.com', 'root', 'pass') as same_client:
+            pass
+        assert same_client is client
+        client.connect.assert_called_once_with()
+        assert pool.stats()['reconnects'] == 1
@@ -0,0 +1,104 @@
+"""Tests for module ``robottelo.utils.step_graph``."""
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers.cli_factory import CLIFactory
+from robottelo.utils.step_graph import StepGraph
+
+
+def test_independent_steps_run_concurrently():
+    # both steps block until the other one started
+    barrier = threading.Barrier(2, timeout=5)
+
+    def add(value):
+        def step(org_id):
+            barrier.wait()
+            return org_id + value
+
+        return step
+
+    graph = StepGraph('flow')
+    graph.value('org_id', 1)
+    graph.add('env_id', add(10))
+    graph.add('cv_id', add(20))
+    graph.add('publish', lambda cv_id, env_id: (cv_id, env_id))
+    order = []
+    graph.add('promote', lambda: order.append('promote'), requires=['publish'])
+    results = graph.run()
+    assert results['publish'] == (21, 11)
+    assert order == ['promote']
+    assert [timing.name for timing in graph.trace][:1] == ['org_id']
+    assert [timing.name for timing in graph.trace][-2:] == ['publish', 'promote']
+    assert 'promote' in graph.format_trace()
+
+
+def test_failed_step_stops_the_flow():
+    started = []
+    graph = StepGraph('flow')
+    graph.add('slow', lambda: time.sleep(0.1) or started.append('slow'))
+    graph.add('fails', lambda: 1 / 0)
+    graph.add('after', lambda fails: started.append('after'))
+    graph.add('after_slow', lambda slow: started.append('after_slow'))
+    with pytest.raises(ZeroDivisionError):
+        graph.run()
+    # the running step finishes, nothing else starts
+    assert started == ['slow']
+
+
+def test_invalid_graphs():
+    graph = StepGraph('flow')
+    graph.add('a', lambda b: b)
+    with pytest.raises(ValueError, match='already in flow'):
+        graph.add('a', lambda: 1)
+    with pytest.raises(ValueError, match='requires unknown'):
+        graph.run()
+    graph.add('b', lambda: 1, requires=['a'])
+    with pytest.raises(ValueError, match='form a cycle'):
+        graph.run()
+
+
+def test_setup_org_for_a_custom_repo():
+    sync_done = threading.Event()
+    satellite = mock.Mock()
+    satellite.subscription_index.sca_enabled.return_value = False
+    satellite.cli.Repository.synchronize.side_effect = lambda options: (
+        time.sleep(0.1) or sync_done.set()
+    )
+    satellite.cli.Repository.info.return_value = {'id': 5, 'content-label': 'label'}
+    satellite.cli.ContentView.info.return_value = {
+        'versions': [{'id': '10'}, {'id': '9'}],
+        'lifecycle-environments': [{'id': '1'}],
+    }
+    factory = CLIFactory(satellite)
+    factory.make_org = lambda: {'id': 1}
+    factory.make_lifecycle_environment = lambda options: {'id': 2}
+    factory.make_product = lambda options: {'id': 3, 'name': 'product'}
+    factory.make_repository = lambda options: {'id': 5}
+    cv_created_during_sync = []
+    factory.make_content_view = lambda options: (
+        cv_created_during_sync.append(not sync_done.is_set()) or {'id': 4}
+    )
+    factory.make_activation_key = lambda options: {'id': 6}
+    factory.activationkey_add_subscription_to_repo = mock.Mock()
+
+    assert factory.setup_org_for_a_custom_repo({'url': 'http://repo'}) == {
+        'activationkey-id': 6,
+        'content-view-id': 4,
+        'lifecycle-environment-id': 2,
+        'organization-id': 1,
+        'product-id': 3,
+        'repository-id': 5,
+    }
+    assert cv_created_during_sync == [True]
+    satellite.cli.ContentView.version_promote.assert_called_once_with(
+        {'id': '10', 'organization-id': 1, 'to-lifecycle-environment-id': 2}
+    )
+    factory.activationkey_add_subscription_to_repo.assert_called_once_with(
+        {'activationkey-id': 6, 'organization-id': 1, 'subscription': 'product'}
+    )
+    satellite.cli.ActivationKey.content_override.assert_called_once_with(
+        {'id': 6, 'content-label': 'label', 'value': 'true'}
+    )
@@ -0,0 +1,78 @@
+"""Tests for module ``robottelo.utils.subscription_index``."""
+from unittest import mock
+
+import pytest
+
+from robottelo.cli.subscription import Subscription
+from robottelo.utils import subscription_index
+
+
+def subscription(name, id, account=None):
+    return {'name': name, 'id': id, 'quantity': 'Unlimited', 'account': account}
+
+
+@pytest.fixture
+def index():
+    listed = {1: [subscription('product', '10'), subscription('RHEL', '11', account='123')]}
+    list_subscriptions = mock.Mock(side_effect=lambda org_id: list(listed[org_id]))
+    read_sca_mode = mock.Mock(return_value=False)
+    index = subscription_index.SubscriptionIndex(list_subscriptions, read_sca_mode)
+    index.listed = listed
+    return index
+
+
+def test_subscriptions_are_listed_once(index):
+    assert index.find(1, 'product')['id'] == '10'
+    assert index.find('1', 'RHEL')['id'] == '11'
+    assert len(index.subscriptions(1)) == 2
+    index._list_subscriptions.assert_called_once_with(1)
+
+
+def test_manifest_and_quantities_are_read_again(index):
+    assert index.has_manifest(1)
+    # the manifest deleted with nailgun
+    index.listed[1][1] = subscription('RHEL', '11')
+    assert not index.has_manifest(1)
+    index.listed[1][0] = {**subscription('product', '10'), 'quantity': '0'}
+    # consumed by a host, the cached quantity is stale
+    assert index.find(1, 'product')['quantity'] == 'Unlimited'
+    assert index.find(1, 'product', reload=True)['quantity'] == '0'
+    assert index._list_subscriptions.call_count == 3
+
+
+def test_missing_name_reloads_once(index):
+    index.subscriptions(1)
+    index.listed[1].append(subscription('new product', '12'))
+    assert index.find(1, 'new product')['id'] == '12'
+    assert index.find(1, 'unknown') is None
+    assert index._list_subscriptions.call_count == 3
+
+
+def test_invalidate(index):
+    index.subscriptions(1)
+    index.invalidate(1)
+    index.subscriptions(1)
+    assert index._list_subscriptions.call_count == 2
+    index.invalidate()
+    index.subscriptions(1)
+    assert index._list_subscriptions.call_count == 3
+
+
+def test_sca_mode_is_not_cached(index):
+    assert index.sca_enabled(1) is False
+    # toggled outside of robottelo's hammer wrappers, e.g. with nailgun
+    index._read_sca_mode.return_value = True
+    assert index.sca_enabled(1) is True
+    assert index._read_sca_mode.call_count == 2
+
+
+@mock.patch('robottelo.cli.subscription.settings')
+@mock.patch.object(Subscription, 'execute')
+def test_manifest_upload_invalidates_the_index(execute, settings, index):
+    settings.server.hostname = 'sat.example.com'
+    index.subscriptions(1)
+    with mock.patch.dict(subscription_index._indexes, {'sat.example.com': index}):
+        Subscription.upload({'organization-id': 1, 'file': 'manifest.zip'})
+        index.subscriptions(1)
+    assert execute.call_count == 1
+    assert index._list_subscriptions.call_count == 2
@@ -0,0 +1,138 @@
+"""Tests for module ``robottelo.host_helpers.task_watcher``."""
+from concurrent.futures import Future
+import re
+import threading
+
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+import pytest
+
+from robottelo.host_helpers import task_watcher
+from robottelo.host_helpers.task_watcher import TaskWatcher
+
+
+class FakeTasks:
+    """Foreman task search finishing every task after a number of searches"""
+
+    def __init__(self, **finish_after):
+        self.finish_after = finish_after
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def search(self, query):
+        with self.lock:
+            self.queries.append(query)
+            ids = re.fullmatch(r'id \^ \((.*)\)', query['search']).group(1).split(',')
+            tasks = []
+            for task_id in ids:
+                searches = sum(task_id in q['search'].split('(')[1] for q in self.queries)
+                finished = searches >= abs(self.finish_after[task_id])
+                result = 'success' if self.finish_after[task_id] > 0 else 'error'
+                tasks.append(
+                    {
+                        'id': task_id,
+                        'state': 'stopped' if finished else 'running',
+                        'result': result if finished else 'pending',
+                        'progress': searches / abs(self.finish_after[task_id]),
+                    }
+                )
+            return tasks
+
+
+def test_tasks_are_refreshed_in_bulk():
+    tasks = FakeTasks(a=1, b=3, c=2)
+    watcher = TaskWatcher(tasks.search, min_interval=0.01, max_interval=0.01, jitter=0)
+    infos = watcher.wait(['a', 'b', 'c'])
+    assert [info['id'] for info in infos] == ['a', 'b', 'c']
+    assert all(info['result'] == 'success' for info in infos)
+    assert [query['search'] for query in tasks.queries] == [
+        'id ^ (a,b,c)',
+        'id ^ (b,c)',
+        'id ^ (b)',
+    ]
+
+
+def test_batches():
+    tasks = FakeTasks(a=1, b=1, c=1)
+    watcher = TaskWatcher(tasks.search, min_interval=0.01, batch_size=2)
+    watcher.wait(['a', 'b', 'c'])
+    assert tasks.queries == [
+        {'search': 'id ^ (a,b)', 'per_page': 2},
+        {'search': 'id ^ (c)', 'per_page': 1},
+    ]
+
+
+def test_failed_and_timed_out_tasks():
+    tasks = FakeTasks(failed=-1, slow=1000)
+    watcher = TaskWatcher(tasks.search, min_interval=0.01, max_interval=0.01)
+    failed = watcher.watch('failed')
+    with pytest.raises(TaskFailedError, match='Task failed did not succeed'):
+        failed.result(timeout=5)
+    assert watcher.watch('failed', must_succeed=False).result(timeout=5)['result'] == 'error'
+    with pytest.raises(TaskTimedOutError, match='Timed out polling task slow'):
+        watcher.wait(['slow'], timeout=0.05)
+
+
+def test_adaptive_backoff():
+    watcher = TaskWatcher(len, min_interval=1, max_interval=4, backoff=2, jitter=0)
+    assert [watcher._next_interval() for _ in range(4)] == [1, 2, 4, 4]
+    watcher._watches['a'] = [type('Watch', (), {'poll_rate': 3})]
+    assert watcher._next_interval() == 3
+    watcher = TaskWatcher(len, min_interval=1, max_interval=4, jitter=0.5)
+    assert 0.5 <= watcher._next_interval() <= 1.5
+
+
+def test_watcher_thread_stops_when_idle():
+    watcher = TaskWatcher(FakeTasks(a=1, b=1).search, min_interval=0.01)
+    watcher.wait(['a'])
+    thread = watcher._thread
+    if thread is not None:
+        thread.join(timeout=5)
+    assert watcher._thread is None
+    assert watcher.wait(['b'])[0]['id'] == 'b'
+
+
+def test_future_cancelled_while_resolved(monkeypatch):
+    class RacyFuture(Future):
+        """Cancelled by another thread right before the watcher resolves it"""
+
+        def set_result(self, result):
+            self.cancel()
+            super().set_result(result)
+
+    watcher = TaskWatcher(FakeTasks(a=1, b=1).search, min_interval=0.01)
+    monkeypatch.setattr(task_watcher, 'Future', RacyFuture)
+    racy = watcher.watch('a')
+    monkeypatch.setattr(task_watcher, 'Future', Future)
+    assert watcher.wait(['b'], timeout=5)[0]['id'] == 'b'
+    assert racy.cancelled()
+
+
+def test_failed_watcher_thread_fails_the_waiters():
+    def broken_tick(task_ids):
+        raise SystemError('watcher bug')
+
+    watcher = TaskWatcher(FakeTasks(b=1).search, min_interval=0.01)
+    # a failed search is only logged, a bug of the watcher itself stops the thread
+    watcher._tick = broken_tick
+    with pytest.raises(SystemError, match='watcher bug'):
+        watcher.watch('a').result(timeout=5)
+    thread = watcher._thread
+    if thread is not None:
+        thread.join(timeout=5)
+    assert watcher._thread is None
+    del watcher._tick
+    assert watcher.wait(['b'], timeout=5)[0]['id'] == 'b'
+
+
+def test_unwatch():
+    tasks = FakeTasks(a=1000, b=1)
+    watcher = TaskWatcher(tasks.search, min_interval=0.01)
+    future = watcher.watch('a')
+    other = watcher.watch('a')
+    assert watcher.unwatch(future)
+    assert future.cancelled()
+    assert not watcher.unwatch(future)
+    assert [watch.future for watch in watcher._watches['a']] == [other]
+    assert watcher.unwatch(other)
+    assert 'a' not in watcher._watches
+    assert watcher.wait(['b'], timeout=5)[0]['id'] == 'b'